@@ -0,0 +1,483 @@
+import struct
+from dataclasses import dataclass, is_dataclass
+from functools import partial
+from hashlib import blake2b
+from threading import RLock
+from typing import Union
+
+from typing_inspect import get_args, get_origin
+
+from dataclasses_serialization.serializer_base import Serializer, SerializationError, DeserializationError
+from dataclasses_serialization.serializer_base.cache import shared_cache
+from dataclasses_serialization.serializer_base.typing import dataclass_field_types
+
+__all__ = [
+    "BinarySerializer",
+    "BinarySerializerMixin",
+    "schema_fingerprint"
+]
+
+get_args = partial(get_args, evaluate=True)
+
+fingerprint_size = 8
+
+float_struct = struct.Struct('<d')
+
+binary_codec_cache = shared_cache()
+schema_fingerprint_cache = shared_cache()
+
+binary_codec_lock = RLock()
+
+# Codecs compiled under binary_codec_lock, published to binary_codec_cache once all are complete
+building_codecs = {}
+
+
+def write_varint(n, out):
+    while n >= 0x80:
+        out.append(n & 0x7f | 0x80)
+        n >>= 7
+
+    out.append(n)
+
+
+def read_varint(buffer, offset):
+    n = shift = 0
+
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        n |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            return n, offset
+
+        shift += 7
+
+
+def read_length_prefixed(buffer, offset):
+    size, offset = read_varint(buffer, offset)
+    end = offset + size
+
+    if end > len(buffer):
+        raise IndexError("Length prefix past end of buffer")
+
+    return buffer[offset:end], end
+
+
+def serialization_error(obj, cls):
+    return SerializationError("Cannot serialize {} {!r} as {}".format(type(obj), obj, cls))
+
+
+def encode_none(obj, out):
+    if obj is not None:
+        raise serialization_error(obj, None)
+
+
+def decode_none(buffer, offset):
+    return None, offset
+
+
+def encode_bool(obj, out):
+    if type(obj) is not bool:
+        raise serialization_error(obj, bool)
+
+    out.append(obj)
+
+
+def decode_bool(buffer, offset):
+    return bool(buffer[offset]), offset + 1
+
+
+def encode_int(obj, out):
+    if not isinstance(obj, int):
+        raise serialization_error(obj, int)
+
+    # Zigzag encoded, so small negative ints are short too
+    write_varint(obj << 1 if obj >= 0 else (-obj << 1) - 1, out)
+
+
+def decode_int(buffer, offset):
+    n, offset = read_varint(buffer, offset)
+
+    return (-((n + 1) >> 1) if n & 1 else n >> 1), offset
+
+
+def encode_float(obj, out):
+    try:
+        out += float_struct.pack(obj)
+    except struct.error:
+        raise serialization_error(obj, float)
+
+
+def decode_float(buffer, offset):
+    return float_struct.unpack_from(buffer, offset)[0], offset + float_struct.size
+
+
+def encode_str(obj, out):
+    if not isinstance(obj, str):
+        raise serialization_error(obj, str)
+
+    data = obj.encode('utf-8')
+    write_varint(len(data), out)
+    out += data
+
+
+def decode_str(buffer, offset):
+    data, offset = read_length_prefixed(buffer, offset)
+
+    return str(data, 'utf-8'), offset
+
+
+def bytes_codec(cls):
+    def encode(obj, out):
+        if not isinstance(obj, (bytes, bytearray, memoryview)):
+            raise serialization_error(obj, cls)
+
+        data = memoryview(obj).cast('B')
+        write_varint(len(data), out)
+        out += data
+
+    def decode(buffer, offset):
+        data, offset = read_length_prefixed(buffer, offset)
+
+        # Memoryviews are views over the payload, without copying
+        return cls(data), offset
+
+    return encode, decode
+
+
+primitive_codecs = {
+    type(None): (encode_none, decode_none),
+    bool: (encode_bool, decode_bool),
+    int: (encode_int, decode_int),
+    float: (encode_float, decode_float),
+    str: (encode_str, decode_str),
+    bytes: bytes_codec(bytes),
+    bytearray: bytes_codec(bytearray),
+    memoryview: bytes_codec(memoryview)
+}
+
+
+def sequence_codec(container, item_type):
+    encode_item, decode_item = binary_codec(item_type)
+
+    def encode(obj, out):
+        if not isinstance(obj, (list, tuple, set, frozenset)):
+            raise serialization_error(obj, container)
+
+        write_varint(len(obj), out)
+
+        for item in obj:
+            encode_item(item, out)
+
+    def decode(buffer, offset):
+        size, offset = read_varint(buffer, offset)
+        items = []
+
+        for _ in range(size):
+            item, offset = decode_item(buffer, offset)
+            items.append(item)
+
+        return (items if container is list else container(items)), offset
+
+    return encode, decode
+
+
+def fixed_tuple_codec(item_types):
+    codecs = [binary_codec(item_type) for item_type in item_types]
+
+    def encode(obj, out):
+        if not isinstance(obj, (list, tuple)) or len(obj) != len(codecs):
+            raise serialization_error(obj, tuple)
+
+        for item, (encode_item, _) in zip(obj, codecs):
+            encode_item(item, out)
+
+    def decode(buffer, offset):
+        items = []
+
+        for _, decode_item in codecs:
+            item, offset = decode_item(buffer, offset)
+            items.append(item)
+
+        return tuple(items), offset
+
+    return encode, decode
+
+
+def dict_codec(key_type, value_type):
+    encode_key, decode_key = binary_codec(key_type)
+    encode_value, decode_value = binary_codec(value_type)
+
+    def encode(obj, out):
+        if not isinstance(obj, dict):
+            raise serialization_error(obj, dict)
+
+        write_varint(len(obj), out)
+
+        for key, value in obj.items():
+            encode_key(key, out)
+            encode_value(value, out)
+
+    def decode(buffer, offset):
+        size, offset = read_varint(buffer, offset)
+        dct = {}
+
+        for _ in range(size):
+            key, offset = decode_key(buffer, offset)
+            dct[key], offset = decode_value(buffer, offset)
+
+        return dct, offset
+
+    return encode, decode
+
+
+def union_codec(cls, arg_types):
+    codecs = [binary_codec(arg_type) for arg_type in arg_types]
+
+    # Values are matched to the first argument of their class
+    # as isinstance does not support subscripted generics
+    arg_classes = [get_origin(arg_type) or arg_type for arg_type in arg_types]
+
+    # Exact classes are matched first, so True is not matched to int in Union[int, bool]
+    exact_indices = {}
+
+    for i, arg_class in enumerate(arg_classes):
+        exact_indices.setdefault(arg_class, i)
+
+    def encode(obj, out):
+        i = exact_indices.get(type(obj))
+
+        if i is None:
+            i = next((i for i, arg_class in enumerate(arg_classes) if isinstance(obj, arg_class)), None)
+
+        if i is None:
+            raise serialization_error(obj, cls)
+
+        write_varint(i, out)
+        codecs[i][0](obj, out)
+
+    def decode(buffer, offset):
+        i, offset = read_varint(buffer, offset)
+
+        if i >= len(codecs):
+            raise DeserializationError("Invalid Union argument {} of {}".format(i, cls))
+
+        return codecs[i][1](buffer, offset)
+
+    return encode, decode
+
+
+def dataclass_codec(cls):
+    origin = get_origin(cls) or cls
+    names = []
+    codecs = []
+
+    def encode(obj, out):
+        if not isinstance(obj, origin):
+            raise serialization_error(obj, cls)
+
+        for name, (encode_field, _) in zip(names, codecs):
+            encode_field(getattr(obj, name), out)
+
+    def decode(buffer, offset):
+        kwargs = {}
+
+        for name, (_, decode_field) in zip(names, codecs):
+            kwargs[name], offset = decode_field(buffer, offset)
+
+        try:
+            return cls(**kwargs), offset
+        except TypeError as e:
+            raise DeserializationError("Cannot deserialize {!r} as {}: {}".format(kwargs, cls, e))
+
+    # Found before finding the codecs of the fields, so recursive dataclasses find their own codec
+    building_codecs[cls] = encode, decode
+
+    for fld, fld_type in dataclass_field_types(cls, require_bound=True):
+        if fld.init:
+            names.append(fld.name)
+            codecs.append(binary_codec(fld_type))
+
+    return encode, decode
+
+
+def find_binary_codec(cls):
+    if cls in primitive_codecs:
+        return primitive_codecs[cls]
+
+    origin = get_origin(cls)
+
+    if is_dataclass(origin or cls):
+        return dataclass_codec(cls)
+
+    args = get_args(cls)
+
+    if origin is Union:
+        return union_codec(cls, args)
+
+    if origin in (list, set, frozenset) and len(args) == 1:
+        return sequence_codec(origin, args[0])
+
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return sequence_codec(tuple, args[0])
+
+    if origin is tuple and Ellipsis not in args:
+        return fixed_tuple_codec(args)
+
+    if origin is dict and len(args) == 2:
+        return dict_codec(*args)
+
+    raise TypeError("Cannot encode type {} positionally".format(cls))
+
+
+def binary_codec(cls):
+    """
+    Pair of functions encoding and decoding values of type cls positionally
+
+    Encoders append to a bytearray, and decoders return the value decoded from
+    a buffer at an offset, with the offset after it.
+    Compiled once per type from the types of the fields of dataclasses, as
+    given by dataclass_field_types, so field names are not encoded.
+    Raises TypeError for types which cannot be encoded positionally, such as
+    unbound generics, Any, or unparametrized containers.
+    Thread safe, as codecs are only cached once the codecs they use are complete.
+    """
+
+    try:
+        return binary_codec_cache[cls]
+    except KeyError:
+        pass
+
+    with binary_codec_lock:
+        try:
+            return binary_codec_cache[cls]
+        except KeyError:
+            pass
+
+        if cls in building_codecs:
+            return building_codecs[cls]
+
+        outermost = not building_codecs
+
+        try:
+            codec = building_codecs[cls] = find_binary_codec(cls)
+
+            if outermost:
+                for codec_cls, built_codec in building_codecs.items():
+                    binary_codec_cache[codec_cls] = built_codec
+        finally:
+            if outermost:
+                building_codecs.clear()
+
+    return codec
+
+
+def schema_description(cls, seen):
+    if cls in primitive_codecs:
+        return cls.__name__
+
+    origin = get_origin(cls)
+
+    if is_dataclass(origin or cls):
+        name = (origin or cls).__qualname__
+
+        if cls in seen:
+            return name
+
+        return "{}({})".format(name, ",".join(
+            "{}:{}".format(fld.name, schema_description(fld_type, seen | {cls}))
+            for fld, fld_type in dataclass_field_types(cls, require_bound=True)
+            if fld.init
+        ))
+
+    return "{}[{}]".format(
+        "Union" if origin is Union else origin.__name__,
+        ",".join("..." if arg is Ellipsis else schema_description(arg, seen) for arg in get_args(cls))
+    )
+
+
+def schema_fingerprint(cls):
+    """
+    Fingerprint of the positional encoding of cls
+
+    A hash of the names and types of the fields of dataclasses, recursively,
+    so changes to the schema are detected on deserialization.
+    Stable between processes and Python versions.
+    """
+
+    try:
+        return schema_fingerprint_cache[cls]
+    except KeyError:
+        pass
+
+    binary_codec(cls)
+
+    fingerprint = schema_fingerprint_cache[cls] = blake2b(
+        schema_description(cls, frozenset()).encode('utf-8'),
+        digest_size=fingerprint_size
+    ).digest()
+
+    return fingerprint
+
+
+def binary_dumps(obj):
+    cls = type(obj)
+
+    try:
+        encode, _ = binary_codec(cls)
+        fingerprint = schema_fingerprint(cls)
+    except TypeError as e:
+        raise SerializationError("Cannot serialize {!r}: {}".format(obj, e))
+
+    out = bytearray(fingerprint)
+    encode(obj, out)
+
+    return bytes(out)
+
+
+def binary_loads(cls, serialized_obj):
+    try:
+        _, decode = binary_codec(cls)
+        fingerprint = schema_fingerprint(cls)
+    except TypeError as e:
+        raise DeserializationError("Cannot deserialize as {}: {}".format(cls, e))
+
+    try:
+        buffer = memoryview(serialized_obj).cast('B')
+    except TypeError:
+        raise DeserializationError("Cannot deserialize {} {!r} as binary".format(type(serialized_obj), serialized_obj))
+
+    if buffer[:fingerprint_size] != fingerprint:
+        raise DeserializationError("Schema fingerprint of payload does not match {}".format(cls))
+
+    try:
+        obj, offset = decode(buffer, fingerprint_size)
+    except (IndexError, struct.error):
+        raise DeserializationError("Truncated binary payload for {}".format(cls))
+    except UnicodeDecodeError as e:
+        raise DeserializationError("Invalid string in binary payload for {}: {}".format(cls, e))
+
+    if offset != len(buffer):
+        raise DeserializationError("Trailing data after binary payload for {}".format(cls))
+
+    return obj
+
+
+BinarySerializer = Serializer(
+    serialization_functions={
+        dataclass: binary_dumps
+    },
+    deserialization_functions={
+        dataclass: binary_loads
+    }
+)
+
+
+class BinarySerializerMixin:
+    def as_binary(self):
+        return BinarySerializer.serialize(self)
+
+    @classmethod
+    def from_binary(cls, serialized_obj):
+        return BinarySerializer.deserialize(cls, serialized_obj)
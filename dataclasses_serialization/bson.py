@@ -1,28 +1,66 @@
+import sys
+from collections import deque
 from datetime import datetime
+from importlib.util import find_spec
 
-from dataclasses_serialization.serializer_base import isinstance, noop_serialization, noop_deserialization, dict_serialization, dict_deserialization, list_deserialization, Serializer, DeserializationError
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base import isinstance, noop_serialization, noop_deserialization, is_noop_serializable_collection, dict_serialization, dict_deserialization, list_deserialization, tuple_deserialization, set_deserialization, buffer_deserialization, list_serialization_traversal, list_deserialization_traversal, dict_serialization_traversal, dict_deserialization_traversal, noop_serializable_traversal, DirtyTrackingMixin, Serializer, DeserializationError
+
+if find_spec("bson") is None:
+    raise ImportError("bson module required for BSON serialization")
+
+
+def import_bson():
+    """
+    Import bson, and replace bson_loads and bson_dumps with its codec
+
+    Deferred until first needed, as bson is slow to import
+    """
+
+    global bson_loads, bson_dumps
 
-try:
     import bson
 
     try:
         # Assume py-bson version of bson installed
-        bson_loads = bson.loads
+        # It only decodes bytes, so other buffers must be copied
+        py_bson_loads = bson.loads
+        bson_loads = lambda bson_str: py_bson_loads(bytes(bson_str))
         bson_dumps = bson.dumps
 
     except AttributeError:
-        # Fallback to pymongo version of bson
-        bson_loads = lambda bson_str: bson.BSON(bson_str).decode()
-        bson_dumps = bson.BSON.encode
+        try:
+            # Fallback to pymongo version of bson
+            # Decodes directly from any buffer, such as a memoryview or mmap
+            bson_loads = bson.decode
+            bson_dumps = bson.encode
+
+        except AttributeError:
+            # Older pymongo versions must copy into a BSON object to decode
+            bson_loads = lambda bson_str: bson.BSON(bson_str).decode()
+            bson_dumps = bson.BSON.encode
+
+
+def bson_loads(bson_str):
+    import_bson()
+
+    return bson_loads(bson_str)
+
+
+def bson_dumps(obj):
+    import_bson()
+
+    return bson_dumps(obj)
 
-except ImportError:
-    raise ImportError("bson module required for BSON serialization")
 
 __all__ = [
     "BSONSerializer",
     "BSONSerializerMixin",
+    "BSONDirtyTrackingMixin",
     "BSONStrSerializer",
-    "BSONStrSerializerMixin"
+    "BSONStrSerializerMixin",
+    "iter_deserialize"
 ]
 
 
@@ -52,22 +90,184 @@ def bson_int_deserializer(cls, obj):
     ))
 
 
+def bson_number_list_coercion(cls, lst):
+    """
+    Mongo implicitly converts ints to floats
+
+    Attempt to coerce back whole lists of numbers at once
+    Return None if any element needs to be deserialized individually
+    """
+
+    element_types = set(map(type, lst))
+
+    if element_types <= {cls}:
+        return list(lst)
+
+    if cls is not int or not element_types <= {int, float}:
+        return None
+
+    # Only use NumPy if already imported, as it is slow to import
+    numpy = sys.modules.get("numpy")
+
+    if numpy is not None and element_types == {float}:
+        array = numpy.array(lst, dtype=numpy.float64)
+
+        if numpy.isfinite(array).all() and (array == numpy.trunc(array)).all() and (abs(array) < 2 ** 63).all():
+            return array.astype(numpy.int64).tolist()
+
+        return None
+
+    try:
+        coerced_lst = list(map(int, lst))
+    except (ValueError, OverflowError):
+        return None
+
+    if coerced_lst == lst:
+        return coerced_lst
+
+    return None
+
+
+def bson_list_deserializer(cls, lst):
+    """
+    Deserialize List[int] and List[float] in bulk where possible
+    """
+
+    value_types = get_args(cls, evaluate=True)
+
+    if isinstance(lst, list) and value_types in ((int,), (float,)):
+        coerced_lst = bson_number_list_coercion(value_types[0], lst)
+
+        if coerced_lst is not None:
+            return coerced_lst
+
+    return list_deserialization(cls, lst, deserialization_func=BSONSerializer.deserialize, is_noop_deserialization=BSONSerializer.is_noop_deserialization)
+
+
+bson_primitive_types = frozenset({str, int, float, bytes, bool, type(None)})
+
+
+def bson_dict_serializer(dct):
+    if is_noop_serializable_collection(BSONSerializer, dct, bson_primitive_types):
+        return dict(dct)
+
+    return dict_serialization(dct, key_serialization_func=BSONSerializer.serialize, value_serialization_func=BSONSerializer.serialize)
+
+
+def bson_list_serializer(lst):
+    if is_noop_serializable_collection(BSONSerializer, lst, bson_primitive_types):
+        return list(lst)
+
+    return list(map(BSONSerializer.serialize, lst))
+
+
+def bson_dict_deserializer(cls, dct):
+    return dict_deserialization(cls, dct, key_deserialization_func=BSONSerializer.deserialize, value_deserialization_func=BSONSerializer.deserialize, is_noop_deserialization=BSONSerializer.is_noop_deserialization, intern_keys=BSONSerializer.intern_keys)
+
+
+def bson_tuple_deserializer(cls, lst):
+    """
+    Deserialize Tuple[int, ...] and Tuple[float, ...] in bulk where possible
+    """
+
+    value_types = get_args(cls, evaluate=True)
+
+    if isinstance(lst, list) and value_types in ((int, Ellipsis), (float, Ellipsis)):
+        coerced_lst = bson_number_list_coercion(value_types[0], lst)
+
+        if coerced_lst is not None:
+            return tuple(coerced_lst)
+
+    return tuple_deserialization(cls, lst, deserialization_func=BSONSerializer.deserialize, is_noop_deserialization=BSONSerializer.is_noop_deserialization)
+
+
+def bson_set_deserializer(cls, lst):
+    return set_deserialization(cls, lst, deserialization_func=BSONSerializer.deserialize, is_noop_deserialization=BSONSerializer.is_noop_deserialization)
+
+
+def bson_bytes_serializer(obj):
+    """
+    BSON encoders only accept bytes
+
+    Memoryviews over the whole of a bytes object are unwrapped without copying
+    """
+
+    if isinstance(obj, memoryview) and isinstance(obj.obj, bytes) and obj.c_contiguous and obj.nbytes == len(obj.obj):
+        return obj.obj
+
+    return bytes(obj)
+
+
+def bson_update_document(changes):
+    """
+    Mongo update document making the changes found by Serializer.diff
+    """
+
+    update = {}
+
+    for op, path, value in changes:
+        dotted_path = ".".join(map(str, path))
+
+        if op == "remove":
+            update.setdefault("$unset", {})[dotted_path] = ""
+        else:
+            update.setdefault("$set", {})[dotted_path] = value
+
+    return update
+
+
 BSONSerializer = Serializer(
     serialization_functions={
-        dict: lambda dct: dict_serialization(dct, key_serialization_func=BSONSerializer.serialize, value_serialization_func=BSONSerializer.serialize),
-        list: lambda lst: list(map(BSONSerializer.serialize, lst)),
-        (str, int, float, datetime, bytes, bson.ObjectId, bool, type(None)): noop_serialization
+        dict: bson_dict_serializer,
+        (list, tuple, set, frozenset): bson_list_serializer,
+        (str, int, float, datetime, bytes, bool, type(None)): noop_serialization,
+        (bytearray, memoryview): bson_bytes_serializer
     },
     deserialization_functions={
-        dict: lambda cls, dct: dict_deserialization(cls, dct, key_deserialization_func=BSONSerializer.deserialize, value_deserialization_func=BSONSerializer.deserialize),
-        list: lambda cls, lst: list_deserialization(cls, lst, deserialization_func=BSONSerializer.deserialize),
+        dict: bson_dict_deserializer,
+        list: bson_list_deserializer,
+        tuple: bson_tuple_deserializer,
+        set: bson_set_deserializer,
+        frozenset: bson_set_deserializer,
         int: bson_int_deserializer,
         bool: noop_deserialization,
-        (str, float, datetime, bytes, bson.ObjectId, type(None)): noop_deserialization
-    }
+        (str, float, datetime, bytes, type(None)): noop_deserialization,
+        (bytearray, memoryview): buffer_deserialization
+    },
+    patch_function=bson_update_document
 )
 
 
+def bson_list_deserialization_traversal(serializer, cls, lst):
+    # Lists of numbers are coerced in bulk by bson_list_deserializer
+    if get_args(cls, evaluate=True) in ((int,), (float,)):
+        return None
+
+    return list_deserialization_traversal(serializer, cls, lst)
+
+
+BSONSerializer.register_serialization_traversal(bson_dict_serializer, noop_serializable_traversal(dict_serialization_traversal, bson_primitive_types))
+BSONSerializer.register_serialization_traversal(bson_list_serializer, noop_serializable_traversal(list_serialization_traversal, bson_primitive_types))
+BSONSerializer.register_deserialization_traversal(bson_dict_deserializer, dict_deserialization_traversal)
+BSONSerializer.register_deserialization_traversal(bson_list_deserializer, bson_list_deserialization_traversal)
+
+
+@BSONSerializer.register_on_import('bson')
+def register_object_id(bson):
+    BSONSerializer.register(bson.ObjectId, noop_serialization, noop_deserialization)
+
+
+@BSONSerializer.register_on_import('numpy')
+def register_ndarray(numpy):
+    from dataclasses_serialization.serializer_base.ndarray import ndarray_serialization, ndarray_deserialization
+
+    BSONSerializer.register(
+        numpy.ndarray,
+        ndarray_serialization(data_serialization_func=bson_bytes_serializer),
+        ndarray_deserialization(data_deserialization_func=noop_deserialization)
+    )
+
+
 class BSONSerializerMixin:
     def as_bson(self):
         return BSONSerializer.serialize(self)
@@ -87,6 +287,20 @@ BSONStrSerializer = Serializer(
 )
 
 
+class BSONDirtyTrackingMixin(DirtyTrackingMixin, BSONSerializerMixin):
+    def bson_changes(self):
+        return BSONSerializer.serialize_changes(self)
+
+    def bson_update(self):
+        """
+        Mongo update document, setting the fields changed since last serialized
+        """
+
+        changes = self.bson_changes()
+
+        return {"$set": changes} if changes else {}
+
+
 class BSONStrSerializerMixin:
     def as_bson_str(self):
         return BSONStrSerializer.serialize(self)
@@ -94,3 +308,93 @@ class BSONStrSerializerMixin:
     @classmethod
     def from_bson_str(cls, serialized_obj):
         return BSONStrSerializer.deserialize(cls, serialized_obj)
+
+
+def iter_bson_documents(bson_file):
+    """
+    Split a sequence of concatenated BSON documents, as in a mongodump .bson file
+
+    Buffers, such as an mmap of the file, are split without copying
+    Otherwise bson_file is read as a binary file, one document at a time
+    """
+
+    try:
+        view = memoryview(bson_file)
+    except TypeError:
+        yield from iter_bson_file_documents(bson_file)
+        return
+
+    with view, view.cast("B") as buffer:
+        offset = 0
+
+        while offset < len(buffer):
+            length = int.from_bytes(buffer[offset:offset + 4], "little")
+
+            if length < 5 or offset + length > len(buffer):
+                raise DeserializationError("Truncated BSON document at offset {}".format(offset))
+
+            with buffer[offset:offset + length] as document:
+                yield document
+
+            offset += length
+
+
+def iter_bson_file_documents(bson_file):
+    offset = 0
+
+    while True:
+        header = bson_file.read(4)
+
+        if not header:
+            return
+
+        length = int.from_bytes(header, "little")
+
+        if len(header) < 4 or length < 5:
+            raise DeserializationError("Truncated BSON document at offset {}".format(offset))
+
+        document = header + bson_file.read(length - 4)
+
+        if len(document) < length:
+            raise DeserializationError("Truncated BSON document at offset {}".format(offset))
+
+        yield document
+
+        offset += length
+
+
+def bson_document_deserializer(cls, document):
+    return BSONStrSerializer.deserialize(cls, document)
+
+
+def iter_deserialize(cls, bson_file, executor=None, max_pending=64):
+    """
+    Lazily deserialize each of a sequence of concatenated BSON documents as given type
+
+    bson_file may be a binary file object, or a buffer such as an mmap of a file
+    Only one document is held in memory at a time, or up to max_pending when
+    deserializing in parallel with a concurrent.futures executor
+    """
+
+    documents = iter_bson_documents(bson_file)
+
+    if executor is None:
+        for document in documents:
+            yield BSONStrSerializer.deserialize(cls, document)
+
+        return
+
+    pending = deque()
+
+    try:
+        for document in documents:
+            pending.append(executor.submit(bson_document_deserializer, cls, bytes(document)))
+
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
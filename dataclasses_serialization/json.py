@@ -1,28 +1,110 @@
+import codecs
 import json
+import re
+from base64 import b64decode, b64encode
 
-from dataclasses_serialization.serializer_base import noop_serialization, noop_deserialization, dict_serialization, dict_deserialization, list_deserialization, Serializer
+from dataclasses_serialization.serializer_base import noop_serialization, noop_deserialization, is_noop_serializable_collection, dataclass_to_dict, dict_serialization, dict_deserialization, list_deserialization, tuple_deserialization, set_deserialization, list_serialization_traversal, list_deserialization_traversal, dict_serialization_traversal, dict_deserialization_traversal, noop_serializable_traversal, DirtyTrackingMixin, Serializer
+from dataclasses_serialization.serializer_base.iterative import iterative_deserialization_steps
 
 __all__ = [
     "JSONSerializer",
     "JSONSerializerMixin",
+    "JSONDirtyTrackingMixin",
     "JSONStrSerializer",
-    "JSONStrSerializerMixin"
+    "JSONStrSerializerMixin",
+    "aserialize_chunks",
+    "adeserialize"
 ]
 
+
+json_primitive_types = frozenset({str, int, float, bool, type(None)})
+
+
+def json_dict_serializer(dct):
+    if is_noop_serializable_collection(JSONSerializer, dct, json_primitive_types):
+        return dict(dct)
+
+    return dict_serialization(dct, key_serialization_func=JSONSerializer.serialize, value_serialization_func=JSONSerializer.serialize)
+
+
+def json_list_serializer(lst):
+    if is_noop_serializable_collection(JSONSerializer, lst, json_primitive_types):
+        return list(lst)
+
+    return list(map(JSONSerializer.serialize, lst))
+
+
+def json_dict_deserializer(cls, dct):
+    return dict_deserialization(cls, dct, key_deserialization_func=JSONSerializer.deserialize, value_deserialization_func=JSONSerializer.deserialize, is_noop_deserialization=JSONSerializer.is_noop_deserialization, intern_keys=JSONSerializer.intern_keys)
+
+
+def json_list_deserializer(cls, lst):
+    return list_deserialization(cls, lst, deserialization_func=JSONSerializer.deserialize, is_noop_deserialization=JSONSerializer.is_noop_deserialization)
+
+
+def json_tuple_deserializer(cls, lst):
+    return tuple_deserialization(cls, lst, deserialization_func=JSONSerializer.deserialize, is_noop_deserialization=JSONSerializer.is_noop_deserialization)
+
+
+def json_set_deserializer(cls, lst):
+    return set_deserialization(cls, lst, deserialization_func=JSONSerializer.deserialize, is_noop_deserialization=JSONSerializer.is_noop_deserialization)
+
+
+def json_pointer(path):
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1")
+        for part in path
+    )
+
+
+def json_patch(changes):
+    """
+    JSON Patch (RFC 6902) making the changes found by Serializer.diff
+    """
+
+    return [
+        {"op": op, "path": json_pointer(path)}
+        if op == "remove" else
+        {"op": op, "path": json_pointer(path), "value": value}
+        for op, path, value in changes
+    ]
+
+
 JSONSerializer = Serializer(
     serialization_functions={
-        dict: lambda dct: dict_serialization(dct, key_serialization_func=JSONSerializer.serialize, value_serialization_func=JSONSerializer.serialize),
-        list: lambda lst: list(map(JSONSerializer.serialize, lst)),
+        dict: json_dict_serializer,
+        (list, tuple, set, frozenset): json_list_serializer,
         (str, int, float, bool, type(None)): noop_serialization
     },
     deserialization_functions={
-        dict: lambda cls, dct: dict_deserialization(cls, dct, key_deserialization_func=JSONSerializer.deserialize, value_deserialization_func=JSONSerializer.deserialize),
-        list: lambda cls, lst: list_deserialization(cls, lst, deserialization_func=JSONSerializer.deserialize),
+        dict: json_dict_deserializer,
+        list: json_list_deserializer,
+        tuple: json_tuple_deserializer,
+        set: json_set_deserializer,
+        frozenset: json_set_deserializer,
         (str, int, float, bool, type(None)): noop_deserialization
-    }
+    },
+    patch_function=json_patch
 )
 
 
+JSONSerializer.register_serialization_traversal(json_dict_serializer, noop_serializable_traversal(dict_serialization_traversal, json_primitive_types))
+JSONSerializer.register_serialization_traversal(json_list_serializer, noop_serializable_traversal(list_serialization_traversal, json_primitive_types))
+JSONSerializer.register_deserialization_traversal(json_dict_deserializer, dict_deserialization_traversal)
+JSONSerializer.register_deserialization_traversal(json_list_deserializer, list_deserialization_traversal)
+
+
+@JSONSerializer.register_on_import('numpy')
+def register_ndarray(numpy):
+    from dataclasses_serialization.serializer_base.ndarray import ndarray_serialization, ndarray_deserialization
+
+    JSONSerializer.register(
+        numpy.ndarray,
+        ndarray_serialization(data_serialization_func=lambda data: b64encode(data).decode('ascii')),
+        ndarray_deserialization(data_deserialization_func=lambda cls, data: b64decode(data, validate=True))
+    )
+
+
 class JSONSerializerMixin:
     def as_json(self):
         return JSONSerializer.serialize(self)
@@ -42,6 +124,11 @@ JSONStrSerializer = Serializer(
 )
 
 
+class JSONDirtyTrackingMixin(DirtyTrackingMixin, JSONSerializerMixin):
+    def json_changes(self):
+        return JSONSerializer.serialize_changes(self)
+
+
 class JSONStrSerializerMixin:
     def as_json_str(self):
         return JSONStrSerializer.serialize(self)
@@ -49,3 +136,234 @@ class JSONStrSerializerMixin:
     @classmethod
     def from_json_str(cls, serialized_obj):
         return JSONStrSerializer.deserialize(cls, serialized_obj)
+
+
+def iter_json_chunks(obj):
+    """
+    Lazily serialize Python object to a JSON string, in pieces
+
+    Lists, dicts with string keys, and dataclasses, serialized by the default
+    functions, are descended into, so no one piece is much work to serialize
+    """
+
+    serialization_func = JSONSerializer.serialization_function(obj)
+
+    if serialization_func == JSONSerializer.serialize_dataclass:
+        yield from iter_json_chunks(dataclass_to_dict(obj, omit_defaults=JSONSerializer.omit_defaults, omit_none=JSONSerializer.omit_none))
+
+    elif serialization_func is json_list_serializer:
+        yield "["
+
+        for i, value in enumerate(obj):
+            if i:
+                yield ", "
+
+            yield from iter_json_chunks(value)
+
+        yield "]"
+
+    elif serialization_func is json_dict_serializer and all(type(key) is str for key in obj):
+        yield "{"
+
+        for i, (key, value) in enumerate(obj.items()):
+            yield "{}{}: ".format(", " if i else "", json.dumps(key))
+            yield from iter_json_chunks(value)
+
+        yield "}"
+
+    else:
+        yield json.dumps(serialization_func(obj))
+
+
+async def aserialize_chunks(obj, chunk_size=65536, yield_every=1000):
+    """
+    Serialize Python object to a JSON string, in chunks of around chunk_size characters
+
+    Yields control to the event loop after serializing every yield_every values,
+    so serializing large objects does not block it
+    """
+
+    # Deferred, as asyncio is slow to import
+    import asyncio
+
+    chunks = []
+    chunks_size = 0
+
+    for i, chunk in enumerate(iter_json_chunks(obj), 1):
+        chunks.append(chunk)
+        chunks_size += len(chunk)
+
+        if chunks_size >= chunk_size:
+            yield "".join(chunks)
+
+            chunks = []
+            chunks_size = 0
+
+        if i % yield_every == 0:
+            await asyncio.sleep(0)
+
+    if chunks:
+        yield "".join(chunks)
+
+
+json_decoder = json.JSONDecoder()
+json_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class IncrementalJSONParser:
+    """
+    Parser of a JSON string, fed to it in pieces
+
+    Top-level arrays are parsed an item at a time, as soon as each item has been
+    fed in full, so only the unparsed remainder of the string is held.
+    Other values are parsed in one step once the whole string has been fed
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.pending = []
+        self.pending_size = 0
+        self.retry_size = 0
+        self.state = "start"
+        self.items = []
+
+    def feed(self, text):
+        self.pending.append(text)
+        self.pending_size += len(text)
+
+    def parse(self, limit=None, final=False):
+        """
+        Parse up to limit array items from the text fed so far, returning how many were parsed
+
+        Unless final, items which may continue in text yet to be fed are left unparsed
+        """
+
+        if self.state == "value" or (not final and len(self.buffer) - self.pos + self.pending_size < self.retry_size):
+            return 0
+
+        if self.pending:
+            self.buffer = self.buffer[self.pos:] + "".join(self.pending)
+            self.pos = 0
+            self.pending = []
+            self.pending_size = 0
+
+        buffer = self.buffer
+        size = len(buffer)
+        pos = self.pos
+        state = self.state
+        parsed = 0
+
+        while limit is None or parsed < limit:
+            pos = json_whitespace.match(buffer, pos).end()
+
+            if pos == size:
+                if final and state != "end":
+                    raise json.JSONDecodeError("Expecting value", buffer, pos)
+
+                break
+
+            if state == "item" or (state == "first_item" and buffer[pos] != "]"):
+                try:
+                    value, end = json_decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+
+                    # Not retried until twice as much text has been fed, so large items are not parsed over and over
+                    self.retry_size = 2 * (size - pos)
+                    break
+
+                delimiter_pos = json_whitespace.match(buffer, end).end()
+
+                # Numbers may continue in text yet to be fed, so items are only taken once followed by a delimiter
+                if delimiter_pos == size or buffer[delimiter_pos] not in ",]":
+                    if final:
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buffer, delimiter_pos)
+
+                    self.retry_size = 2 * (size - pos)
+                    break
+
+                self.items.append(value)
+                self.retry_size = 0
+                parsed += 1
+
+                pos = delimiter_pos + 1
+                state = "item" if buffer[delimiter_pos] == "," else "end"
+
+            elif state == "first_item":
+                pos += 1
+                state = "end"
+
+            elif state == "start" and buffer[pos] == "[":
+                pos += 1
+                state = "first_item"
+
+            elif state == "start":
+                self.pending = [buffer[pos:]]
+                buffer = ""
+                pos = 0
+                state = "value"
+                break
+
+            else:
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+
+        self.buffer = buffer
+        self.pos = pos
+        self.state = state
+
+        return parsed
+
+    def close(self):
+        """
+        Parse the rest of the text fed, returning the parsed value
+        """
+
+        if self.state == "value":
+            return json.loads("".join(self.pending))
+
+        self.parse(final=True)
+
+        return self.items
+
+
+async def adeserialize(cls, stream, yield_every=1000):
+    """
+    Deserialize a JSON string, read from an asynchronous iterable of bytes or str chunks, as given type
+
+    Top-level arrays are parsed an item at a time, as the stream is read, and
+    other values once read in full.
+    Dataclasses, lists, dicts, and Optionals are then deserialized a value at a
+    time, at any depth.
+    Control is yielded to the event loop after parsing, or deserializing, every
+    yield_every values
+    """
+
+    import asyncio
+
+    parser = IncrementalJSONParser()
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    async for chunk in stream:
+        parser.feed(chunk if isinstance(chunk, str) else decoder.decode(chunk))
+
+        while parser.parse(yield_every) == yield_every:
+            await asyncio.sleep(0)
+
+    parser.feed(decoder.decode(b"", final=True))
+
+    while parser.parse(yield_every) == yield_every:
+        await asyncio.sleep(0)
+
+    obj = parser.close()
+
+    steps = iterative_deserialization_steps(JSONSerializer, cls, obj, yield_every)
+
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+        await asyncio.sleep(0)
@@ -0,0 +1,208 @@
+from datetime import datetime, timezone
+from functools import partial
+from importlib.util import find_spec
+
+from dataclasses_serialization.serializer_base import isinstance, noop_serialization, noop_deserialization, is_noop_serializable_collection, dict_serialization, dict_deserialization, list_deserialization, tuple_deserialization, set_deserialization, buffer_deserialization, list_serialization_traversal, list_deserialization_traversal, dict_serialization_traversal, dict_deserialization_traversal, noop_serializable_traversal, DirtyTrackingMixin, Serializer, DeserializationError
+
+if find_spec("msgpack") is None:
+    raise ImportError("msgpack module required for MessagePack serialization")
+
+import msgpack
+
+__all__ = [
+    "MsgPackSerializer",
+    "MsgPackSerializerMixin",
+    "MsgPackDirtyTrackingMixin",
+    "MsgPackStrSerializer",
+    "MsgPackStrSerializerMixin",
+    "iter_deserialize"
+]
+
+msgpack_primitive_types = frozenset({str, int, float, bytes, bool, type(None)})
+
+
+def msgpack_dict_serializer(dct):
+    if is_noop_serializable_collection(MsgPackSerializer, dct, msgpack_primitive_types):
+        return dict(dct)
+
+    return dict_serialization(dct, key_serialization_func=MsgPackSerializer.serialize, value_serialization_func=MsgPackSerializer.serialize)
+
+
+def msgpack_list_serializer(lst):
+    if is_noop_serializable_collection(MsgPackSerializer, lst, msgpack_primitive_types):
+        return list(lst)
+
+    return list(map(MsgPackSerializer.serialize, lst))
+
+
+def msgpack_dict_deserializer(cls, dct):
+    return dict_deserialization(cls, dct, key_deserialization_func=MsgPackSerializer.deserialize, value_deserialization_func=MsgPackSerializer.deserialize, is_noop_deserialization=MsgPackSerializer.is_noop_deserialization, intern_keys=MsgPackSerializer.intern_keys)
+
+
+def msgpack_list_deserializer(cls, lst):
+    return list_deserialization(cls, lst, deserialization_func=MsgPackSerializer.deserialize, is_noop_deserialization=MsgPackSerializer.is_noop_deserialization)
+
+
+def msgpack_tuple_deserializer(cls, lst):
+    return tuple_deserialization(cls, lst, deserialization_func=MsgPackSerializer.deserialize, is_noop_deserialization=MsgPackSerializer.is_noop_deserialization)
+
+
+def msgpack_set_deserializer(cls, lst):
+    return set_deserialization(cls, lst, deserialization_func=MsgPackSerializer.deserialize, is_noop_deserialization=MsgPackSerializer.is_noop_deserialization)
+
+
+def msgpack_datetime_serializer(obj):
+    """
+    Serialize datetimes as the MessagePack timestamp extension type
+
+    Naive datetimes are taken to be in UTC
+    """
+
+    if obj.tzinfo is None:
+        obj = obj.replace(tzinfo=timezone.utc)
+
+    return msgpack.Timestamp.from_datetime(obj)
+
+
+def msgpack_datetime_deserializer(cls, obj):
+    """
+    Deserialize MessagePack timestamps as naive datetimes in UTC
+
+    As in BSON, so naive datetimes round trip
+    """
+
+    if isinstance(obj, msgpack.Timestamp):
+        return obj.to_datetime().replace(tzinfo=None)
+
+    if isinstance(obj, datetime):
+        return obj
+
+    raise DeserializationError("Cannot deserialize {} {!r} to type {}".format(
+        type(obj).__name__,
+        obj,
+        cls.__name__
+    ))
+
+
+MsgPackSerializer = Serializer(
+    serialization_functions={
+        dict: msgpack_dict_serializer,
+        (list, tuple, set, frozenset): msgpack_list_serializer,
+        (str, int, float, bytes, bool, type(None)): noop_serialization,
+        # MessagePack encoders accept any buffer as binary data, without copying
+        (bytearray, memoryview): noop_serialization,
+        datetime: msgpack_datetime_serializer
+    },
+    deserialization_functions={
+        dict: msgpack_dict_deserializer,
+        list: msgpack_list_deserializer,
+        tuple: msgpack_tuple_deserializer,
+        set: msgpack_set_deserializer,
+        frozenset: msgpack_set_deserializer,
+        (str, int, float, bytes, bool, type(None)): noop_deserialization,
+        (bytearray, memoryview): buffer_deserialization,
+        datetime: msgpack_datetime_deserializer
+    }
+)
+
+
+MsgPackSerializer.register_serialization_traversal(msgpack_dict_serializer, noop_serializable_traversal(dict_serialization_traversal, msgpack_primitive_types))
+MsgPackSerializer.register_serialization_traversal(msgpack_list_serializer, noop_serializable_traversal(list_serialization_traversal, msgpack_primitive_types))
+MsgPackSerializer.register_deserialization_traversal(msgpack_dict_deserializer, dict_deserialization_traversal)
+MsgPackSerializer.register_deserialization_traversal(msgpack_list_deserializer, list_deserialization_traversal)
+
+
+@MsgPackSerializer.register_on_import('numpy')
+def register_ndarray(numpy):
+    from dataclasses_serialization.serializer_base.ndarray import ndarray_serialization, ndarray_deserialization
+
+    MsgPackSerializer.register(
+        numpy.ndarray,
+        ndarray_serialization(data_serialization_func=noop_serialization),
+        ndarray_deserialization(data_deserialization_func=noop_deserialization)
+    )
+
+
+class MsgPackSerializerMixin:
+    def as_msgpack(self):
+        return MsgPackSerializer.serialize(self)
+
+    @classmethod
+    def from_msgpack(cls, serialized_obj):
+        return MsgPackSerializer.deserialize(cls, serialized_obj)
+
+
+def msgpack_dumps(obj):
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def msgpack_loads(msgpack_str):
+    return msgpack.unpackb(msgpack_str, raw=False, strict_map_key=False)
+
+
+MsgPackStrSerializer = Serializer(
+    serialization_functions={
+        object: lambda obj: msgpack_dumps(MsgPackSerializer.serialize(obj))
+    },
+    deserialization_functions={
+        object: lambda cls, serialized_obj: MsgPackSerializer.deserialize(cls, msgpack_loads(serialized_obj))
+    }
+)
+
+
+class MsgPackDirtyTrackingMixin(DirtyTrackingMixin, MsgPackSerializerMixin):
+    def msgpack_changes(self):
+        return MsgPackSerializer.serialize_changes(self)
+
+
+class MsgPackStrSerializerMixin:
+    def as_msgpack_str(self):
+        return MsgPackStrSerializer.serialize(self)
+
+    @classmethod
+    def from_msgpack_str(cls, serialized_obj):
+        return MsgPackStrSerializer.deserialize(cls, serialized_obj)
+
+
+def iter_msgpack_documents(msgpack_file, chunk_size=65536):
+    """
+    Lazily unpack each of a sequence of concatenated MessagePack documents
+
+    Read, or sliced from the buffer, chunk_size bytes at a time
+    """
+
+    if hasattr(msgpack_file, 'read'):
+        chunks = iter(partial(msgpack_file.read, chunk_size), b'')
+    else:
+        buffer = memoryview(msgpack_file).cast('B')
+        chunks = (buffer[offset:offset + chunk_size] for offset in range(0, len(buffer), chunk_size))
+
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    size = offset = 0
+
+    for chunk in chunks:
+        unpacker.feed(chunk)
+        size += len(chunk)
+
+        try:
+            for document in unpacker:
+                # Offset of the end of the last whole document
+                offset = unpacker.tell()
+                yield document
+        except ValueError:
+            raise DeserializationError("Invalid MessagePack document at offset {}".format(offset))
+
+    if offset != size:
+        raise DeserializationError("Truncated MessagePack document at offset {}".format(offset))
+
+
+def iter_deserialize(cls, msgpack_file):
+    """
+    Lazily deserialize each of a sequence of concatenated MessagePack documents as given type
+
+    msgpack_file may be a binary file object, or a buffer such as an mmap of a file
+    Documents are unpacked as they are read, so only one is held in memory at a time
+    """
+
+    for document in iter_msgpack_documents(msgpack_file):
+        yield MsgPackSerializer.deserialize(cls, document)
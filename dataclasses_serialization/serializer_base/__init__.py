@@ -1,4 +1,14 @@
-from dataclasses_serialization.serializer_base.dataclasses import dict_to_dataclass
+from dataclasses_serialization.serializer_base.buffer import buffer_deserialization
+from dataclasses_serialization.serializer_base.cache import set_shared_cache_size
+from dataclasses_serialization.serializer_base.columnar import (
+    columns_to_dataclasses,
+    dataclasses_to_columns,
+)
+from dataclasses_serialization.serializer_base.dataclasses import (
+    dataclass_to_dict,
+    dict_to_dataclass,
+)
+from dataclasses_serialization.serializer_base.diff import diff_objects
 from dataclasses_serialization.serializer_base.dictionary import (
     dict_deserialization,
     dict_serialization,
@@ -7,12 +17,41 @@ from dataclasses_serialization.serializer_base.errors import (
     DeserializationError,
     SerializationError,
 )
+from dataclasses_serialization.serializer_base.iterative import (
+    dict_deserialization_traversal,
+    dict_serialization_traversal,
+    list_deserialization_traversal,
+    list_serialization_traversal,
+    noop_serializable_traversal,
+)
+from dataclasses_serialization.serializer_base.lazy import (
+    LazyDict,
+    LazyList,
+    lazy_collection_deserialization,
+    lazy_dict_to_dataclass,
+    load_lazy_fields,
+)
 from dataclasses_serialization.serializer_base.list import list_deserialization
 from dataclasses_serialization.serializer_base.noop import (
+    is_noop_serializable_collection,
     noop_deserialization,
     noop_serialization,
 )
-from dataclasses_serialization.serializer_base.serializer import Serializer
+from dataclasses_serialization.serializer_base.offload import Offloader, estimate_size
+from dataclasses_serialization.serializer_base.payload import (
+    PayloadCache,
+    is_immutable_type,
+)
+from dataclasses_serialization.serializer_base.records import RecordStore, write_records
+from dataclasses_serialization.serializer_base.serializer import (
+    Serializer,
+    SerializerPlans,
+    SerializerReference,
+    serializer_reference,
+)
+from dataclasses_serialization.serializer_base.set import set_deserialization
+from dataclasses_serialization.serializer_base.tracking import DirtyTrackingMixin
+from dataclasses_serialization.serializer_base.tuple import tuple_deserialization
 from dataclasses_serialization.serializer_base.typing import isinstance, issubclass
 from dataclasses_serialization.serializer_base.union import union_deserialization
 
@@ -21,12 +60,41 @@ __all__ = [
     "issubclass",
     "noop_serialization",
     "noop_deserialization",
+    "is_noop_serializable_collection",
+    "dataclass_to_dict",
     "dict_to_dataclass",
+    "lazy_dict_to_dataclass",
+    "load_lazy_fields",
+    "lazy_collection_deserialization",
+    "LazyList",
+    "LazyDict",
     "union_deserialization",
+    "dataclasses_to_columns",
+    "columns_to_dataclasses",
+    "diff_objects",
     "dict_serialization",
     "dict_deserialization",
     "list_deserialization",
+    "tuple_deserialization",
+    "set_deserialization",
+    "buffer_deserialization",
+    "list_serialization_traversal",
+    "list_deserialization_traversal",
+    "dict_serialization_traversal",
+    "dict_deserialization_traversal",
+    "noop_serializable_traversal",
     "Serializer",
+    "SerializerPlans",
+    "SerializerReference",
+    "serializer_reference",
+    "DirtyTrackingMixin",
+    "PayloadCache",
+    "is_immutable_type",
+    "Offloader",
+    "estimate_size",
+    "RecordStore",
+    "write_records",
+    "set_shared_cache_size",
     "SerializationError",
     "DeserializationError",
 ]
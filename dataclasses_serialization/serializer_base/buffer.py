@@ -0,0 +1,22 @@
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.typing import isinstance
+
+__all__ = ["buffer_deserialization"]
+
+
+def buffer_deserialization(cls, obj):
+    """
+    Deserialize a buffer, such as the bytes produced by binary decoders, as a bytes-like type
+
+    Memoryviews are taken over the buffer without copying
+    """
+
+    if isinstance(obj, cls):
+        return obj
+
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return cls(obj)
+
+    raise DeserializationError(
+        "Cannot deserialize {} {!r} to type {}".format(type(obj), obj, cls)
+    )
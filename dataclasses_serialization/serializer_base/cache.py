@@ -0,0 +1,181 @@
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from functools import partial
+
+__all__ = ["LRUCache", "CacheStats", "shared_cache", "set_shared_cache_size"]
+
+default_maxsize = 4096
+
+shared_caches = []
+shared_maxsize = default_maxsize
+
+
+@dataclass
+class CacheStats:
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class LRUCache(MutableMapping):
+    """
+    Dictionary holding at most maxsize items, evicting the least recently used
+
+    Classes are held by weak reference, and their items removed when they are
+    garbage collected, so dynamically created classes are not kept alive.
+    As classes compare by identity, they are looked up by id.
+    Other keys, such as generic aliases, are held until evicted.
+
+    Counts hits, misses, and evictions, as given by stats
+    """
+
+    def __init__(self, items=(), maxsize=default_maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.update(items)
+
+    def cache_key(self, key):
+        if isinstance(key, type):
+            return id(key)
+
+        return key
+
+    def __getitem__(self, key):
+        # Inlined cache_key, as this is the hot path of every lookup
+        cache_key = id(key) if isinstance(key, type) else key
+
+        try:
+            _, value = self.data[cache_key]
+            self.data.move_to_end(cache_key)
+        except KeyError:
+            self.misses += 1
+            raise
+
+        self.hits += 1
+
+        return value
+
+    def __setitem__(self, key, value):
+        cache_key = self.cache_key(key)
+
+        if cache_key is key:
+            self.data[cache_key] = (key, value)
+        else:
+            # The callback holds the cache weakly, so classes which outlive
+            # the cache, such as builtins, do not keep it alive
+            self.data[cache_key] = (
+                weakref.ref(key, partial(discard_id, weakref.ref(self), cache_key)),
+                value,
+            )
+
+        self.data.move_to_end(cache_key)
+        self.evict()
+
+    def evict(self):
+        """
+        Evict the least recently used items, until at most maxsize are held
+        """
+
+        while len(self.data) > self.maxsize:
+            try:
+                self.data.popitem(last=False)
+            except KeyError:
+                break
+
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        self.evict()
+
+    def __delitem__(self, key):
+        del self.data[self.cache_key(key)]
+
+    def __contains__(self, key):
+        try:
+            return self.cache_key(key) in self.data
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def __len__(self):
+        return len(self.data)
+
+    def items(self):
+        """
+        The items of the cache, without counting as hits
+        """
+
+        for cache_key, (key, value) in list(self.data.items()):
+            if cache_key is not key:
+                key = key()
+
+                if key is None:
+                    continue
+
+            yield key, value
+
+    def clear(self):
+        self.data.clear()
+
+    @property
+    def stats(self):
+        return CacheStats(
+            size=len(self.data),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def __repr__(self):
+        return "LRUCache({!r}, maxsize={!r})".format(dict(self.items()), self.maxsize)
+
+
+def discard_id(cache_ref, cache_key, key_ref):
+    """
+    Remove the item of a garbage collected class, if the cache is still alive
+    """
+
+    cache = cache_ref()
+
+    if cache is not None and cache.data.get(cache_key, (None,))[0] is key_ref:
+        del cache.data[cache_key]
+
+
+def shared_cache():
+    """
+    LRUCache shared by all serializers, such as of the field types of dataclasses
+
+    Holding at most the size given to set_shared_cache_size
+    """
+
+    cache = LRUCache(maxsize=shared_maxsize)
+    shared_caches.append(cache)
+
+    return cache
+
+
+def set_shared_cache_size(maxsize):
+    """
+    Set the maximum size of each of the caches shared by all serializers
+
+    Evicting the least recently used items of caches already holding more
+    """
+
+    global shared_maxsize
+
+    shared_maxsize = maxsize
+
+    for cache in shared_caches:
+        cache.resize(maxsize)
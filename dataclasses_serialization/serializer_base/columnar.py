@@ -0,0 +1,222 @@
+from array import array
+from dataclasses import MISSING
+from operator import attrgetter
+from typing import List
+
+from toolz import curry
+
+from dataclasses_serialization.serializer_base.errors import (
+    DeserializationError,
+    SerializationError,
+)
+from dataclasses_serialization.serializer_base.list import list_deserialization
+from dataclasses_serialization.serializer_base.noop import (
+    noop_deserialization,
+    noop_serialization,
+)
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types,
+    get_origin,
+    original_isinstance,
+)
+
+__all__ = ["dataclasses_to_columns", "columns_to_dataclasses"]
+
+array_typecodes = {int: "q", float: "d", bool: "b"}
+
+# Typecodes of array.arrays, and kinds of NumPy arrays, that may be deserialized as each type
+column_typecodes = {int: "bBhHiIlLqQ", float: "fd", bool: "bB"}
+column_dtype_kinds = {int: "iu", float: "f", bool: "b"}
+
+
+def numeric_column(fld_type, values, use_numpy):
+    """
+    Column of numeric values as an array, or None if they do not fit one
+    """
+
+    typecode = array_typecodes[fld_type]
+
+    if any(type(value) is not fld_type for value in values):
+        return None
+
+    try:
+        column = array(typecode, values)
+    except OverflowError:
+        return None
+
+    if use_numpy:
+        import numpy
+
+        return numpy.frombuffer(column, dtype=numpy.dtype(typecode)).astype(fld_type)
+
+    return column
+
+
+def numeric_column_values(fld_type, column):
+    """
+    Values of a numeric array column, or None if it does not hold values of fld_type
+
+    Checked by the array's typecode, or NumPy dtype, rather than value by value
+    """
+
+    dtype = getattr(column, "dtype", None)
+
+    if dtype is not None:
+        if dtype.kind not in column_dtype_kinds[fld_type]:
+            return None
+
+        return column.tolist()
+
+    if not original_isinstance(column, array) or (
+        column.typecode not in column_typecodes[fld_type]
+    ):
+        return None
+
+    values = column.tolist()
+
+    if fld_type is bool:
+        if any(value not in (0, 1) for value in values):
+            return None
+
+        values = list(map(bool, values))
+
+    return values
+
+
+def is_required_field(fld):
+    return fld.init and fld.default is MISSING and fld.default_factory is MISSING
+
+
+@curry
+def dataclasses_to_columns(
+    cls, objs, serialization_func=noop_serialization, use_numpy=False
+):
+    """
+    Serialize a list of dataclasses cls as a dict of columns, one per field
+
+    Fields of type int, float, or bool become an array.array, or a NumPy
+    array if use_numpy is set, and all other fields a list of their values
+    serialized by serialization_func.
+    Numeric fields holding values which do not fit an array, such as None, or
+    ints too large for 64 bits, are serialized as lists instead
+    """
+
+    origin = get_origin(cls) or cls
+
+    if not all(original_isinstance(obj, origin) for obj in objs):
+        raise SerializationError(
+            "Cannot serialize {!r} as columns of type {}".format(objs, cls)
+        )
+
+    try:
+        fld_types = dataclass_field_types(cls, require_bound=True)
+    except TypeError:
+        raise SerializationError("Cannot serialize unbound generic {}".format(cls))
+
+    columns = {}
+
+    for fld, fld_type in fld_types:
+        values = list(map(attrgetter(fld.name), objs))
+        column = None
+
+        if fld_type in array_typecodes:
+            column = numeric_column(fld_type, values, use_numpy)
+
+        if column is None:
+            column = (
+                values
+                if serialization_func is noop_serialization
+                else list(map(serialization_func, values))
+            )
+
+        columns[fld.name] = column
+
+    return columns
+
+
+@curry
+def columns_to_dataclasses(
+    cls,
+    columns,
+    deserialization_func=noop_deserialization,
+    is_noop_deserialization=None,
+):
+    """
+    Deserialize a dict of columns, one per field, as a list of dataclasses cls
+
+    The inverse of dataclasses_to_columns.
+    Numeric arrays are converted back to Python values in bulk, if their
+    typecode or dtype matches the field's type, and lists are deserialized as
+    in list_deserialization.
+    Fields with defaults may be missing from columns.
+    """
+
+    if not original_isinstance(columns, dict):
+        raise DeserializationError(
+            "Cannot deserialize {} {!r} as columns".format(type(columns), columns)
+        )
+
+    try:
+        fld_types = dataclass_field_types(cls, require_bound=True)
+    except TypeError:
+        raise DeserializationError("Cannot deserialize unbound generic {}".format(cls))
+
+    missing_names = [
+        fld.name
+        for fld, _ in fld_types
+        if is_required_field(fld) and fld.name not in columns
+    ]
+
+    if missing_names:
+        raise DeserializationError(
+            "Missing required columns {!r} to deserialize {!r} as {}".format(
+                missing_names, list(columns), cls
+            )
+        )
+
+    names = []
+    value_columns = []
+
+    for fld, fld_type in fld_types:
+        if fld.name not in columns:
+            continue
+
+        column = columns[fld.name]
+
+        if original_isinstance(column, list):
+            column = list_deserialization(
+                List[fld_type],
+                column,
+                deserialization_func=deserialization_func,
+                is_noop_deserialization=is_noop_deserialization,
+            )
+        else:
+            values = (
+                numeric_column_values(fld_type, column)
+                if fld_type in array_typecodes
+                else None
+            )
+
+            if values is None:
+                raise DeserializationError(
+                    "Cannot deserialize column {!r} as {}".format(column, fld_type)
+                )
+
+            column = values
+
+        names.append(fld.name)
+        value_columns.append(column)
+
+    if len(set(map(len, value_columns))) > 1:
+        raise DeserializationError(
+            "Cannot deserialize columns of different lengths as {}".format(cls)
+        )
+
+    try:
+        return [cls(**dict(zip(names, row))) for row in zip(*value_columns)]
+    except TypeError:
+        raise DeserializationError(
+            "Missing one or more required columns to deserialize {!r} as {}".format(
+                list(columns), cls
+            )
+        )
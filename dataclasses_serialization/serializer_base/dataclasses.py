@@ -1,13 +1,155 @@
+import sys
+from dataclasses import MISSING, dataclass, fields
+
 from toolz import curry
 
-from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.cache import shared_cache
+from dataclasses_serialization.serializer_base.errors import (
+    DeserializationError,
+    SerializationError,
+)
+from dataclasses_serialization.serializer_base.lazy import (
+    LazyDataclass,
+    load_lazy_fields,
+)
 from dataclasses_serialization.serializer_base.noop import noop_deserialization
 from dataclasses_serialization.serializer_base.typing import (
     dataclass_field_types,
     isinstance,
+    original_isinstance,
 )
 
-__all__ = ["dict_to_dataclass"]
+__all__ = ["dataclass_to_dict", "dict_to_dataclass"]
+
+dataclass_field_defaults_cache = shared_cache()
+
+
+def dataclass_field_defaults(cls):
+    """
+    Default values of the fields of dataclass cls, by field name
+
+    Default factories are evaluated once, so fields with them may be compared
+    cheaply against their defaults. Fields without defaults are omitted.
+    """
+
+    try:
+        return dataclass_field_defaults_cache[cls]
+    except KeyError:
+        defaults = dataclass_field_defaults_cache[cls] = find_dataclass_field_defaults(
+            cls
+        )
+        return defaults
+
+
+def find_dataclass_field_defaults(cls):
+    defaults = {}
+
+    for fld in fields(cls):
+        if fld.default is not MISSING:
+            defaults[fld.name] = fld.default
+        elif fld.default_factory is not MISSING:
+            defaults[fld.name] = fld.default_factory()
+
+    return defaults
+
+
+def intern_dataclass_fields(obj, names):
+    """
+    Intern the string values of the fields of dataclass obj in names, in place
+
+    So repeated values, across many deserialized objects, share one string
+    """
+
+    dct = obj.__dict__
+
+    for name in names:
+        value = dct.get(name)
+
+        if type(value) is str:
+            dct[name] = sys.intern(value)
+
+    return obj
+
+
+def is_equal(value, other):
+    """
+    Whether value and other are of the same type, and equal
+
+    Values compared elementwise, such as numpy arrays, are only equal if identical
+    """
+
+    if value is other:
+        return True
+
+    if type(value) is not type(other):
+        return False
+
+    try:
+        equal = value == other
+    except ValueError:
+        # Such as numpy arrays of different shapes
+        return False
+
+    return getattr(equal, "shape", ()) == () and bool(equal)
+
+
+def omitted_field_defaults(cls, omit_defaults=False, omit_none=False):
+    """
+    Defaults of the fields of dataclass cls, to check with is_omitted_field
+
+    Empty if no fields are omitted
+    """
+
+    return dataclass_field_defaults(cls) if omit_defaults or omit_none else {}
+
+
+def is_omitted_field(name, value, defaults, omit_defaults=False):
+    """
+    Whether field name, with given value, is left out of serialized dataclasses
+
+    Fields equal to their default, if omit_defaults is set, or else None fields
+    defaulting to None, as with omit_none, so they are filled back in from their
+    defaults on deserialization
+    """
+
+    return (
+        name in defaults
+        and (omit_defaults or value is None)
+        and is_equal(value, defaults[name])
+    )
+
+
+@curry
+def dataclass_to_dict(obj, omit_defaults=False, omit_none=False):
+    if not isinstance(obj, dataclass):
+        raise SerializationError(
+            "Cannot serialize {} {!r} using dataclass serialization".format(
+                type(obj), obj
+            )
+        )
+
+    if original_isinstance(obj, LazyDataclass):
+        load_lazy_fields(obj)
+
+        # Loaded in the order the fields were accessed, so reordered as declared
+        fld_values = {
+            fld.name: obj.__dict__[fld.name]
+            for fld in fields(obj)
+            if fld.name in obj.__dict__
+        }
+    else:
+        fld_values = obj.__dict__
+
+    if not (omit_defaults or omit_none):
+        return dict(fld_values)
+
+    defaults = omitted_field_defaults(type(obj), omit_defaults, omit_none)
+
+    return {
+        name: value
+        for name, value in fld_values.items()
+        if not is_omitted_field(name, value, defaults, omit_defaults)
+    }
 
 
 @curry
@@ -1,3 +1,4 @@
+import sys
 from functools import partial
 from typing import Dict
 
@@ -9,8 +10,10 @@ from dataclasses_serialization.serializer_base.errors import (
     SerializationError,
 )
 from dataclasses_serialization.serializer_base.noop import (
+    all_noop_deserializable,
     noop_deserialization,
     noop_serialization,
+    uses_noop_deserialization,
 )
 from dataclasses_serialization.serializer_base.typing import (
     isinstance,
@@ -59,7 +62,18 @@ def dict_deserialization(
     obj,
     key_deserialization_func=noop_deserialization,
     value_deserialization_func=noop_deserialization,
+    is_noop_deserialization=None,
+    intern_keys=False,
 ):
+    """
+    Deserialize a dict, by deserializing each of its keys and values
+
+    If both keys and values are of types deserialized by noop_deserialization,
+    they are checked in bulk, and the dict copied, rather than rebuilt key by key.
+    If intern_keys is set, string keys are interned, so repeated keys, across
+    many deserialized dicts, share one string
+    """
+
     if not isinstance(obj, dict):
         raise DeserializationError(
             "Cannot deserialize {} {!r} using dict deserialization".format(
@@ -68,13 +82,37 @@ def dict_deserialization(
         )
 
     if type_ is dict or type_ is Dict:
-        return obj
+        return intern_dict_keys(obj) if intern_keys else obj
 
     key_type, value_type = get_args(type_)
 
-    return {
+    if uses_noop_deserialization(
+        key_type, key_deserialization_func, is_noop_deserialization
+    ) and uses_noop_deserialization(
+        value_type, value_deserialization_func, is_noop_deserialization
+    ):
+        if not (
+            all_noop_deserializable(key_type, obj.keys())
+            and all_noop_deserializable(value_type, obj.values())
+        ):
+            raise DeserializationError(
+                "Cannot deserialize {!r} to type {}".format(obj, type_)
+            )
+
+        return intern_dict_keys(obj) if intern_keys else dict(obj)
+
+    dct = {
         key_deserialization_func(key_type, key): value_deserialization_func(
             value_type, value
         )
         for key, value in obj.items()
     }
+
+    return intern_dict_keys(dct) if intern_keys else dct
+
+
+def intern_dict_keys(dct):
+    return {
+        sys.intern(key) if type(key) is str else key: value
+        for key, value in dct.items()
+    }
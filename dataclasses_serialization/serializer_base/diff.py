@@ -0,0 +1,122 @@
+from dataclasses import dataclass, fields
+
+from dataclasses_serialization.serializer_base.dataclasses import (
+    is_omitted_field,
+    omitted_field_defaults,
+)
+from dataclasses_serialization.serializer_base.errors import SerializationError
+from dataclasses_serialization.serializer_base.lazy import (
+    LazyDataclass,
+    load_lazy_fields,
+)
+from dataclasses_serialization.serializer_base.typing import (
+    isinstance,
+    original_isinstance,
+)
+
+__all__ = ["diff_objects"]
+
+
+def dataclass_fields(serializer, obj):
+    """
+    Fields of dataclass obj, by name, left out as the serializer would
+    """
+
+    if original_isinstance(obj, LazyDataclass):
+        load_lazy_fields(obj)
+
+    omit_defaults = serializer.omit_defaults
+    defaults = omitted_field_defaults(type(obj), omit_defaults, serializer.omit_none)
+
+    fld_values = {}
+
+    # Types of the fields are not needed, so unbound generics may be diffed
+    for fld in fields(obj):
+        value = getattr(obj, fld.name)
+
+        if not is_omitted_field(fld.name, value, defaults, omit_defaults):
+            fld_values[fld.name] = value
+
+    return fld_values
+
+
+def values_equal(serializer, old, new):
+    """
+    Whether old and new, of the same type, are equal
+
+    Values compared elementwise, such as numpy arrays, are compared by their
+    serialized forms
+    """
+
+    try:
+        equal = old == new
+    except ValueError:
+        # Such as numpy arrays of different shapes
+        return False
+
+    if getattr(equal, "shape", ()) != ():
+        return values_equal(
+            serializer, serializer.serialize(old), serializer.serialize(new)
+        )
+
+    return bool(equal)
+
+
+def diff_dicts(serializer, old, new, path):
+    for key, old_value in old.items():
+        if key not in new:
+            yield "remove", path + (key,), None
+        else:
+            yield from diff_values(serializer, old_value, new[key], path + (key,))
+
+    for key, new_value in new.items():
+        if key not in old:
+            yield "add", path + (key,), serializer.serialize(new_value)
+
+
+def diff_values(serializer, old, new, path):
+    if old is new:
+        return
+
+    if isinstance(old, dataclass) and type(old) is type(new):
+        yield from diff_dicts(
+            serializer,
+            dataclass_fields(serializer, old),
+            dataclass_fields(serializer, new),
+            path,
+        )
+    elif type(old) is list and type(new) is list and len(old) == len(new):
+        for i, (old_value, new_value) in enumerate(zip(old, new)):
+            yield from diff_values(serializer, old_value, new_value, path + (i,))
+    elif (
+        type(old) is dict
+        and type(new) is dict
+        and all(original_isinstance(key, str) for key in old)
+        and all(original_isinstance(key, str) for key in new)
+    ):
+        yield from diff_dicts(serializer, old, new, path)
+    elif type(old) is not type(new) or not values_equal(serializer, old, new):
+        yield "replace", path, serializer.serialize(new)
+
+
+def diff_objects(serializer, old, new):
+    """
+    Changes to make to the serialized form of dataclass old, to give that of new
+
+    A list of (operation, path, serialized value) triples, where operation is
+    "add", "replace", or "remove", and path is a tuple of field names, dict
+    keys, and list indices.
+    Fields are compared one by one, skipping those holding the same object in
+    both, and descending into dataclasses of the same type, lists of the same
+    length, and dicts with string keys.
+    Only values which differ are serialized.
+    Fields left out by the serializer, by omit_defaults or omit_none, are
+    added or removed.
+    """
+
+    if not isinstance(old, dataclass) or type(old) is not type(new):
+        raise SerializationError(
+            "Cannot diff {} {!r} and {} {!r}".format(type(old), old, type(new), new)
+        )
+
+    return list(diff_values(serializer, old, new, ()))
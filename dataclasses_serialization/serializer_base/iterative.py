@@ -0,0 +1,362 @@
+from functools import partial
+from operator import itemgetter
+
+from toolz import curry
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base.dataclasses import (
+    dataclass_to_dict,
+    intern_dataclass_fields,
+)
+from dataclasses_serialization.serializer_base.dictionary import intern_dict_keys
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.lazy import (
+    lazy_collection_deserialization,
+    set_lazy_path,
+)
+from dataclasses_serialization.serializer_base.noop import (
+    is_noop_serializable_collection,
+    noop_serialization,
+)
+from dataclasses_serialization.serializer_base.tracking import DirtyTrackingMixin
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types,
+    isinstance,
+    original_isinstance,
+)
+
+__all__ = [
+    "iterative_serialize",
+    "iterative_deserialize",
+    "iterative_deserialization_steps",
+    "list_serialization_traversal",
+    "list_deserialization_traversal",
+    "dict_serialization_traversal",
+    "dict_deserialization_traversal",
+    "noop_serializable_traversal",
+    "dataclass_serialization_traversal",
+    "dataclass_deserialization_traversal",
+    "optional_deserialization_traversal",
+]
+
+get_args = partial(get_args, evaluate=True)
+
+first = itemgetter(0)
+
+
+class Build:
+    """
+    Task to build an object from its serialized/deserialized parts
+    """
+
+    __slots__ = ("build", "parts", "out", "key")
+
+    def __init__(self, build, parts, out, key):
+        self.build = build
+        self.parts = parts
+        self.out = out
+        self.key = key
+
+
+def iterative_serialize(serializer, obj):
+    """
+    Serialize given Python object using serializer, without recursing
+
+    Objects whose serialization functions have traversals registered with the
+    serializer are split into their parts, which are serialized using an
+    explicit stack, and the serialized parts built back up.
+    All other objects are serialized by their serialization functions.
+    """
+
+    result = [None]
+    stack = [(obj, result, 0)]
+
+    while stack:
+        task = stack.pop()
+
+        if type(task) is Build:
+            task.out[task.key] = task.build(task.parts)
+            continue
+
+        obj, out, key = task
+
+        serialization_func = serializer.serialization_function(obj)
+        traversal = serializer.serialization_traversal(serialization_func)
+        split = traversal(serializer, obj) if traversal is not None else None
+
+        if split is None:
+            out[key] = serialization_func(obj)
+            continue
+
+        children, build = split
+        parts = [None] * len(children)
+
+        stack.append(Build(build, parts, out, key))
+        stack.extend(
+            (child, parts, i) for i, child in reversed(list(enumerate(children)))
+        )
+
+    return result[0]
+
+
+def iterative_deserialize(serializer, cls, serialized_obj):
+    """
+    Deserialize serialized object as given type using serializer, without recursing
+
+    As iterative_serialize, using the deserialization traversals registered
+    with the serializer.
+    Collections the serializer deserializes lazily are not traversed.
+    """
+
+    steps = iterative_deserialization_steps(serializer, cls, serialized_obj)
+
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
+
+
+def iterative_deserialization_steps(serializer, cls, serialized_obj, yield_every=None):
+    """
+    Generator deserializing serialized object as given type, as iterative_deserialize
+
+    Yields after deserializing every yield_every values, if given, so the
+    deserialization may be interleaved with other work, such as by an event
+    loop, and returns the deserialized object
+    """
+
+    result = [None]
+    stack = [(cls, serialized_obj, result, 0)]
+    values = 0
+
+    while stack:
+        task = stack.pop()
+
+        if type(task) is Build:
+            task.out[task.key] = task.build(task.parts)
+            continue
+
+        cls, serialized_obj, out, key = task
+
+        values += 1
+
+        if yield_every is not None and values % yield_every == 0:
+            yield
+
+        if serializer.lazy_collections:
+            lazy_collection = lazy_collection_deserialization(
+                cls,
+                serialized_obj,
+                deserialization_func=serializer.deserialize,
+                is_noop_deserialization=serializer.is_noop_deserialization,
+            )
+
+            if lazy_collection is not None:
+                out[key] = lazy_collection
+                continue
+
+        deserialization_func = serializer.deserialization_function(cls)
+        traversal = serializer.deserialization_traversal(deserialization_func)
+        split = (
+            traversal(serializer, cls, serialized_obj)
+            if traversal is not None
+            else None
+        )
+
+        if split is None:
+            out[key] = deserialization_func(cls, serialized_obj)
+            continue
+
+        children, build = split
+        parts = [None] * len(children)
+
+        stack.append(Build(build, parts, out, key))
+        stack.extend(
+            (child_cls, child, parts, i)
+            for i, (child_cls, child) in reversed(list(enumerate(children)))
+        )
+
+    return result[0]
+
+
+def pairs_to_dict(parts):
+    return dict(zip(parts[::2], parts[1::2]))
+
+
+def pairs_to_interned_dict(parts):
+    return intern_dict_keys(pairs_to_dict(parts))
+
+
+def list_serialization_traversal(serializer, obj):
+    """
+    Serialize a list, or other iterable, as a list of its serialized values
+    """
+
+    return list(obj), noop_serialization
+
+
+def list_deserialization_traversal(serializer, cls, obj):
+    """
+    Deserialize a list as a list of its deserialized values
+
+    Lists of types deserialized by noop_deserialization are left to the list
+    deserialization function, to be checked in bulk
+    """
+
+    if not isinstance(obj, list):
+        return None
+
+    value_types = get_args(cls)
+
+    if not value_types or serializer.is_noop_deserialization(value_types[0]):
+        return None
+
+    (value_type,) = value_types
+
+    return [(value_type, value) for value in obj], noop_serialization
+
+
+def dict_serialization_traversal(serializer, obj):
+    """
+    Serialize a dict as a dict of its serialized keys and values
+    """
+
+    return [part for item in obj.items() for part in item], pairs_to_dict
+
+
+def dict_deserialization_traversal(serializer, cls, obj):
+    """
+    Deserialize a dict as a dict of its deserialized keys and values
+
+    Dicts of types deserialized by noop_deserialization are left to the dict
+    deserialization function, to be checked in bulk
+    """
+
+    if not isinstance(obj, dict):
+        return None
+
+    key_value_types = get_args(cls)
+
+    if not key_value_types or all(
+        map(serializer.is_noop_deserialization, key_value_types)
+    ):
+        return None
+
+    key_type, value_type = key_value_types
+
+    return (
+        [
+            part
+            for key, value in obj.items()
+            for part in ((key_type, key), (value_type, value))
+        ],
+        pairs_to_interned_dict if serializer.intern_keys else pairs_to_dict,
+    )
+
+
+@curry
+def noop_serializable_traversal(traversal, primitive_types, serializer, obj):
+    """
+    Serialize a list or dict by traversal, unless serialized unchanged
+
+    Lists and dicts of primitive_types serialized by noop_serialization, as
+    decided by is_noop_serializable_collection, are left to the serialization
+    function, to be copied, rather than rebuilt value by value
+    """
+
+    if is_noop_serializable_collection(serializer, obj, primitive_types):
+        return None
+
+    return traversal(serializer, obj)
+
+
+def dataclass_serialization_traversal(serializer, obj):
+    """
+    Serialize a dataclass as a dict of its fields, as Serializer.serialize_dataclass
+
+    Left to serialize_dataclass if the serializer memoizes or makes references,
+    or if the dataclass is tracked, to reuse its unchanged fields
+    """
+
+    if (
+        serializer.memoize
+        or serializer.references
+        or original_isinstance(obj, DirtyTrackingMixin)
+    ):
+        return None
+
+    return (
+        [
+            dataclass_to_dict(
+                obj,
+                omit_defaults=serializer.omit_defaults,
+                omit_none=serializer.omit_none,
+            )
+        ],
+        first,
+    )
+
+
+def dataclass_deserialization_traversal(serializer, cls, obj):
+    """
+    Deserialize a dataclass from a dict of its fields, as dict_to_dataclass
+
+    Left to the dataclass deserialization function if the serializer makes
+    references, or if the dataclass cannot be deserialized
+    """
+
+    if serializer.references or not isinstance(obj, dict):
+        return None
+
+    try:
+        fld_types = dataclass_field_types(cls, require_bound=True)
+    except TypeError:
+        return None
+
+    fld_names = []
+    children = []
+
+    for fld, fld_type in fld_types:
+        if fld.name in obj:
+            fld_names.append(fld.name)
+            children.append((fld_type, obj[fld.name]))
+
+    def build(parts):
+        try:
+            deserialized_obj = cls(**dict(zip(fld_names, parts)))
+        except TypeError:
+            raise DeserializationError(
+                "Missing one or more required fields to deserialize {!r} as {}".format(
+                    obj, cls
+                )
+            )
+
+        if serializer.intern_fields:
+            intern_dataclass_fields(deserialized_obj, serializer.intern_fields)
+
+        if serializer.lazy_collections:
+            set_lazy_path(deserialized_obj, "")
+
+        return deserialized_obj
+
+    return children, build
+
+
+def optional_deserialization_traversal(serializer, cls, obj):
+    """
+    Deserialize an Optional, which is not None, as its non-None type
+
+    Other Unions are left to the Union deserialization function, as each of
+    their types must be tried in turn
+    """
+
+    if obj is None:
+        return None
+
+    value_types = [arg for arg in get_args(cls) if arg is not type(None)]
+
+    if len(value_types) != 1:
+        return None
+
+    return [(value_types[0], obj)], first
@@ -0,0 +1,420 @@
+import weakref
+from collections.abc import Mapping, Sequence
+from dataclasses import MISSING, fields, is_dataclass
+from functools import partial
+
+from toolz import curry
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base.cache import shared_cache
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.noop import noop_deserialization
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types,
+    get_origin,
+    isinstance,
+    original_isinstance,
+)
+
+__all__ = [
+    "lazy_dict_to_dataclass",
+    "load_lazy_fields",
+    "LazyList",
+    "LazyDict",
+    "lazy_collection_deserialization",
+]
+
+get_args = partial(get_args, evaluate=True)
+
+unloaded = object()
+missing = object()
+
+lazy_dataclass_cache = shared_cache()
+
+
+def set_lazy_path(value, path):
+    """
+    Set the path of lazy collections, in value, or in the fields of dataclass value
+
+    So errors deserializing their values can say where the values are
+    """
+
+    if original_isinstance(value, (LazyList, LazyDict)):
+        value.path = path
+    elif is_dataclass(value) and not original_isinstance(value, type):
+        for fld in fields(value):
+            fld_value = vars(value).get(fld.name)
+            set_lazy_path(
+                fld_value, "{}.{}".format(path, fld.name) if path else fld.name
+            )
+
+
+def deserialize_at_path(deserialization_func, cls, obj, path):
+    try:
+        value = deserialization_func(cls, obj)
+    except DeserializationError as e:
+        raise DeserializationError("Cannot deserialize {}: {}".format(path, e)) from e
+
+    set_lazy_path(value, path)
+
+    return value
+
+
+class LazyList(Sequence):
+    """
+    List whose values are deserialized on first access, and cached
+
+    Errors deserializing values are raised on access, with the path to the value
+    """
+
+    def __init__(self, value_type, serialized_values, deserialization_func, path=""):
+        self.value_type = value_type
+        self.serialized_values = serialized_values
+        self.deserialization_func = deserialization_func
+        self.path = path
+        self.values = [unloaded] * len(serialized_values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if original_isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self.values[index]
+
+        if value is unloaded:
+            index = index % len(self)
+            value = self.values[index] = deserialize_at_path(
+                self.deserialization_func,
+                self.value_type,
+                self.serialized_values[index],
+                "{}[{}]".format(self.path, index),
+            )
+
+        return value
+
+    def __eq__(self, other):
+        if not original_isinstance(other, (list, LazyList)):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return "LazyList({!r})".format(list(self))
+
+
+class LazyDict(Mapping):
+    """
+    Dict whose values are deserialized on first access, and cached
+
+    Keys are deserialized immediately.
+    Errors deserializing values are raised on access, with the path to the value
+    """
+
+    def __init__(
+        self,
+        key_type,
+        value_type,
+        serialized_dict,
+        deserialization_func,
+        path="",
+    ):
+        self.value_type = value_type
+        self.deserialization_func = deserialization_func
+        self.path = path
+        self.serialized_values = {
+            deserialization_func(key_type, key): value
+            for key, value in serialized_dict.items()
+        }
+        self.values = {}
+
+    def __len__(self):
+        return len(self.serialized_values)
+
+    def __iter__(self):
+        return iter(self.serialized_values)
+
+    def __contains__(self, key):
+        return key in self.serialized_values
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+
+        value = self.values[key] = deserialize_at_path(
+            self.deserialization_func,
+            self.value_type,
+            self.serialized_values[key],
+            "{}[{!r}]".format(self.path, key),
+        )
+
+        return value
+
+    def __repr__(self):
+        return "LazyDict({!r})".format(dict(self))
+
+
+def lazy_collection_deserialization(
+    cls, obj, deserialization_func=noop_deserialization, is_noop_deserialization=None
+):
+    """
+    Deserialize List[X] as a LazyList, and Dict[K, V] as a LazyDict
+
+    Returns None for other types, and for collections of types deserialized by
+    noop_deserialization, which are cheap to deserialize immediately
+    """
+
+    origin = get_origin(cls)
+
+    if origin is list and original_isinstance(obj, list):
+        value_types = get_args(cls)
+    elif origin is dict and original_isinstance(obj, dict):
+        value_types = get_args(cls)[1:]
+    else:
+        return None
+
+    if not value_types or (
+        is_noop_deserialization is not None and is_noop_deserialization(value_types[0])
+    ):
+        return None
+
+    if origin is list:
+        return LazyList(value_types[0], obj, deserialization_func)
+
+    return LazyDict(get_args(cls)[0], value_types[0], obj, deserialization_func)
+
+
+class LazyDataclass:
+    """
+    Base of dataclasses whose fields are deserialized on first access
+
+    The serialized fields waiting to be deserialized are kept in slots, so do
+    not appear in the dataclass's __dict__.
+    Pickled and copied as an instance of the original dataclass, with all of its
+    fields deserialized
+    """
+
+    __slots__ = ("lazy_fields", "lazy_deserialization_func")
+
+    def __reduce__(self):
+        load_lazy_fields(self)
+
+        return new_instance, (type(self).__bases__[1],), dict(self.__dict__)
+
+
+def new_instance(cls):
+    return object.__new__(cls)
+
+
+def load_lazy_field(obj, name, lazy_fields):
+    fld_type, serialized_value = lazy_fields.pop(name)
+    value = deserialize_at_path(
+        obj.lazy_deserialization_func, fld_type, serialized_value, name
+    )
+
+    object.__setattr__(obj, name, value)
+
+    return value
+
+
+def class_attribute(cls, name):
+    """
+    The attribute name of cls, as found in its namespace or that of its bases
+    """
+
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+
+    return missing
+
+
+class LazyField:
+    """
+    Data descriptor for a field of a lazily deserialized dataclass
+
+    As a data descriptor, it takes precedence over the instance's __dict__, and
+    over class-level defaults, so fields waiting to be deserialized are always
+    found, even where the dataclass has a default for them.
+    Values are stored by the attribute of the dataclass it overrides, if that is
+    itself a data descriptor, such as a slot, or else in the instance's __dict__
+    """
+
+    __slots__ = ("name", "attribute", "is_data_descriptor")
+
+    def __init__(self, name, attribute):
+        self.name = name
+        self.attribute = attribute
+        self.is_data_descriptor = hasattr(attribute, "__set__")
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            if self.attribute is missing:
+                raise AttributeError(self.name)
+
+            return self.attribute
+
+        lazy_fields = getattr(obj, "lazy_fields", None)
+
+        if lazy_fields and self.name in lazy_fields:
+            return load_lazy_field(obj, self.name, lazy_fields)
+
+        if self.is_data_descriptor:
+            return self.attribute.__get__(obj, objtype)
+
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            pass
+
+        if self.attribute is missing:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(
+                    type(obj).__name__, self.name
+                )
+            )
+
+        return self.attribute
+
+    def __set__(self, obj, value):
+        lazy_fields = getattr(obj, "lazy_fields", None)
+
+        if lazy_fields:
+            lazy_fields.pop(self.name, None)
+
+        if self.is_data_descriptor:
+            self.attribute.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+    def __delete__(self, obj):
+        if self.is_data_descriptor:
+            self.attribute.__delete__(obj)
+        else:
+            del obj.__dict__[self.name]
+
+
+def lazy_dataclass_eq(self, other):
+    cls = type(self).__bases__[1]
+
+    if not original_isinstance(other, cls):
+        return NotImplemented
+
+    compared_fields = [fld.name for fld in fields(cls) if fld.compare]
+
+    return [getattr(self, name) for name in compared_fields] == [
+        getattr(other, name) for name in compared_fields
+    ]
+
+
+def lazy_dataclass(cls):
+    """
+    Subclass of dataclass cls, whose fields are deserialized on first access
+
+    Instances compare equal to those of cls with equal fields.
+    Raises TypeError if cls has __slots__, which cannot be combined with those
+    of LazyDataclass
+    """
+
+    # Cached by weak reference, as the subclass refers to cls, so would keep it
+    # alive, and rebuilt if released once it has no instances
+    try:
+        subclass = lazy_dataclass_cache[cls]()
+    except KeyError:
+        subclass = None
+
+    if subclass is None:
+        subclass = find_lazy_dataclass(cls)
+        lazy_dataclass_cache[cls] = weakref.ref(subclass)
+
+    return subclass
+
+
+def find_lazy_dataclass(cls):
+    namespace = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__hash__": cls.__hash__,
+    }
+
+    if cls.__dataclass_params__.eq:
+        namespace["__eq__"] = lazy_dataclass_eq
+
+    for fld in fields(cls):
+        namespace[fld.name] = LazyField(fld.name, class_attribute(cls, fld.name))
+
+    return type(cls.__name__, (LazyDataclass, cls), namespace)
+
+
+def load_lazy_fields(obj):
+    """
+    Deserialize all fields of a lazily deserialized dataclass not yet accessed
+    """
+
+    lazy_fields = getattr(obj, "lazy_fields", None)
+
+    while lazy_fields:
+        load_lazy_field(obj, next(iter(lazy_fields)), lazy_fields)
+
+
+@curry
+def lazy_dict_to_dataclass(
+    cls, dct, deserialization_func=noop_deserialization, fields=()
+):
+    """
+    As dict_to_dataclass, but deserializing fields on first access
+
+    Fields named in fields are deserialized immediately, so only those need be
+    deserialized for objects where just a few fields are used.
+    Fields missing from dct take their defaults, but __post_init__ is not run,
+    as it may use any field, so would deserialize them all.
+    Dataclasses with __slots__ cannot be deserialized lazily.
+    """
+
+    if not isinstance(dct, dict):
+        raise DeserializationError(
+            "Cannot deserialize {} {!r} using {}".format(
+                type(dct), dct, lazy_dict_to_dataclass
+            )
+        )
+
+    try:
+        fld_types = dataclass_field_types(cls, require_bound=True)
+    except TypeError:
+        raise DeserializationError("Cannot deserialize unbound generic {}".format(cls))
+
+    try:
+        obj = object.__new__(lazy_dataclass(get_origin(cls) or cls))
+    except TypeError:
+        raise DeserializationError(
+            "Cannot lazily deserialize {}, as it has __slots__".format(cls)
+        )
+
+    lazy_fields = {}
+
+    for fld, fld_type in fld_types:
+        if fld.name in dct:
+            if fld.name in fields:
+                value = deserialization_func(fld_type, dct[fld.name])
+                object.__setattr__(obj, fld.name, value)
+            else:
+                lazy_fields[fld.name] = (fld_type, dct[fld.name])
+        elif fld.default is not MISSING:
+            object.__setattr__(obj, fld.name, fld.default)
+        elif fld.default_factory is not MISSING:
+            object.__setattr__(obj, fld.name, fld.default_factory())
+        elif fld.init:
+            raise DeserializationError(
+                "Missing one or more required fields to deserialize {!r} as {}".format(
+                    dct, cls
+                )
+            )
+
+    object.__setattr__(obj, "lazy_fields", lazy_fields)
+    object.__setattr__(obj, "lazy_deserialization_func", deserialization_func)
+
+    return obj
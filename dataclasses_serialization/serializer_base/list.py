@@ -5,7 +5,11 @@ from toolz import curry
 from typing_inspect import get_args
 
 from dataclasses_serialization.serializer_base.errors import DeserializationError
-from dataclasses_serialization.serializer_base.noop import noop_deserialization
+from dataclasses_serialization.serializer_base.noop import (
+    all_noop_deserializable,
+    noop_deserialization,
+    uses_noop_deserialization,
+)
 from dataclasses_serialization.serializer_base.typing import isinstance
 
 __all__ = ["list_deserialization"]
@@ -14,7 +18,16 @@ get_args = partial(get_args, evaluate=True)
 
 
 @curry
-def list_deserialization(type_, obj, deserialization_func=noop_deserialization):
+def list_deserialization(
+    type_, obj, deserialization_func=noop_deserialization, is_noop_deserialization=None
+):
+    """
+    Deserialize a list, by deserializing each of its values
+
+    Values of types deserialized by noop_deserialization are checked in bulk,
+    and the list copied, rather than rebuilt value by value
+    """
+
     if not isinstance(obj, list):
         raise DeserializationError(
             "Cannot deserialize {} {!r} using list deserialization".format(
@@ -27,4 +40,14 @@ def list_deserialization(type_, obj, deserialization_func=noop_deserialization):
 
     (value_type,) = get_args(type_)
 
+    if uses_noop_deserialization(
+        value_type, deserialization_func, is_noop_deserialization
+    ):
+        if not all_noop_deserializable(value_type, obj):
+            raise DeserializationError(
+                "Cannot deserialize {!r} to type {}".format(obj, type_)
+            )
+
+        return list(obj)
+
     return [deserialization_func(value_type, value) for value in obj]
@@ -0,0 +1,72 @@
+import numpy
+from toolz import curry
+
+from dataclasses_serialization.serializer_base.errors import (
+    DeserializationError,
+    SerializationError,
+)
+from dataclasses_serialization.serializer_base.noop import (
+    noop_deserialization,
+    noop_serialization,
+)
+from dataclasses_serialization.serializer_base.typing import isinstance
+
+__all__ = ["ndarray_serialization", "ndarray_deserialization"]
+
+
+@curry
+def ndarray_serialization(obj, data_serialization_func=noop_serialization):
+    """
+    Serialize a NumPy array as its dtype, shape, and raw data in C order
+
+    The raw data is passed to data_serialization_func as a memoryview, which
+    is only a copy of the array data if the array is not C contiguous
+    """
+
+    if not isinstance(obj, numpy.ndarray):
+        raise SerializationError(
+            "Cannot serialize {} {!r} using ndarray serialization".format(
+                type(obj), obj
+            )
+        )
+
+    if obj.dtype.hasobject or obj.dtype.fields is not None:
+        raise SerializationError(
+            "Cannot serialize ndarray of dtype {}".format(obj.dtype)
+        )
+
+    data = numpy.ascontiguousarray(obj).reshape(-1).view(numpy.uint8)
+
+    return {
+        "dtype": obj.dtype.str,
+        "shape": list(obj.shape),
+        "data": data_serialization_func(memoryview(data)),
+    }
+
+
+@curry
+def ndarray_deserialization(cls, obj, data_deserialization_func=noop_deserialization):
+    """
+    Deserialize a NumPy array from its dtype, shape, and raw data in C order
+
+    The array is a read-only view of the bytes returned by
+    data_deserialization_func, so is created without copying
+    """
+
+    if not isinstance(obj, dict) or set(obj) != {"dtype", "shape", "data"}:
+        raise DeserializationError(
+            "Cannot deserialize {} {!r} using ndarray deserialization".format(
+                type(obj), obj
+            )
+        )
+
+    try:
+        data = data_deserialization_func(bytes, obj["data"])
+
+        return numpy.frombuffer(data, dtype=numpy.dtype(obj["dtype"])).reshape(
+            obj["shape"]
+        )
+    except (TypeError, ValueError):
+        raise DeserializationError(
+            "Cannot deserialize {!r} to type {}".format(obj, cls)
+        )
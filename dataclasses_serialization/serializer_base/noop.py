@@ -1,9 +1,18 @@
 from toolz import curry
 
 from dataclasses_serialization.serializer_base.errors import DeserializationError
-from dataclasses_serialization.serializer_base.typing import isinstance
+from dataclasses_serialization.serializer_base.typing import (
+    get_origin,
+    isinstance,
+    original_isinstance,
+    original_issubclass,
+)
 
-__all__ = ["noop_serialization", "noop_deserialization"]
+__all__ = [
+    "noop_serialization",
+    "noop_deserialization",
+    "is_noop_serializable_collection",
+]
 
 
 def noop_serialization(obj):
@@ -18,3 +27,67 @@ def noop_deserialization(cls, obj):
         )
 
     return obj
+
+
+def uses_noop_deserialization(
+    cls, deserialization_func=noop_deserialization, is_noop_deserialization=None
+):
+    """
+    Whether objects of type cls would be deserialized by noop_deserialization
+
+    Either as deserialization_func, or as decided by is_noop_deserialization,
+    which takes a type, such as Serializer.is_noop_deserialization
+    """
+
+    if deserialization_func is noop_deserialization:
+        return True
+
+    return is_noop_deserialization is not None and is_noop_deserialization(cls)
+
+
+def all_noop_deserializable(cls, objs):
+    """
+    Whether noop_deserialization would accept all objs as type cls
+
+    For plain classes, the types of objs are checked in bulk, rather than by
+    checking each object individually
+    """
+
+    if not original_isinstance(cls, type) or get_origin(cls) is not None:
+        return all(isinstance(obj, cls) for obj in objs)
+
+    return all(original_issubclass(obj_type, cls) for obj_type in set(map(type, objs)))
+
+
+def all_noop_serializable(serializer, objs, primitive_types):
+    """
+    Whether objs are all of primitive_types serialized by noop_serialization
+
+    Checked by the types of objs in bulk, rather than object by object
+    """
+
+    obj_types = set(map(type, objs))
+
+    return obj_types <= primitive_types and all(
+        map(serializer.is_noop_serialization_type, obj_types)
+    )
+
+
+def is_noop_serializable_collection(serializer, obj, primitive_types):
+    """
+    Whether a list or dict obj would be serialized by serializer unchanged
+
+    That is, whether all its values, and keys, are of primitive_types, such as
+    the types native to the serialization format, serialized by
+    noop_serialization, so obj may be copied, rather than rebuilt value by value
+    """
+
+    if type(obj) is dict:
+        return all_noop_serializable(
+            serializer, obj.keys(), primitive_types
+        ) and all_noop_serializable(serializer, obj.values(), primitive_types)
+
+    if type(obj) is list:
+        return all_noop_serializable(serializer, obj, primitive_types)
+
+    return False
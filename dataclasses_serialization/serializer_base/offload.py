@@ -0,0 +1,92 @@
+import sys
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from dataclasses_serialization.serializer_base.serializer import serializer_reference
+from dataclasses_serialization.serializer_base.typing import (
+    isinstance,
+    original_isinstance,
+)
+
+__all__ = ["Offloader", "estimate_size"]
+
+sized_types = (str, bytes, bytearray, memoryview, list, tuple, dict, set, frozenset)
+
+
+def estimate_size(obj):
+    """
+    Cheaply estimate the work needed to serialize or deserialize an object
+
+    The length of strings and containers, or the total length of those in a
+    dataclass's fields, without descending any further
+    """
+
+    if isinstance(obj, sized_types):
+        return len(obj)
+
+    if isinstance(obj, dataclass):
+        return sum(
+            len(value) if isinstance(value, sized_types) else 1
+            for value in (getattr(obj, fld.name) for fld in fields(obj))
+        )
+
+    return 1
+
+
+@dataclass
+class Offloader:
+    """
+    Run serialization inline if small, or in an executor if large
+
+    Awaiting large serializations in an executor keeps them from blocking the
+    event loop, at the cost of overhead which is only worthwhile for objects
+    whose estimated size is at least threshold.
+    If executor is None, the event loop's default executor is used.
+    """
+
+    executor: "Optional[concurrent.futures.Executor]" = None
+    threshold: int = 10000
+    size_estimate: callable = estimate_size
+
+    def runs_in_processes(self):
+        # Checked without importing concurrent.futures.process, unless already imported
+        process = sys.modules.get("concurrent.futures.process")
+
+        return process is not None and original_isinstance(
+            self.executor, process.ProcessPoolExecutor
+        )
+
+    async def run(self, size, serializer, method_name, *args):
+        if size < self.threshold:
+            return getattr(serializer, method_name)(*args)
+
+        # Deferred, as asyncio is slow to import
+        import asyncio
+
+        if self.runs_in_processes():
+            # Sent to the worker processes by name, to be found by importing its module
+            serializer = serializer_reference(serializer)
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, getattr(serializer, method_name), *args
+        )
+
+    async def serialize(self, serializer, obj):
+        """
+        Serialize given Python object using serializer
+        """
+
+        return await self.run(self.size_estimate(obj), serializer, "serialize", obj)
+
+    async def deserialize(self, serializer, cls, serialized_obj):
+        """
+        Deserialize serialized object as given type using serializer
+        """
+
+        return await self.run(
+            self.size_estimate(serialized_obj),
+            serializer,
+            "deserialize",
+            cls,
+            serialized_obj,
+        )
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from typing import Union
+
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base.cache import (
+    LRUCache,
+    default_maxsize,
+    shared_cache,
+)
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types,
+    get_origin,
+    issubclass,
+)
+
+__all__ = ["PayloadCache", "is_immutable_type"]
+
+get_args = partial(get_args, evaluate=True)
+
+immutable_types = frozenset(
+    {str, int, float, complex, bool, bytes, type(None), datetime, date, time, timedelta}
+)
+
+immutable_type_cache = shared_cache()
+
+
+def find_is_immutable_type(cls, seen):
+    if cls in immutable_types:
+        return True
+
+    if cls in seen:
+        # Recursive types are immutable if the rest of their fields are
+        return True
+
+    seen = seen | {cls}
+    origin = get_origin(cls)
+
+    if origin is Union or origin is frozenset:
+        return all(find_is_immutable_type(arg, seen) for arg in get_args(cls))
+
+    if origin is tuple:
+        args = [arg for arg in get_args(cls) if arg is not Ellipsis]
+
+        return bool(args) and all(find_is_immutable_type(arg, seen) for arg in args)
+
+    try:
+        if not issubclass(origin or cls, dataclass):
+            return False
+
+        fld_types = dataclass_field_types(cls, require_bound=True)
+    except TypeError:
+        return False
+
+    return (origin or cls).__dataclass_params__.frozen and all(
+        find_is_immutable_type(fld_type, seen) for _, fld_type in fld_types
+    )
+
+
+def is_immutable_type(cls):
+    """
+    Whether objects of type cls are immutable, so may be shared
+
+    Primitives, frozen dataclasses whose fields are all of immutable types,
+    and Tuples, FrozenSets, and Unions of immutable types
+    """
+
+    try:
+        return immutable_type_cache[cls]
+    except KeyError:
+        immutable = immutable_type_cache[cls] = find_is_immutable_type(cls, frozenset())
+        return immutable
+    except TypeError:
+        # Unhashable types cannot be cached
+        return find_is_immutable_type(cls, frozenset())
+
+
+class PayloadCache:
+    """
+    Objects deserialized from raw payloads, by type and payload
+
+    So repeated payloads are not parsed again.
+    Only str and bytes payloads of at most max_payload_size, deserialized to
+    immutable types, are cached, as the deserialized objects are shared.
+    At most maxsize objects are held, evicting the least recently used.
+    """
+
+    def __init__(self, maxsize=default_maxsize, max_payload_size=4096):
+        self.cache = LRUCache(maxsize=maxsize)
+        self.max_payload_size = max_payload_size
+
+    def deserialize(self, deserialization_func, cls, payload):
+        """
+        Deserialize payload as type cls using deserialization_func, unless already cached
+        """
+
+        payload_type = type(payload)
+
+        if (
+            not (payload_type is str or payload_type is bytes)
+            or len(payload) > self.max_payload_size
+            or not is_immutable_type(cls)
+        ):
+            return deserialization_func(cls, payload)
+
+        key = (cls, payload)
+
+        try:
+            return self.cache[key]
+        except KeyError:
+            obj = self.cache[key] = deserialization_func(cls, payload)
+            return obj
+        except TypeError:
+            # Unhashable types cannot be cached
+            return deserialization_func(cls, payload)
+
+    def clear(self):
+        self.cache.clear()
+
+    @property
+    def stats(self):
+        return self.cache.stats
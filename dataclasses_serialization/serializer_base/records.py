@@ -0,0 +1,125 @@
+import struct
+from collections.abc import Sequence
+from mmap import ACCESS_READ, mmap
+
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+
+__all__ = ["RecordStore", "write_records"]
+
+records_magic = b"DCSREC01"
+
+offset_struct = struct.Struct("<Q")
+footer_struct = struct.Struct("<QQ8s")
+
+
+def write_records(serializer, objs, file):
+    """
+    Write objs, serialized to strings by serializer, as a record store file
+
+    The records are written one after another, followed by an index of their
+    offsets, so objs may be any iterable, and need not all be held in memory.
+    file may be a path, or a binary file object.
+    str records, as from JSONStrSerializer, are encoded as UTF-8.
+    Returns the number of records written.
+    """
+
+    if not hasattr(file, "write"):
+        with open(file, "wb") as f:
+            return write_records(serializer, objs, f)
+
+    offsets = [0]
+
+    for obj in objs:
+        record = serializer.serialize(obj)
+
+        if isinstance(record, str):
+            record = record.encode("utf-8")
+
+        file.write(record)
+        offsets.append(offsets[-1] + len(record))
+
+    for offset in offsets:
+        file.write(offset_struct.pack(offset))
+
+    file.write(footer_struct.pack(offsets[-1], len(offsets) - 1, records_magic))
+
+    return len(offsets) - 1
+
+
+class RecordStore(Sequence):
+    """
+    Read-only sequence of the records of a file written by write_records
+
+    The file is memory mapped, and each record deserialized as type cls by
+    serializer when indexed, found in constant time from the index, without
+    reading the other records.
+    Processes opening the same file share its pages, rather than each holding
+    their own copy of the records.
+    """
+
+    def __init__(self, serializer, cls, file):
+        self.serializer = serializer
+        self.cls = cls
+
+        try:
+            if hasattr(file, "fileno"):
+                self.mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+            else:
+                with open(file, "rb") as f:
+                    self.mmap = mmap(f.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            raise DeserializationError("{!r} is not a record store".format(file))
+
+        try:
+            self.index_offset, self.length, magic = footer_struct.unpack_from(
+                self.mmap, len(self.mmap) - footer_struct.size
+            )
+        except struct.error:
+            magic = None
+
+        if (
+            magic != records_magic
+            or self.index_offset + (self.length + 1) * offset_struct.size
+            != len(self.mmap) - footer_struct.size
+        ):
+            self.mmap.close()
+            raise DeserializationError("{!r} is not a record store".format(file))
+
+    def record(self, index):
+        """
+        The serialized record at index, as bytes
+        """
+
+        if index < 0:
+            index += self.length
+
+        if not 0 <= index < self.length:
+            raise IndexError("Record index out of range")
+
+        start, end = struct.unpack_from(
+            "<QQ", self.mmap, self.index_offset + index * offset_struct.size
+        )
+
+        return self.mmap[start:end]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+
+        return self.serializer.deserialize(self.cls, self.record(index))
+
+    def __len__(self):
+        return self.length
+
+    def close(self):
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return "<RecordStore of {} {} records>".format(self.length, self.cls)
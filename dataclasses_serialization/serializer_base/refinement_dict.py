@@ -1,10 +1,8 @@
 from dataclasses import dataclass, field
-from functools import partial
 from operator import le
 from typing import Optional
 
-from more_properties import cached_property
-from toposort import toposort
+from dataclasses_serialization.serializer_base.cache import LRUCache, default_maxsize
 
 __all__ = ["RefinementDict", "AmbiguousKeyError"]
 
@@ -22,6 +20,10 @@ class RefinementDict:
     the most precise collection containing that element.
 
     A KeyError is raised if no such collection is found.
+
+    If cache_lookups is set, the collection found for each element is cached,
+    in an LRUCache of cache_size, so elements must be hashable, and is_element must depend
+    only on the element's identity.
     """
 
     lookup: dict = field(default_factory=dict)
@@ -30,7 +32,20 @@ class RefinementDict:
     is_subset: callable = le
     is_element: callable = lambda elem, st: elem in st
 
-    @cached_property
+    cache_lookups: bool = False
+    cache_size: int = default_maxsize
+
+    cached_dependency_orders: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    cached_lookups: LRUCache = field(init=False, repr=False, compare=False)
+    cached_subset_lookups: LRUCache = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.cached_lookups = LRUCache(maxsize=self.cache_size)
+        self.cached_subset_lookups = LRUCache(maxsize=self.cache_size)
+
+    @property
     def dependencies(self):
         return {
             st: {
@@ -41,38 +56,147 @@ class RefinementDict:
             for st in self.lookup
         }
 
-    @dependencies.deleter
-    def dependencies(self):
-        del self.dependency_orders
-
-    @partial(cached_property, fdel=lambda self: None)
+    @property
     def dependency_orders(self):
-        return list(toposort(self.dependencies))
+        """
+        Keys grouped in order of precision
+
+        Computed on first lookup after the keys change
+        """
+
+        if self.cached_dependency_orders is None:
+            # Deferred, so only imported once lookups are needed
+            from toposort import toposort
+
+            self.cached_dependency_orders = list(toposort(self.dependencies))
+
+        return self.cached_dependency_orders
+
+    def find_key(self, key, is_element=None):
+        """
+        The most precise collection containing key, or None if there is none
+        """
+
+        if is_element is None:
+            is_element = self.is_element
 
-    def __getitem__(self, key):
         for order in self.dependency_orders:
-            ancestors = {st for st in order if self.is_element(key, st)}
+            ancestors = {st for st in order if is_element(key, st)}
 
             if len(ancestors) > 1:
                 raise AmbiguousKeyError(f"{key!r} in all of {ancestors!r}")
 
             if ancestors:
-                return self.lookup[ancestors.pop()]
+                return ancestors.pop()
+
+        return None
+
+    def find_cached_key(self, key):
+        try:
+            return self.cached_lookups[key]
+        except KeyError:
+            st = self.cached_lookups[key] = self.find_key(key)
+            return st
+        except TypeError:
+            # Unhashable keys cannot be cached
+            return self.find_key(key)
+
+    def __getitem__(self, key):
+        if self.cache_lookups:
+            st = self.find_cached_key(key)
+        else:
+            st = self.find_key(key)
+
+        if st is not None:
+            return self.lookup[st]
 
         if self.fallback is not None:
             return self.fallback[key]
 
         raise KeyError(f"{key!r}")
 
+    def get_subset(self, subset):
+        """
+        The value associated with the most precise collection containing all of subset
+
+        The collection found for each subset is cached, if subset is hashable
+        """
+
+        try:
+            st = self.cached_subset_lookups[subset]
+        except KeyError:
+            st = self.cached_subset_lookups[subset] = self.find_key(
+                subset, is_element=self.is_subset
+            )
+        except TypeError:
+            st = self.find_key(subset, is_element=self.is_subset)
+
+        if st is not None:
+            return self.lookup[st]
+
+        if self.fallback is not None:
+            return self.fallback.get_subset(subset)
+
+        raise KeyError(f"{subset!r}")
+
     def __setitem__(self, key, value):
-        del self.dependencies
+        self.cached_dependency_orders = None
+        self.cached_lookups.clear()
+        self.cached_subset_lookups.clear()
 
         self.lookup[key] = value
 
     def setdefault(self, key, value):
         if self.fallback is None:
             self.fallback = RefinementDict(
-                is_subset=self.is_subset, is_element=self.is_element
+                is_subset=self.is_subset,
+                is_element=self.is_element,
+                cache_lookups=self.cache_lookups,
+                cache_size=self.cache_size,
             )
 
         self.fallback[key] = value
+
+    def clear_cache(self):
+        """
+        Clear the cached lookups of this dictionary, and its fallbacks
+        """
+
+        self.cached_dependency_orders = None
+        self.cached_lookups.clear()
+        self.cached_subset_lookups.clear()
+
+        if self.fallback is not None:
+            self.fallback.clear_cache()
+
+    def cache_state(self):
+        """
+        The cached lookups of this dictionary, and its fallbacks
+
+        Picklable if the keys of the dictionary, and those looked up, are
+        """
+
+        return (
+            set(self.lookup),
+            self.cached_dependency_orders,
+            dict(self.cached_lookups.items()),
+            self.fallback.cache_state() if self.fallback is not None else None,
+        )
+
+    def load_cache_state(self, state):
+        """
+        Restore cached lookups from cache_state
+
+        Caches from dictionaries with different keys are ignored
+        """
+
+        keys, dependency_orders, cached_lookups, fallback_state = state
+
+        if keys == set(self.lookup):
+            if dependency_orders is not None:
+                self.cached_dependency_orders = dependency_orders
+
+            self.cached_lookups.update(cached_lookups)
+
+        if self.fallback is not None and fallback_state is not None:
+            self.fallback.load_cache_state(fallback_state)
@@ -1,56 +1,291 @@
+import sys
+import threading
+import weakref
+from copy import copy, deepcopy
 from dataclasses import dataclass
-from typing import Union
+from functools import partial
+from importlib import import_module
+from typing import Optional, Union
 
 from toolz import curry
 
-from dataclasses_serialization.serializer_base.dataclasses import dict_to_dataclass
-from dataclasses_serialization.serializer_base.dictionary import dict_serialization
+from dataclasses_serialization.serializer_base.cache import default_maxsize
+from dataclasses_serialization.serializer_base.columnar import (
+    columns_to_dataclasses,
+    dataclasses_to_columns,
+)
+from dataclasses_serialization.serializer_base.dataclasses import (
+    dataclass_field_defaults,
+    dataclass_field_defaults_cache,
+    dataclass_to_dict,
+    dict_to_dataclass,
+    intern_dataclass_fields,
+)
+from dataclasses_serialization.serializer_base.diff import diff_objects
 from dataclasses_serialization.serializer_base.errors import (
     DeserializationError,
     SerializationError,
 )
+from dataclasses_serialization.serializer_base.iterative import (
+    dataclass_deserialization_traversal,
+    dataclass_serialization_traversal,
+    iterative_deserialize,
+    iterative_serialize,
+    optional_deserialization_traversal,
+)
+from dataclasses_serialization.serializer_base.lazy import (
+    LazyDict,
+    LazyList,
+    lazy_collection_deserialization,
+    lazy_dict_to_dataclass,
+    set_lazy_path,
+)
+from dataclasses_serialization.serializer_base.noop import (
+    noop_deserialization,
+    noop_serialization,
+)
+from dataclasses_serialization.serializer_base.payload import (
+    PayloadCache,
+    immutable_type_cache,
+)
 from dataclasses_serialization.serializer_base.refinement_dict import RefinementDict
-from dataclasses_serialization.serializer_base.typing import isinstance, issubclass
+from dataclasses_serialization.serializer_base.tracking import (
+    DirtyTrackingMixin,
+    serialize_tracked_dataclass,
+)
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types,
+    dataclass_field_types_cache,
+    get_args,
+    get_origin,
+    isinstance,
+    issubclass,
+    load_dataclass_field_types,
+    original_isinstance,
+)
 from dataclasses_serialization.serializer_base.union import union_deserialization
 
-__all__ = ["Serializer"]
+__all__ = [
+    "Serializer",
+    "SerializerPlans",
+    "SerializerReference",
+    "serializer_reference",
+]
+
+
+@dataclass(frozen=True)
+class SerializerReference:
+    """
+    Picklable reference to a serializer assigned to a module global
+
+    Found by importing the module, such as in worker processes, as serializers
+    may not themselves be picklable, as with serializers registering lambdas
+    """
+
+    module_name: str
+    name: str
+
+    def resolve(self):
+        return getattr(import_module(self.module_name), self.name)
+
+    def serialize(self, obj):
+        return self.resolve().serialize(obj)
+
+    def deserialize(self, cls, serialized_obj):
+        return self.resolve().deserialize(cls, serialized_obj)
+
+    def load_plans(self, plans):
+        return self.resolve().load_plans(plans)
+
+
+def serializer_reference(serializer):
+    """
+    Reference to serializer, by the name of the module global it is assigned to
+
+    Raises ValueError if it is not assigned to a global of the module which
+    created it
+    """
+
+    module = sys.modules.get(serializer.module_name)
+
+    for name, value in vars(module).items() if module is not None else ():
+        if value is serializer:
+            return SerializerReference(serializer.module_name, name)
+
+    raise ValueError(
+        "Serializer not assigned to a global of module {}".format(
+            serializer.module_name
+        )
+    )
+
+
+@dataclass
+class SerializerPlans:
+    """
+    Precompiled lookups of a Serializer, and field types of dataclasses
+
+    Picklable if the types they were compiled for are
+    """
+
+    serialization_functions: tuple
+    deserialization_functions: tuple
+    dataclass_field_types: dict
 
 
 @dataclass
 class Serializer:
     serialization_functions: RefinementDict
     deserialization_functions: RefinementDict
+    omit_defaults: bool = False
+    omit_none: bool = False
+    memoize: bool = False
+    references: bool = False
+    iterative: bool = False
+    lazy_collections: bool = False
+    patch_function: callable = list
+    cache_size: int = default_maxsize
+    payload_cache: Optional[PayloadCache] = None
+    intern_keys: bool = False
+    intern_fields: frozenset = frozenset()
 
-    def __init__(self, serialization_functions: dict, deserialization_functions: dict):
+    def __init__(
+        self,
+        serialization_functions: dict,
+        deserialization_functions: dict,
+        omit_defaults: bool = False,
+        omit_none: bool = False,
+        memoize: bool = False,
+        references: bool = False,
+        iterative: bool = False,
+        lazy_collections: bool = False,
+        patch_function: callable = list,
+        cache_size: int = default_maxsize,
+        payload_cache: Optional[PayloadCache] = None,
+        intern_keys: bool = False,
+        intern_fields: frozenset = frozenset(),
+    ):
         self.serialization_functions = RefinementDict(
-            serialization_functions, is_subset=issubclass, is_element=isinstance
+            serialization_functions,
+            is_subset=issubclass,
+            is_element=isinstance,
+            cache_size=cache_size,
         )
         self.deserialization_functions = RefinementDict(
-            deserialization_functions, is_subset=issubclass, is_element=issubclass
+            deserialization_functions,
+            is_subset=issubclass,
+            is_element=issubclass,
+            cache_lookups=True,
+            cache_size=cache_size,
+        )
+        self.omit_defaults = omit_defaults
+        self.omit_none = omit_none
+        self.memoize = memoize
+        self.references = references
+        self.iterative = iterative
+        self.lazy_collections = lazy_collections
+        self.patch_function = patch_function
+        self.cache_size = cache_size
+        self.payload_cache = payload_cache
+        self.intern_keys = intern_keys
+        self.intern_fields = frozenset(intern_fields)
+        self.import_registrations = {}
+        self.import_registrations_lock = threading.RLock()
+        self.checked_modules_count = 0
+        self.memos = threading.local()
+        self.tracking_caches = {}
+        self.serialization_traversals = {}
+        self.deserialization_traversals = {}
+
+        # So the serializer may be found by serializer_reference, if a global of this module
+        self.module_name = sys._getframe(1).f_globals.get("__name__")
+
+        serialize_dataclass = self.serialize_dataclass
+        self.serialization_functions.setdefault(dataclass, serialize_dataclass)
+        self.register_serialization_traversal(
+            serialize_dataclass, dataclass_serialization_traversal
+        )
+
+        deserialize_dataclass = self.deserialize_dataclass
+        self.deserialization_functions.setdefault(dataclass, deserialize_dataclass)
+        self.register_deserialization_traversal(
+            deserialize_dataclass, dataclass_deserialization_traversal
         )
 
         self.serialization_functions.setdefault(
-            dataclass, lambda obj: self.serialize(dict_serialization(obj.__dict__))
+            LazyList, lambda obj: self.serialize(list(obj))
+        )
+        self.serialization_functions.setdefault(
+            LazyDict, lambda obj: self.serialize(dict(obj))
         )
 
-        self.deserialization_functions.setdefault(
-            dataclass, dict_to_dataclass(deserialization_func=self.deserialize)
+        deserialize_union = union_deserialization(deserialization_func=self.deserialize)
+        self.deserialization_functions.setdefault(Union, deserialize_union)
+        self.register_deserialization_traversal(
+            deserialize_union, optional_deserialization_traversal
         )
-        self.deserialization_functions.setdefault(
-            Union, union_deserialization(deserialization_func=self.deserialize)
+
+    def rebuild(self, copy_value):
+        """
+        New serializer with the same registered functions and options
+
+        The values passed to the new serializer are copied by copy_value
+        Its caches start empty, and functions registered by default are bound to
+        the new serializer
+        """
+
+        serializer = Serializer(
+            copy_value(self.serialization_functions.lookup),
+            copy_value(self.deserialization_functions.lookup),
+            omit_defaults=self.omit_defaults,
+            omit_none=self.omit_none,
+            memoize=self.memoize,
+            references=self.references,
+            iterative=self.iterative,
+            lazy_collections=self.lazy_collections,
+            patch_function=self.patch_function,
+            cache_size=self.cache_size,
+            payload_cache=copy_value(self.payload_cache),
+            intern_keys=self.intern_keys,
+            intern_fields=self.intern_fields,
         )
 
+        serializer.import_registrations = copy_value(self.import_registrations)
+        serializer.module_name = self.module_name
+        serializer.serialization_traversals = {
+            **self.serialization_traversals,
+            **serializer.serialization_traversals,
+        }
+        serializer.deserialization_traversals = {
+            **self.deserialization_traversals,
+            **serializer.deserialization_traversals,
+        }
+
+        return serializer
+
+    def __copy__(self):
+        return self.rebuild(copy)
+
+    def __deepcopy__(self, memo):
+        return self.rebuild(partial(deepcopy, memo=memo))
+
     def serialize(self, obj):
         """
         Serialize given Python object
         """
 
-        try:
-            serialization_func = self.serialization_functions[obj]
-        except KeyError:
-            raise SerializationError("Cannot serialize type {}".format(type(obj)))
+        if (self.memoize or self.references) and self.serialization_memo is None:
+            # Dataclasses are memoized within each top-level call
+            self.memos.serialization = {}
+
+            try:
+                return self.serialize(obj)
+            finally:
+                self.memos.serialization = None
 
-        return serialization_func(obj)
+        if self.iterative:
+            return iterative_serialize(self, obj)
+
+        return self.serialization_function(obj)(obj)
 
     @curry
     def deserialize(self, cls, serialized_obj):
@@ -58,12 +293,318 @@ class Serializer:
         Attempt to deserialize serialized object as given type
         """
 
+        if self.references and self.deserialization_memo is None:
+            # References are resolved within each top-level call
+            self.memos.deserialization = {}
+
+            try:
+                return self.deserialize(cls, serialized_obj)
+            finally:
+                self.memos.deserialization = None
+
+        if self.lazy_collections:
+            lazy_collection = lazy_collection_deserialization(
+                cls,
+                serialized_obj,
+                deserialization_func=self.deserialize,
+                is_noop_deserialization=self.is_noop_deserialization,
+            )
+
+            if lazy_collection is not None:
+                return lazy_collection
+
+        if self.iterative:
+            return iterative_deserialize(self, cls, serialized_obj)
+
+        deserialization_func = self.deserialization_function(cls)
+
+        if self.payload_cache is not None:
+            return self.payload_cache.deserialize(
+                deserialization_func, cls, serialized_obj
+            )
+
+        return deserialization_func(cls, serialized_obj)
+
+    @property
+    def serialization_memo(self):
+        return getattr(self.memos, "serialization", None)
+
+    @property
+    def deserialization_memo(self):
+        return getattr(self.memos, "deserialization", None)
+
+    def deserialize_lazy(self, cls, serialized_obj, fields=()):
+        """
+        Deserialize serialized object as given dataclass, deserializing its fields on first access
+
+        Fields named in fields are deserialized immediately, and __post_init__
+        is not run, as in lazy_dict_to_dataclass
+        """
+
+        return lazy_dict_to_dataclass(
+            cls, serialized_obj, deserialization_func=self.deserialize, fields=fields
+        )
+
+    def serialize_columns(self, cls, objs, use_numpy=False):
+        """
+        Serialize a list of dataclasses cls as a dict of columns, one per field
+
+        As in dataclasses_to_columns
+        """
+
+        return dataclasses_to_columns(
+            cls, objs, serialization_func=self.serialize, use_numpy=use_numpy
+        )
+
+    def deserialize_columns(self, cls, columns):
+        """
+        Deserialize a dict of columns, one per field, as a list of dataclasses cls
+
+        As in columns_to_dataclasses
+        """
+
+        return columns_to_dataclasses(
+            cls,
+            columns,
+            deserialization_func=self.deserialize,
+            is_noop_deserialization=self.is_noop_deserialization,
+        )
+
+    def diff(self, old, new):
+        """
+        Patch to the serialized form of dataclass old, giving that of new
+
+        Built by patch_function from the changes found by diff_objects
+        """
+
+        return self.patch_function(diff_objects(self, old, new))
+
+    def tracking_cache(self, obj):
+        """
+        Serialized fields of tracked dataclass obj, when last serialized by this serializer
+
+        Kept for as long as obj is alive
+        """
+
+        key = id(obj)
+
+        try:
+            return self.tracking_caches[key]
+        except KeyError:
+            cache = self.tracking_caches[key] = {}
+            weakref.finalize(obj, self.tracking_caches.pop, key, None)
+
+            return cache
+
+    def serialize_changes(self, obj):
+        """
+        Serialize the fields of tracked dataclass obj changed since it was last serialized
+
+        Returns the serialized values of the changed fields, by dotted path,
+        and includes all fields the first time obj is serialized
+        """
+
+        if not original_isinstance(obj, DirtyTrackingMixin):
+            raise SerializationError(
+                "Cannot serialize changes of untracked {} {!r}".format(type(obj), obj)
+            )
+
+        return serialize_tracked_dataclass(self, obj, self.tracking_cache(obj))[1]
+
+    def serialization_function(self, obj):
+        """
+        Find the function used to serialize given Python object
+        """
+
+        if self.import_registrations:
+            self.run_import_registrations()
+
+        try:
+            return self.serialization_functions[obj]
+        except KeyError:
+            raise SerializationError("Cannot serialize type {}".format(type(obj)))
+
+    def deserialization_function(self, cls):
+        """
+        Find the function used to deserialize objects as given type
+        """
+
+        if self.import_registrations:
+            self.run_import_registrations()
+
         try:
-            deserialization_func = self.deserialization_functions[cls]
+            return self.deserialization_functions[cls]
         except KeyError:
             raise DeserializationError("Cannot deserialize type {}".format(cls))
 
-        return deserialization_func(cls, serialized_obj)
+    def serialization_traversal(self, serialization_func):
+        """
+        The traversal registered for given serialization function, if any
+        """
+
+        func, traversal = self.serialization_traversals.get(
+            id(serialization_func), (None, None)
+        )
+
+        return traversal if func is serialization_func else None
+
+    def deserialization_traversal(self, deserialization_func):
+        """
+        The traversal registered for given deserialization function, if any
+        """
+
+        func, traversal = self.deserialization_traversals.get(
+            id(deserialization_func), (None, None)
+        )
+
+        return traversal if func is deserialization_func else None
+
+    def is_noop_serialization(self, obj):
+        """
+        Whether given Python object is serialized by noop_serialization
+        """
+
+        try:
+            return self.serialization_function(obj) is noop_serialization
+        except SerializationError:
+            return False
+
+    def is_noop_serialization_type(self, cls):
+        """
+        Whether objects of given type are serialized by noop_serialization
+
+        Found from the registered types, without needing an object of the type
+        """
+
+        if self.import_registrations:
+            self.run_import_registrations()
+
+        try:
+            return self.serialization_functions.get_subset(cls) is noop_serialization
+        except KeyError:
+            return False
+
+    def is_noop_deserialization(self, cls):
+        """
+        Whether objects are deserialized as given type by noop_deserialization
+
+        So containers of them may be checked in bulk
+        """
+
+        try:
+            return self.deserialization_function(cls) is noop_deserialization
+        except DeserializationError:
+            return False
+
+    def serialize_dataclass(self, obj):
+        """
+        Default serialization of dataclasses, as though they were dicts of their fields
+
+        If memoize is set, frozen dataclasses are serialized once per call, and
+        their serialized form reused.
+        If references is set, each dataclass is serialized once per call, and
+        later occurrences serialized as {"$ref": id}, referring to the first,
+        which is given the key "$id".
+        Otherwise, unchanged fields of dataclasses with DirtyTrackingMixin are
+        not serialized again
+        """
+
+        memo = self.serialization_memo
+
+        if memo is None and original_isinstance(obj, DirtyTrackingMixin):
+            return serialize_tracked_dataclass(self, obj, self.tracking_cache(obj))[0]
+
+        if memo is None:
+            return self.serialize(
+                dataclass_to_dict(
+                    obj, omit_defaults=self.omit_defaults, omit_none=self.omit_none
+                )
+            )
+
+        try:
+            _, serialized_obj, ref = memo[id(obj)]
+        except KeyError:
+            pass
+        else:
+            if not self.references:
+                return serialized_obj
+
+            serialized_obj["$id"] = ref
+            return {"$ref": ref}
+
+        if self.references:
+            # Memoized before serializing fields, so cycles refer back to it
+            serialized_obj = {}
+            memo[id(obj)] = (obj, serialized_obj, len(memo))
+
+            serialized_obj.update(
+                self.serialize(
+                    dataclass_to_dict(
+                        obj, omit_defaults=self.omit_defaults, omit_none=self.omit_none
+                    )
+                )
+            )
+
+            return serialized_obj
+
+        serialized_obj = self.serialize(
+            dataclass_to_dict(
+                obj, omit_defaults=self.omit_defaults, omit_none=self.omit_none
+            )
+        )
+
+        if type(obj).__dataclass_params__.frozen:
+            memo[id(obj)] = (obj, serialized_obj, len(memo))
+
+        return serialized_obj
+
+    def deserialize_dataclass(self, cls, dct):
+        """
+        Default deserialization of dataclasses, using dict_to_dataclass
+
+        If references is set, resolves references made by serialize_dataclass.
+        String fields named in intern_fields are interned
+        """
+
+        memo = self.deserialization_memo
+
+        if memo is None or not isinstance(dct, dict):
+            obj = dict_to_dataclass(cls, dct, deserialization_func=self.deserialize)
+
+            if self.intern_fields:
+                intern_dataclass_fields(obj, self.intern_fields)
+
+            if self.lazy_collections:
+                # So errors deserializing lazy collections say where they are
+                set_lazy_path(obj, "")
+
+            return obj
+
+        if "$ref" in dct:
+            try:
+                return memo[dct["$ref"]]
+            except (KeyError, TypeError):
+                raise DeserializationError(
+                    "Cannot deserialize unknown reference {!r}".format(dct)
+                )
+
+        if "$id" not in dct:
+            obj = dict_to_dataclass(cls, dct, deserialization_func=self.deserialize)
+
+            return intern_dataclass_fields(obj, self.intern_fields)
+
+        dct = dict(dct)
+        ref = dct.pop("$id")
+
+        # Created before deserializing fields, so cycles refer back to it
+        origin = get_origin(cls) or cls
+        obj = memo[ref] = origin.__new__(origin)
+
+        obj.__dict__.update(
+            dict_to_dataclass(cls, dct, deserialization_func=self.deserialize).__dict__
+        )
+
+        return intern_dataclass_fields(obj, self.intern_fields)
 
     @curry
     def register_serializer(self, cls, func):
@@ -73,6 +614,173 @@ class Serializer:
     def register_deserializer(self, cls, func):
         self.deserialization_functions[cls] = func
 
+    @curry
+    def register_serialization_traversal(self, serialization_func, traversal):
+        """
+        Register how to split objects serialized by given function into parts
+
+        So they may be serialized iteratively
+        Functions are identified by identity, so need not be hashable
+        """
+
+        self.serialization_traversals[id(serialization_func)] = (
+            serialization_func,
+            traversal,
+        )
+
+        return traversal
+
+    @curry
+    def register_deserialization_traversal(self, deserialization_func, traversal):
+        """
+        Register how to split objects deserialized by given function into parts
+
+        So they may be deserialized iteratively
+        Functions are identified by identity, so need not be hashable
+        """
+
+        self.deserialization_traversals[id(deserialization_func)] = (
+            deserialization_func,
+            traversal,
+        )
+
+        return traversal
+
     def register(self, cls, serialization_func, deserialization_func):
         self.register_serializer(cls, serialization_func)
         self.register_deserializer(cls, deserialization_func)
+
+    @curry
+    def register_on_import(self, module_name, registration_func):
+        """
+        Register functions for the types of an optional module once it is imported
+
+        registration_func is called with the module, so importing it is deferred
+        until it is needed elsewhere
+        """
+
+        with self.import_registrations_lock:
+            if module_name in sys.modules:
+                registration_func(sys.modules[module_name])
+            else:
+                self.import_registrations.setdefault(module_name, []).append(
+                    registration_func
+                )
+                self.checked_modules_count = 0
+
+        return registration_func
+
+    def run_import_registrations(self):
+        """
+        Call the pending registration functions of modules imported since last run
+
+        Only rechecked once the number of imported modules has changed
+        """
+
+        modules_count = len(sys.modules)
+
+        if modules_count == self.checked_modules_count:
+            return
+
+        with self.import_registrations_lock:
+            for module_name in list(self.import_registrations):
+                module = sys.modules.get(module_name)
+
+                if module is not None:
+                    # Popped with a default, in case a registration function ran them
+                    for registration_func in self.import_registrations.pop(
+                        module_name, ()
+                    ):
+                        registration_func(module)
+
+            # Updated once registered, so other threads wait on the lock until then
+            self.checked_modules_count = modules_count
+
+    def warm(self, classes):
+        """
+        Precompile deserialization of given types, and the types they contain
+
+        Returns the compiled plans, which may be pickled, and loaded into a
+        serializer with the same registered functions in another process
+        """
+
+        self.serialization_functions.dependency_orders
+
+        fld_types = {}
+        pending = list(classes)
+        seen = set()
+
+        while pending:
+            cls = pending.pop()
+
+            if cls in seen:
+                continue
+
+            seen.add(cls)
+            self.deserialization_function(cls)
+
+            origin = get_origin(cls) or cls
+            if issubclass(origin, dataclass):
+                dataclass_field_defaults(origin)
+
+                fld_types[cls] = {
+                    fld.name: fld_type
+                    for fld, fld_type in dataclass_field_types(cls, require_bound=True)
+                }
+                pending.extend(fld_types[cls].values())
+
+            pending.extend(get_args(cls))
+
+        return SerializerPlans(
+            self.serialization_functions.cache_state(),
+            self.deserialization_functions.cache_state(),
+            fld_types,
+        )
+
+    def clear_caches(self):
+        """
+        Clear the cached lookups of this serializer, and the shared caches of dataclass types
+
+        Cached serialized fields of tracked dataclasses are also dropped
+        """
+
+        self.serialization_functions.clear_cache()
+        self.deserialization_functions.clear_cache()
+        self.tracking_caches.clear()
+
+        dataclass_field_types_cache.clear()
+        dataclass_field_defaults_cache.clear()
+        immutable_type_cache.clear()
+
+        if self.payload_cache is not None:
+            self.payload_cache.clear()
+
+    def cache_stats(self):
+        """
+        Statistics of the cached lookups of this serializer, and the shared caches of dataclass types, by name
+        """
+
+        stats = {
+            "deserialization_functions": (
+                self.deserialization_functions.cached_lookups.stats
+            ),
+            "dataclass_field_types": dataclass_field_types_cache.stats,
+            "dataclass_field_defaults": dataclass_field_defaults_cache.stats,
+            "immutable_types": immutable_type_cache.stats,
+        }
+
+        if self.payload_cache is not None:
+            stats["payloads"] = self.payload_cache.stats
+
+        return stats
+
+    def load_plans(self, plans):
+        """
+        Load plans precompiled by warm, perhaps in another process
+        """
+
+        self.serialization_functions.load_cache_state(plans.serialization_functions)
+        self.deserialization_functions.load_cache_state(plans.deserialization_functions)
+
+        for cls, fld_types in plans.dataclass_field_types.items():
+            load_dataclass_field_types(cls, fld_types)
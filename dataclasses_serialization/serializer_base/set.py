@@ -0,0 +1,65 @@
+from functools import partial
+from typing import FrozenSet, Set
+
+from toolz import curry
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.noop import (
+    all_noop_deserializable,
+    noop_deserialization,
+    uses_noop_deserialization,
+)
+from dataclasses_serialization.serializer_base.typing import get_origin, isinstance
+
+__all__ = ["set_deserialization"]
+
+get_args = partial(get_args, evaluate=True)
+
+
+@curry
+def set_deserialization(
+    type_,
+    obj,
+    deserialization_func=noop_deserialization,
+    is_noop_deserialization=None,
+):
+    """
+    Deserialize a set or frozenset, from any collection of its values
+
+    Values of types deserialized by noop_deserialization are checked in bulk,
+    rather than deserialized one at a time
+    """
+
+    if not isinstance(obj, (list, tuple, set, frozenset)):
+        raise DeserializationError(
+            "Cannot deserialize {} {!r} using set deserialization".format(
+                type(obj), obj
+            )
+        )
+
+    set_type = frozenset if (get_origin(type_) or type_) is frozenset else set
+
+    if type_ in (set, Set, frozenset, FrozenSet):
+        return set_type(obj)
+
+    (value_type,) = get_args(type_)
+
+    if uses_noop_deserialization(
+        value_type, deserialization_func, is_noop_deserialization
+    ):
+        if not all_noop_deserializable(value_type, obj):
+            raise DeserializationError(
+                "Cannot deserialize {!r} to type {}".format(obj, type_)
+            )
+
+        return set_type(obj)
+
+    try:
+        return set_type(deserialization_func(value_type, value) for value in obj)
+    except DeserializationError:
+        raise
+    except TypeError:
+        raise DeserializationError(
+            "Cannot deserialize unhashable values of {!r} to type {}".format(obj, type_)
+        )
@@ -0,0 +1,114 @@
+from copy import deepcopy
+from dataclasses import is_dataclass
+
+from dataclasses_serialization.serializer_base.dataclasses import (
+    is_equal,
+    is_omitted_field,
+    omitted_field_defaults,
+)
+from dataclasses_serialization.serializer_base.lazy import (
+    LazyDataclass,
+    load_lazy_fields,
+)
+from dataclasses_serialization.serializer_base.typing import original_isinstance
+
+__all__ = ["DirtyTrackingMixin"]
+
+immutable_types = frozenset({str, int, float, complex, bool, bytes, type(None)})
+
+missing = object()
+
+
+class DirtyTrackingMixin:
+    """
+    Mixin for dataclasses, whose serialized fields are cached by each serializer
+
+    So fields unchanged since they were last serialized are not serialized again,
+    and the changed fields may be found
+    """
+
+    __slots__ = ()
+
+
+def is_immutable(value):
+    """
+    Whether value cannot change without being replaced
+
+    Frozen dataclasses are assumed immutable, as in Serializer memoization
+    """
+
+    value_type = type(value)
+
+    if value_type in immutable_types:
+        return True
+
+    if value_type is tuple or value_type is frozenset:
+        return all(map(is_immutable, value))
+
+    return is_dataclass(value_type) and value_type.__dataclass_params__.frozen
+
+
+def copy_serialized(serialized_value):
+    """
+    Copy of serialized value, so it is not shared between cache and outputs
+
+    Immutable values are not copied
+    """
+
+    if is_immutable(serialized_value):
+        return serialized_value
+
+    return deepcopy(serialized_value)
+
+
+def serialize_tracked_dataclass(serializer, obj, cache, path=""):
+    """
+    Serialize tracked dataclass obj as a dict of its fields, reusing unchanged fields
+
+    cache maps each field name to its value, and a copy of its serialized
+    value, when last serialized, and is updated.
+    Fields holding the same immutable value, or the same tracked dataclass, as
+    when last serialized are not serialized again, and their cached serialized
+    values are copied into the result.
+    Mutable values, such as lists, are always serialized again, so changes
+    made to them in place are not missed, but only counted as changed if their
+    serialized values differ from the cached copy.
+
+    Returns the serialized fields, and the serialized values of the fields
+    which changed, by dotted path, including those of nested tracked dataclasses
+    """
+
+    if original_isinstance(obj, LazyDataclass):
+        load_lazy_fields(obj)
+
+    omit_defaults = serializer.omit_defaults
+    defaults = omitted_field_defaults(type(obj), omit_defaults, serializer.omit_none)
+
+    serialized_fields = {}
+    changes = {}
+
+    for name, value in obj.__dict__.items():
+        fld_path = path + name
+        cached_value, cached_serialized_value = cache.get(name, (missing, missing))
+
+        if value is cached_value and is_immutable(value):
+            serialized_value = copy_serialized(cached_serialized_value)
+        elif value is cached_value and original_isinstance(value, DirtyTrackingMixin):
+            serialized_value, value_changes = serialize_tracked_dataclass(
+                serializer, value, serializer.tracking_cache(value), fld_path + "."
+            )
+            changes.update(value_changes)
+            cached_serialized_value = copy_serialized(serialized_value)
+        else:
+            serialized_value = serializer.serialize(value)
+
+            if not is_equal(serialized_value, cached_serialized_value):
+                changes[fld_path] = serialized_value
+                cached_serialized_value = copy_serialized(serialized_value)
+
+        cache[name] = (value, cached_serialized_value)
+
+        if not is_omitted_field(name, value, defaults, omit_defaults):
+            serialized_fields[name] = serialized_value
+
+    return serialized_fields, changes
@@ -0,0 +1,88 @@
+from functools import partial
+from typing import Tuple
+
+from toolz import curry
+from typing_inspect import get_args
+
+from dataclasses_serialization.serializer_base.errors import DeserializationError
+from dataclasses_serialization.serializer_base.noop import (
+    all_noop_deserializable,
+    noop_deserialization,
+    uses_noop_deserialization,
+)
+from dataclasses_serialization.serializer_base.typing import isinstance
+
+__all__ = ["tuple_deserialization"]
+
+get_args = partial(get_args, evaluate=True)
+
+
+@curry
+def tuple_deserialization(
+    type_,
+    obj,
+    deserialization_func=noop_deserialization,
+    is_noop_deserialization=None,
+):
+    """
+    Deserialize a tuple, either variable-length as Tuple[X, ...], or fixed-length
+
+    Values of types deserialized by noop_deserialization are checked in bulk,
+    rather than deserialized one at a time
+    """
+
+    if not isinstance(obj, (list, tuple)):
+        raise DeserializationError(
+            "Cannot deserialize {} {!r} using tuple deserialization".format(
+                type(obj), obj
+            )
+        )
+
+    if type_ is tuple or type_ is Tuple:
+        return tuple(obj)
+
+    value_types = get_args(type_)
+
+    if len(value_types) == 2 and value_types[1] is Ellipsis:
+        value_type = value_types[0]
+
+        if uses_noop_deserialization(
+            value_type, deserialization_func, is_noop_deserialization
+        ):
+            if not all_noop_deserializable(value_type, obj):
+                raise DeserializationError(
+                    "Cannot deserialize {!r} to type {}".format(obj, type_)
+                )
+
+            return tuple(obj)
+
+        return tuple(deserialization_func(value_type, value) for value in obj)
+
+    if value_types == ((),):
+        # Tuple[()] on older Pythons
+        value_types = ()
+
+    if len(obj) != len(value_types):
+        raise DeserializationError(
+            "Cannot deserialize {} values {!r} to type {}".format(len(obj), obj, type_)
+        )
+
+    if all(
+        uses_noop_deserialization(
+            value_type, deserialization_func, is_noop_deserialization
+        )
+        for value_type in value_types
+    ):
+        if not all(
+            isinstance(value, value_type) for value_type, value in zip(value_types, obj)
+        ):
+            raise DeserializationError(
+                "Cannot deserialize {!r} to type {}".format(obj, type_)
+            )
+
+        return tuple(obj)
+
+    return tuple(
+        deserialization_func(value_type, value)
+        for value_type, value in zip(value_types, obj)
+    )
@@ -5,6 +5,8 @@ from typing import TypeVar, get_type_hints
 from toolz import curry
 from typing_inspect import get_args, get_generic_bases, get_origin
 
+from dataclasses_serialization.serializer_base.cache import shared_cache
+
 try:
     from typing import GenericMeta
 except ImportError:
@@ -12,6 +14,11 @@ except ImportError:
 
     GenericMeta = (_GenericAlias, _SpecialForm)
 
+try:
+    from types import GenericAlias
+except ImportError:
+    GenericAlias = ()
+
 __all__ = [
     "isinstance",
     "issubclass",
@@ -28,6 +35,8 @@ original_issubclass = issubclass
 isinstance_generic_funcs = {}
 issubclass_generic_funcs = {}
 
+dataclass_field_types_cache = shared_cache()
+
 
 @curry
 def register_generic_isinstance(origin, func):
@@ -80,7 +89,10 @@ def issubclass(cls, classinfo):
 
 @curry
 def bind(bindings, generic):
-    if isinstance(generic, GenericMeta):
+    if isinstance(generic, (GenericMeta, GenericAlias)):
+        if not generic.__parameters__:
+            return generic
+
         return generic[
             tuple(bindings[type_param] for type_param in generic.__parameters__)
         ]
@@ -90,15 +102,12 @@ def bind(bindings, generic):
         return generic
 
 
-def dataclass_field_types(cls, require_bound=False):
+def find_dataclass_field_types(cls):
     if not hasattr(cls, "__parameters__"):
         type_hints = get_type_hints(cls)
         flds = fields(cls)
 
-        return ((fld, type_hints[fld.name]) for fld in flds)
-
-    if require_bound and cls.__parameters__:
-        raise TypeError("Cannot find types of unbound generic {}".format(cls))
+        return tuple((fld, type_hints[fld.name]) for fld in flds)
 
     origin = get_origin(cls)
     type_mapping = dict(zip(origin.__parameters__, get_args(cls)))
@@ -106,4 +115,43 @@ def dataclass_field_types(cls, require_bound=False):
     type_hints = get_type_hints(origin)
     flds = fields(origin)
 
-    return ((fld, bind(type_mapping, type_hints[fld.name])) for fld in flds)
+    return tuple((fld, bind(type_mapping, type_hints[fld.name])) for fld in flds)
+
+
+def dataclass_field_types(cls, require_bound=False):
+    """
+    The fields of dataclass cls, with their types
+
+    Type parameters of bound generic dataclasses are substituted into the types
+    of their fields, including within nested generics.
+    The types are cached for non-generic dataclasses, and bound generic
+    dataclasses, so are only found once for each.
+    """
+
+    if getattr(cls, "__parameters__", None):
+        if require_bound:
+            raise TypeError("Cannot find types of unbound generic {}".format(cls))
+
+        return find_dataclass_field_types(cls)
+
+    try:
+        return dataclass_field_types_cache[cls]
+    except KeyError:
+        fld_types = dataclass_field_types_cache[cls] = find_dataclass_field_types(cls)
+        return fld_types
+    except TypeError:
+        # Generics bound to unhashable types cannot be cached
+        return find_dataclass_field_types(cls)
+
+
+def load_dataclass_field_types(cls, fld_types):
+    """
+    Cache the types of the fields of dataclass cls, given by field name
+
+    As previously found by dataclass_field_types, perhaps in another process
+    """
+
+    if not getattr(cls, "__parameters__", None):
+        dataclass_field_types_cache[cls] = tuple(
+            (fld, fld_types[fld.name]) for fld in fields(get_origin(cls) or cls)
+        )
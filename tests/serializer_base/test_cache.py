@@ -0,0 +1,101 @@
+import gc
+import weakref
+from dataclasses import make_dataclass
+from typing import List
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base.cache import (
+    CacheStats,
+    LRUCache,
+    set_shared_cache_size,
+    shared_cache,
+    shared_caches,
+    shared_maxsize,
+)
+
+
+class TestCache(TestCase):
+    def test_lru_cache_basic(self):
+        cache = LRUCache(maxsize=2)
+
+        with self.subTest("Set and get items"):
+            cache["a"] = 1
+            cache["b"] = 2
+
+            self.assertEqual(1, cache["a"])
+            self.assertEqual({"a": 1, "b": 2}, cache)
+
+        with self.subTest("Evict least recently used item"):
+            cache["c"] = 3
+
+            self.assertEqual({"a": 1, "c": 3}, cache)
+
+        with self.subTest("Count hits, misses, and evictions"):
+            with self.assertRaises(KeyError):
+                cache["b"]
+
+            self.assertEqual(
+                CacheStats(size=2, maxsize=2, hits=1, misses=1, evictions=1),
+                cache.stats,
+            )
+
+        with self.subTest("Clear"):
+            cache.clear()
+
+            self.assertEqual(0, len(cache))
+
+        with self.subTest("Fail unhashable keys"), self.assertRaises(TypeError):
+            cache[[]] = 1
+
+    def test_lru_cache_classes(self):
+        cache = LRUCache()
+        cls = make_dataclass("Dynamic", [("x", int)])
+
+        with self.subTest("Look up classes"):
+            cache[cls] = "cls"
+            cache[List[int]] = "list"
+
+            self.assertEqual("cls", cache[cls])
+            self.assertEqual("list", cache[List[int]])
+            self.assertEqual({cls: "cls", List[int]: "list"}, cache)
+
+        with self.subTest("Drop garbage collected classes"):
+            del cls
+            gc.collect()
+
+            self.assertEqual({List[int]: "list"}, cache)
+
+        with self.subTest("Caches of long-lived classes garbage collected"):
+            cache = LRUCache()
+            cache[int] = "int"
+            cache_ref = weakref.ref(cache)
+
+            del cache
+            gc.collect()
+
+            self.assertIsNone(cache_ref())
+
+        with self.subTest("Replaced items not dropped with old classes"):
+            cache = LRUCache()
+            cache[int] = "int"
+            cache[int] = "integer"
+            gc.collect()
+
+            self.assertEqual({int: "integer"}, cache)
+
+    def test_shared_cache_size(self):
+        cache = shared_cache()
+        self.addCleanup(shared_caches.remove, cache)
+        self.addCleanup(set_shared_cache_size, shared_maxsize)
+
+        for i in range(3):
+            cache[i] = i
+
+        set_shared_cache_size(2)
+
+        with self.subTest("Resize shared caches"):
+            self.assertEqual(2, cache.maxsize)
+            self.assertEqual({1: 1, 2: 2}, cache)
+
+        with self.subTest("Size of new shared caches"):
+            self.assertEqual(2, shared_cache().maxsize)
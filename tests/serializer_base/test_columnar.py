@@ -0,0 +1,159 @@
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from os import environ
+from typing import Optional
+from unittest import TestCase, skipIf
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    SerializationError,
+    Serializer,
+    columns_to_dataclasses,
+    dataclasses_to_columns,
+    noop_deserialization,
+    noop_serialization,
+)
+
+try:
+    import numpy
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+if "OPTIONAL_MODULES" in environ:
+    numpy_installed = "numpy" in environ["OPTIONAL_MODULES"]
+
+
+@dataclass
+class Row:
+    name: str
+    count: int
+    price: float
+    active: bool
+    discount: Optional[float] = None
+
+
+rows = [Row("a", 1, 0.5, True), Row("b", 2, 1.5, False, 0.1)]
+
+
+class TestColumnar(TestCase):
+    def test_dataclasses_to_columns(self):
+        columns = dataclasses_to_columns(Row, rows)
+
+        with self.subTest("Serialize numeric fields as arrays"):
+            self.assertEqual(array("q", [1, 2]), columns["count"])
+            self.assertEqual(array("d", [0.5, 1.5]), columns["price"])
+            self.assertEqual(array("b", [1, 0]), columns["active"])
+
+        with self.subTest("Serialize other fields as lists"):
+            self.assertEqual(["a", "b"], columns["name"])
+            self.assertEqual([None, 0.1], columns["discount"])
+
+        with self.subTest("Serialize ints too large for arrays as lists"):
+            self.assertEqual(
+                [2**64],
+                dataclasses_to_columns(Row, [Row("a", 2**64, 0.5, True)])["count"],
+            )
+
+        with self.subTest("Serialize with serialization function"):
+            self.assertEqual(
+                ["A", "B"],
+                dataclasses_to_columns(
+                    Row,
+                    rows,
+                    serialization_func=lambda obj: (
+                        obj.upper() if isinstance(obj, str) else obj
+                    ),
+                )["name"],
+            )
+
+        with self.subTest("Fail other types"), self.assertRaises(SerializationError):
+            dataclasses_to_columns(Row, [date(2000, 1, 1)])
+
+    def test_columns_to_dataclasses(self):
+        columns = dataclasses_to_columns(Row, rows)
+
+        with self.subTest("Deserialize columns"):
+            deserialized_rows = columns_to_dataclasses(Row, columns)
+
+            self.assertEqual(rows, deserialized_rows)
+            self.assertIs(True, deserialized_rows[0].active)
+
+        with self.subTest("Deserialize lists as numeric fields"):
+            self.assertEqual(
+                rows,
+                columns_to_dataclasses(
+                    Row,
+                    {name: [getattr(row, name) for row in rows] for name in columns},
+                ),
+            )
+
+        with self.subTest("Fill in missing defaults"):
+            self.assertEqual(
+                [Row("a", 1, 0.5, True)],
+                columns_to_dataclasses(
+                    Row, {"name": ["a"], "count": [1], "price": [0.5], "active": [True]}
+                ),
+            )
+
+        with self.subTest("Fail missing columns"), self.assertRaises(
+            DeserializationError
+        ):
+            columns_to_dataclasses(Row, {"name": ["a"]})
+
+        with self.subTest("Fail all columns missing"), self.assertRaises(
+            DeserializationError
+        ):
+            columns_to_dataclasses(Row, {})
+
+        with self.subTest("Fail columns of different lengths"), self.assertRaises(
+            DeserializationError
+        ):
+            columns_to_dataclasses(Row, dict(columns, name=["a"]))
+
+        with self.subTest("Fail invalid values"), self.assertRaises(
+            DeserializationError
+        ):
+            columns_to_dataclasses(Row, dict(columns, name=[1, 2]))
+
+        for name, column in [
+            ("count", array("d", [1.0, 2.0])),
+            ("price", array("q", [1, 2])),
+            ("active", array("b", [1, 2])),
+        ]:
+            with self.subTest(
+                "Fail arrays of other types", name=name, column=column
+            ), self.assertRaises(DeserializationError):
+                columns_to_dataclasses(Row, dict(columns, **{name: column}))
+
+    @skipIf(not numpy_installed, "NumPy not installed")
+    def test_columns_numpy(self):
+        columns = dataclasses_to_columns(Row, rows, use_numpy=True)
+
+        with self.subTest("Serialize numeric fields as NumPy arrays"):
+            self.assertEqual(numpy.int64, columns["count"].dtype)
+            self.assertEqual(numpy.bool_, columns["active"].dtype)
+            self.assertEqual([0.5, 1.5], columns["price"].tolist())
+
+        with self.subTest("Deserialize NumPy arrays"):
+            self.assertEqual(rows, columns_to_dataclasses(Row, columns))
+
+        with self.subTest("Fail NumPy arrays of other dtypes"), self.assertRaises(
+            DeserializationError
+        ):
+            columns_to_dataclasses(
+                Row, dict(columns, count=numpy.array([1.0, 2.0], dtype=numpy.float64))
+            )
+
+    def test_serializer_columns(self):
+        serializer = Serializer(
+            {(str, int, float, bool, type(None)): noop_serialization},
+            {(str, int, float, bool, type(None)): noop_deserialization},
+        )
+
+        columns = serializer.serialize_columns(Row, rows)
+
+        self.assertEqual(["a", "b"], columns["name"])
+        self.assertEqual(rows, serializer.deserialize_columns(Row, columns))
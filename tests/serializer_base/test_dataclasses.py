@@ -1,15 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import environ
-from typing import Dict, Generic, List, TypeVar
+from typing import Dict, Generic, List, Optional, TypeVar
 from unittest import TestCase
 
 from dataclasses_serialization.serializer_base import (
     DeserializationError,
+    SerializationError,
+    dataclass_to_dict,
     dict_deserialization,
     dict_to_dataclass,
     list_deserialization,
 )
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 postponed_annotations = bool(
     environ.get("POSTPONED_ANNOTATIONS", "annotations" in globals())
 )
@@ -22,6 +29,110 @@ if postponed_annotations:
     T = TypeVar("T")
 
 
+class TestDataclassToDict(TestCase):
+    def test_dataclass_to_dict_basic(self):
+        @dataclass
+        class ExampleDataclass:
+            int_field: int
+            str_field: str
+
+        with self.subTest("Serialize basic dataclass"):
+            self.assertEqual(
+                {"int_field": 1, "str_field": "Hello, world"},
+                dataclass_to_dict(ExampleDataclass(1, "Hello, world")),
+            )
+
+        with self.subTest("Fail non-dataclass serialization"), self.assertRaises(
+            SerializationError
+        ):
+            dataclass_to_dict({"int_field": 1})
+
+        with self.subTest("Fail dataclass type serialization"), self.assertRaises(
+            SerializationError
+        ):
+            dataclass_to_dict(ExampleDataclass)
+
+    def test_dataclass_to_dict_omit_defaults(self):
+        @dataclass
+        class ExampleDataclass:
+            int_field: int
+            str_field: str = ""
+            list_field: List[int] = field(default_factory=list)
+            float_field: float = 0.0
+
+        with self.subTest("Omit default fields"):
+            self.assertEqual(
+                {"int_field": 0},
+                dataclass_to_dict(ExampleDataclass(0), omit_defaults=True),
+            )
+
+        with self.subTest("Keep non-default fields"):
+            self.assertEqual(
+                {"int_field": 0, "str_field": "a", "list_field": [1]},
+                dataclass_to_dict(ExampleDataclass(0, "a", [1]), omit_defaults=True),
+            )
+
+        with self.subTest("Keep values equal to, but of different type to, default"):
+            self.assertEqual(
+                {"int_field": 0, "float_field": 0},
+                dataclass_to_dict(
+                    ExampleDataclass(0, float_field=0), omit_defaults=True
+                ),
+            )
+
+    def test_dataclass_to_dict_omit_none(self):
+        @dataclass
+        class ExampleDataclass:
+            required_field: Optional[int]
+            none_field: Optional[str] = None
+            optional_field: Optional[str] = "Lorem ipsum"
+
+        with self.subTest("Omit None fields defaulting to None"):
+            self.assertEqual(
+                {"required_field": 1, "optional_field": "Hello, world"},
+                dataclass_to_dict(
+                    ExampleDataclass(1, None, "Hello, world"), omit_none=True
+                ),
+            )
+
+        with self.subTest("Keep None fields without default"):
+            self.assertEqual(
+                {"required_field": None, "optional_field": "Lorem ipsum"},
+                dataclass_to_dict(ExampleDataclass(None), omit_none=True),
+            )
+
+        with self.subTest("Keep None fields with other default"):
+            obj = ExampleDataclass(1, optional_field=None)
+
+            self.assertEqual(
+                {"required_field": 1, "optional_field": None},
+                dataclass_to_dict(obj, omit_none=True),
+            )
+            self.assertEqual(
+                obj,
+                dict_to_dataclass(
+                    ExampleDataclass, dataclass_to_dict(obj, omit_none=True)
+                ),
+            )
+
+    def test_dataclass_to_dict_omit_ndarray_defaults(self):
+        if numpy is None:
+            self.skipTest("NumPy not installed")
+
+        @dataclass
+        class ExampleDataclass:
+            values: numpy.ndarray = field(default_factory=lambda: numpy.zeros(2))
+
+        for values in [numpy.zeros(2), numpy.zeros(3)]:
+            with self.subTest("Keep ndarray fields", values=values):
+                self.assertIs(
+                    values,
+                    dataclass_to_dict(ExampleDataclass(values), omit_defaults=True)[
+                        "values"
+                    ],
+                )
+
+
 class TestDictToDataclass(TestCase):
     def test_dict_to_dataclass_basic(self):
         @dataclass
@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, TypeVar
 from unittest import TestCase
 
@@ -80,3 +81,65 @@ class TestDictSerialization(TestCase):
                     value_deserialization_func=lambda cls, obj: str(obj),
                 ),
             )
+
+    def test_dict_deserialization_noop_types(self):
+        def fail_deserialization(cls, obj):
+            raise AssertionError("Deserialized {!r} individually".format(obj))
+
+        dct = {"a": 1, "b": 2}
+
+        with self.subTest("Check noop types in bulk, copying without rebuilding"):
+            deserialized_dct = dict_deserialization(
+                Dict[str, int],
+                dct,
+                key_deserialization_func=fail_deserialization,
+                value_deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
+
+            self.assertEqual(dct, deserialized_dct)
+            self.assertIsNot(dct, deserialized_dct)
+
+        with self.subTest("Fail invalid noop types"), self.assertRaises(
+            DeserializationError
+        ):
+            dict_deserialization(
+                Dict[str, str],
+                dct,
+                key_deserialization_func=fail_deserialization,
+                value_deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
+
+        with self.subTest("Deserialize non-noop types individually"):
+            self.assertEqual(
+                {"a": 0, "b": 1},
+                dict_deserialization(
+                    Dict[str, int],
+                    dct,
+                    value_deserialization_func=lambda cls, obj: obj - 1,
+                    is_noop_deserialization=lambda cls: cls is str,
+                ),
+            )
+
+    def test_dict_deserialization_intern_keys(self):
+        # Built at runtime, so not interned by the compiler
+        key = "".join(["status", "_code"])
+        dct = {key: 1}
+
+        for type_ in [dict, Dict[str, int]]:
+            with self.subTest("Intern keys", type_=type_):
+                deserialized_dct = dict_deserialization(type_, dct, intern_keys=True)
+
+                self.assertEqual(dct, deserialized_dct)
+                self.assertIs(sys.intern("status_code"), next(iter(deserialized_dct)))
+
+        with self.subTest("Intern deserialized keys"):
+            deserialized_dct = dict_deserialization(
+                Dict[str, int],
+                {1: 1},
+                key_deserialization_func=lambda cls, obj: "".join(["status", "_code"]),
+                intern_keys=True,
+            )
+
+            self.assertIs(sys.intern("status_code"), next(iter(deserialized_dct)))
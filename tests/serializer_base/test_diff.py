@@ -0,0 +1,160 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generic, List, Optional, TypeVar
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    SerializationError,
+    Serializer,
+    diff_objects,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+T = TypeVar("T")
+
+
+@dataclass
+class Envelope(Generic[T]):
+    contents: T
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class User:
+    name: str
+    address: Address
+    tags: List[str]
+    scores: Dict[str, int] = field(default_factory=dict)
+    nickname: Optional[str] = None
+
+
+class TestDiff(TestCase):
+    def setUp(self):
+        self.serialized_values = []
+
+        def serialize(obj):
+            self.serialized_values.append(obj)
+            return obj
+
+        self.serializer = Serializer({object: serialize}, {})
+
+    def test_diff_objects(self):
+        address = Address("London")
+        old = User("Fred", address, ["admin"], {"a": 1, "b": 2})
+
+        with self.subTest("Diff equal dataclasses"):
+            self.assertEqual(
+                [],
+                diff_objects(
+                    self.serializer,
+                    old,
+                    User("Fred", address, ["admin"], {"a": 1, "b": 2}),
+                ),
+            )
+
+        with self.subTest("Diff changed fields, by path"):
+            new = User("Bob", Address("Paris"), ["user"], {"a": 1, "c": 3}, "Bobby")
+
+            self.assertEqual(
+                [
+                    ("replace", ("name",), "Bob"),
+                    ("replace", ("address", "city"), "Paris"),
+                    ("replace", ("tags", 0), "user"),
+                    ("remove", ("scores", "b"), None),
+                    ("add", ("scores", "c"), 3),
+                    ("replace", ("nickname",), "Bobby"),
+                ],
+                diff_objects(self.serializer, old, new),
+            )
+
+        with self.subTest("Replace lists of different lengths"):
+            new = User("Fred", address, ["admin", "user"], {"a": 1, "b": 2})
+
+            self.assertEqual(
+                [("replace", ("tags",), ["admin", "user"])],
+                diff_objects(self.serializer, old, new),
+            )
+
+        with self.subTest("Only serialize changed values"):
+            self.serialized_values.clear()
+            new = User("Fred", address, ["admin"], {"a": 1, "b": 2}, "Freddy")
+            diff_objects(self.serializer, old, new)
+
+            self.assertEqual(["Freddy"], self.serialized_values)
+
+        with self.subTest("Add and remove omitted fields"):
+            self.serializer.omit_none = True
+
+            self.assertEqual(
+                [("add", ("nickname",), "Freddy")],
+                diff_objects(self.serializer, old, new),
+            )
+            self.assertEqual(
+                [("remove", ("nickname",), None)],
+                diff_objects(self.serializer, new, old),
+            )
+
+        with self.subTest("Fail different types"), self.assertRaises(
+            SerializationError
+        ):
+            diff_objects(self.serializer, old, address)
+
+    def test_diff_generic_objects(self):
+        self.assertEqual(
+            [("replace", ("contents",), 2)],
+            diff_objects(self.serializer, Envelope(1), Envelope(2)),
+        )
+
+    def test_diff_ndarray_fields(self):
+        if numpy is None:
+            self.skipTest("NumPy not installed")
+
+        from dataclasses_serialization.json import JSONSerializer
+
+        @dataclass
+        class Features:
+            values: numpy.ndarray
+
+        old = Features(numpy.array([1, 2]))
+
+        with self.subTest("Diff equal arrays"):
+            self.assertEqual(
+                [], diff_objects(JSONSerializer, old, Features(numpy.array([1, 2])))
+            )
+
+        with self.subTest("Diff changed arrays"):
+            new = Features(numpy.array([1, 3]))
+
+            self.assertEqual(
+                [("replace", ("values",), JSONSerializer.serialize(new.values))],
+                diff_objects(JSONSerializer, old, new),
+            )
+
+        with self.subTest("Diff arrays of different shapes"):
+            new = Features(numpy.array([1, 2, 3]))
+
+            self.assertEqual(
+                [("replace", ("values",), JSONSerializer.serialize(new.values))],
+                diff_objects(JSONSerializer, old, new),
+            )
+
+    def test_serializer_diff(self):
+        old = User("Fred", Address("London"), [])
+        new = User("Bob", Address("London"), [])
+
+        with self.subTest("Diff as list of changes"):
+            self.assertEqual(
+                [("replace", ("name",), "Bob")], self.serializer.diff(old, new)
+            )
+
+        with self.subTest("Diff with patch function"):
+            self.serializer.patch_function = len
+
+            self.assertEqual(1, self.serializer.diff(old, new))
@@ -0,0 +1,168 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    Serializer,
+    dict_deserialization,
+    dict_deserialization_traversal,
+    dict_serialization,
+    dict_serialization_traversal,
+    list_deserialization,
+    list_deserialization_traversal,
+    list_serialization_traversal,
+    noop_deserialization,
+    noop_serialization,
+)
+
+
+@dataclass
+class LinkedNode:
+    value: int
+    children: List["LinkedNode"]
+    next: Optional["LinkedNode"] = None
+
+
+def make_serializer(iterative):
+    def list_serializer(lst):
+        return [serializer.serialize(item) for item in lst]
+
+    def dict_serializer(dct):
+        return dict_serialization(
+            dct,
+            key_serialization_func=serializer.serialize,
+            value_serialization_func=serializer.serialize,
+        )
+
+    def list_deserializer(cls, lst):
+        return list_deserialization(
+            cls,
+            lst,
+            deserialization_func=serializer.deserialize,
+            is_noop_deserialization=serializer.is_noop_deserialization,
+        )
+
+    def dict_deserializer(cls, dct):
+        return dict_deserialization(
+            cls,
+            dct,
+            key_deserialization_func=serializer.deserialize,
+            value_deserialization_func=serializer.deserialize,
+            is_noop_deserialization=serializer.is_noop_deserialization,
+        )
+
+    serializer = Serializer(
+        {
+            list: list_serializer,
+            dict: dict_serializer,
+            (int, str, type(None)): noop_serialization,
+        },
+        {
+            list: list_deserializer,
+            dict: dict_deserializer,
+            (int, str, type(None)): noop_deserialization,
+        },
+        iterative=iterative,
+    )
+
+    serializer.register_serialization_traversal(
+        list_serializer, list_serialization_traversal
+    )
+    serializer.register_serialization_traversal(
+        dict_serializer, dict_serialization_traversal
+    )
+    serializer.register_deserialization_traversal(
+        list_deserializer, list_deserialization_traversal
+    )
+    serializer.register_deserialization_traversal(
+        dict_deserializer, dict_deserialization_traversal
+    )
+
+    return serializer
+
+
+def linked_nodes(length):
+    node = None
+
+    for value in range(length):
+        node = LinkedNode(value, [], node)
+
+    return node
+
+
+def linked_node_length(node):
+    length = 0
+
+    while node is not None:
+        length += 1
+        node = node.next
+
+    return length
+
+
+class TestIterative(TestCase):
+    def test_iterative_matches_recursive(self):
+        recursive_serializer = make_serializer(iterative=False)
+        iterative_serializer = make_serializer(iterative=True)
+
+        test_cases = [
+            (int, 1),
+            (List[int], [1, 2]),
+            (Dict[str, List[LinkedNode]], {"a": [LinkedNode(1, [])], "b": []}),
+            (LinkedNode, LinkedNode(1, [LinkedNode(2, [])], LinkedNode(3, []))),
+            (Optional[LinkedNode], None),
+            (Union[int, LinkedNode], LinkedNode(1, [])),
+        ]
+
+        for type_, obj in test_cases:
+            serialized_obj = recursive_serializer.serialize(obj)
+
+            with self.subTest("Serialize object", obj=obj):
+                self.assertEqual(serialized_obj, iterative_serializer.serialize(obj))
+
+            with self.subTest("Deserialize object", obj=obj):
+                self.assertEqual(
+                    obj, iterative_serializer.deserialize(type_, serialized_obj)
+                )
+
+    def test_iterative_deep_nesting(self):
+        serializer = make_serializer(iterative=True)
+        length = sys.getrecursionlimit() * 2
+
+        serialized_obj = serializer.serialize(linked_nodes(length))
+
+        with self.subTest("Serialize deeply nested object"):
+            depth = 0
+            serialized_node = serialized_obj
+
+            while serialized_node is not None:
+                depth += 1
+                serialized_node = serialized_node["next"]
+
+            self.assertEqual(length, depth)
+
+        with self.subTest("Deserialize deeply nested object"):
+            self.assertEqual(
+                length,
+                linked_node_length(serializer.deserialize(LinkedNode, serialized_obj)),
+            )
+
+        with self.subTest("Fail recursive deserialization"), self.assertRaises(
+            RecursionError
+        ):
+            make_serializer(iterative=False).deserialize(LinkedNode, serialized_obj)
+
+    def test_iterative_errors(self):
+        serializer = make_serializer(iterative=True)
+
+        with self.subTest("Fail invalid value"), self.assertRaises(
+            DeserializationError
+        ):
+            serializer.deserialize(List[LinkedNode], [{"value": "a", "children": []}])
+
+        with self.subTest("Fail missing field"), self.assertRaises(
+            DeserializationError
+        ):
+            serializer.deserialize(LinkedNode, {"value": 1})
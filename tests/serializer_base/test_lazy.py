@@ -0,0 +1,355 @@
+import pickle
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Dict, Generic, List, TypeVar
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    LazyDict,
+    LazyList,
+    dataclass_to_dict,
+    lazy_collection_deserialization,
+    lazy_dict_to_dataclass,
+    load_lazy_fields,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExampleDataclass:
+    int_field: int
+    list_field: List[int]
+    str_field: str = "default"
+    default_factory_field: list = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FrozenDataclass:
+    int_field: int
+
+
+@dataclass
+class GenericDataclass(Generic[T]):
+    t_field: T
+
+
+@dataclass
+class SlotsDataclass:
+    __slots__ = ("int_field",)
+
+    int_field: int
+
+
+@dataclass
+class PostInitDataclass:
+    int_field: int
+
+    def __post_init__(self):
+        self.int_field += 1
+
+
+class TestLazy(TestCase):
+    def test_lazy_dict_to_dataclass_basic(self):
+        deserialized_fields = []
+
+        def deserialization_func(cls, obj):
+            deserialized_fields.append(obj)
+            return obj
+
+        obj = lazy_dict_to_dataclass(
+            ExampleDataclass,
+            {"int_field": 1, "list_field": [2]},
+            deserialization_func=deserialization_func,
+        )
+
+        with self.subTest("Defer field deserialization"):
+            self.assertIsInstance(obj, ExampleDataclass)
+            self.assertEqual([], deserialized_fields)
+
+        with self.subTest("Deserialize field on first access"):
+            self.assertEqual(1, obj.int_field)
+            self.assertEqual(1, obj.int_field)
+            self.assertEqual([1], deserialized_fields)
+
+        with self.subTest("Fill in missing defaults"):
+            self.assertEqual("default", obj.str_field)
+            self.assertEqual([], obj.default_factory_field)
+
+        with self.subTest("Compare equal to eager dataclass"):
+            self.assertEqual(ExampleDataclass(1, [2]), obj)
+            self.assertEqual(obj, ExampleDataclass(1, [2]))
+            self.assertNotEqual(ExampleDataclass(1, [3]), obj)
+
+        with self.subTest("Convert to dict"):
+            self.assertEqual(
+                {
+                    "int_field": 1,
+                    "list_field": [2],
+                    "str_field": "default",
+                    "default_factory_field": [],
+                },
+                dataclass_to_dict(obj),
+            )
+
+    def test_lazy_dict_to_dataclass_fields(self):
+        deserialized_fields = []
+
+        def deserialization_func(cls, obj):
+            deserialized_fields.append(obj)
+            return obj
+
+        obj = lazy_dict_to_dataclass(
+            ExampleDataclass,
+            {"int_field": 1, "list_field": [2]},
+            deserialization_func=deserialization_func,
+            fields=["list_field"],
+        )
+
+        with self.subTest("Deserialize selected fields immediately"):
+            self.assertEqual([[2]], deserialized_fields)
+
+        with self.subTest("Load remaining fields"):
+            load_lazy_fields(obj)
+
+            self.assertEqual([[2], 1], deserialized_fields)
+            self.assertEqual(ExampleDataclass(1, [2]), obj)
+
+    def test_lazy_dict_to_dataclass_defaults(self):
+        def deserialization_func(cls, obj):
+            return obj
+
+        obj = lazy_dict_to_dataclass(
+            ExampleDataclass,
+            {
+                "int_field": 1,
+                "list_field": [2],
+                "str_field": "given",
+                "default_factory_field": [3],
+            },
+            deserialization_func=deserialization_func,
+            fields=["int_field"],
+        )
+
+        with self.subTest("Deserialize field given a default on access"):
+            self.assertEqual("given", obj.str_field)
+
+        with self.subTest("Compare equal to eager dataclass"):
+            self.assertEqual(ExampleDataclass(1, [2], "given", [3]), obj)
+
+        with self.subTest("Convert to dict in field order"):
+            self.assertEqual(
+                [
+                    ("int_field", 1),
+                    ("list_field", [2]),
+                    ("str_field", "given"),
+                    ("default_factory_field", [3]),
+                ],
+                list(dataclass_to_dict(obj).items()),
+            )
+
+        with self.subTest("Load remaining fields given defaults"):
+            obj = lazy_dict_to_dataclass(
+                ExampleDataclass,
+                {"int_field": 1, "list_field": [2], "str_field": "given"},
+                deserialization_func=deserialization_func,
+            )
+            load_lazy_fields(obj)
+
+            self.assertEqual("given", obj.__dict__["str_field"])
+
+        with self.subTest("Set field before access"):
+            obj = lazy_dict_to_dataclass(
+                ExampleDataclass,
+                {"int_field": 1, "list_field": [2], "str_field": "given"},
+                deserialization_func=deserialization_func,
+            )
+            obj.str_field = "set"
+
+            self.assertEqual("set", obj.str_field)
+            self.assertEqual("set", dataclass_to_dict(obj)["str_field"])
+
+    def test_lazy_dict_to_dataclass_frozen(self):
+        obj = lazy_dict_to_dataclass(FrozenDataclass, {"int_field": 1})
+
+        self.assertEqual(1, obj.int_field)
+        self.assertEqual(hash(FrozenDataclass(1)), hash(obj))
+
+    def test_lazy_dict_to_dataclass_generic(self):
+        self.assertEqual(
+            GenericDataclass(1),
+            lazy_dict_to_dataclass(
+                GenericDataclass[int],
+                {"t_field": "1"},
+                deserialization_func=lambda cls, obj: cls(obj),
+            ),
+        )
+
+    def test_lazy_dict_to_dataclass_pickle(self):
+        obj = lazy_dict_to_dataclass(
+            ExampleDataclass,
+            {"int_field": 1, "list_field": [2]},
+            deserialization_func=lambda cls, obj: obj,
+        )
+        expected_obj = ExampleDataclass(1, [2])
+
+        with self.subTest("Pickle as the original dataclass"):
+            unpickled_obj = pickle.loads(pickle.dumps(obj))
+
+            self.assertIs(ExampleDataclass, type(unpickled_obj))
+            self.assertEqual(expected_obj, unpickled_obj)
+
+        with self.subTest("Copy as the original dataclass"):
+            copied_obj = deepcopy(obj)
+
+            self.assertIs(ExampleDataclass, type(copied_obj))
+            self.assertEqual(expected_obj, copied_obj)
+
+    def test_lazy_dict_to_dataclass_namespace(self):
+        namespace = set(vars(ExampleDataclass))
+        objs = [
+            lazy_dict_to_dataclass(ExampleDataclass, {"int_field": 1, "list_field": []})
+            for _ in range(2)
+        ]
+
+        with self.subTest("Leave dataclass namespace unchanged"):
+            self.assertEqual(namespace, set(vars(ExampleDataclass)))
+
+        with self.subTest("Reuse lazy subclass"):
+            self.assertIs(type(objs[0]), type(objs[1]))
+
+    def test_lazy_dict_to_dataclass_post_init(self):
+        self.assertEqual(
+            1, lazy_dict_to_dataclass(PostInitDataclass, {"int_field": 1}).int_field
+        )
+
+    def test_lazy_dict_to_dataclass_errors(self):
+        with self.subTest("Fail non-dict deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            lazy_dict_to_dataclass(ExampleDataclass, [])
+
+        with self.subTest("Fail missing fields"), self.assertRaises(
+            DeserializationError
+        ):
+            lazy_dict_to_dataclass(ExampleDataclass, {"int_field": 1})
+
+        with self.subTest("Fail invalid field on access"):
+            obj = lazy_dict_to_dataclass(
+                ExampleDataclass, {"int_field": "a", "list_field": []}
+            )
+
+            with self.assertRaises(DeserializationError):
+                obj.int_field
+
+        with self.subTest("Fail dataclass with slots"), self.assertRaises(
+            DeserializationError
+        ):
+            lazy_dict_to_dataclass(SlotsDataclass, {"int_field": 1})
+
+        with self.subTest("Fail unknown attribute"), self.assertRaises(AttributeError):
+            lazy_dict_to_dataclass(
+                ExampleDataclass, {"int_field": 1, "list_field": []}
+            ).unknown_field
+
+    def test_lazy_list(self):
+        deserialized_values = []
+
+        def deserialization_func(cls, obj):
+            if not isinstance(obj, int):
+                raise DeserializationError("Cannot deserialize {!r}".format(obj))
+
+            deserialized_values.append(obj)
+            return cls(obj)
+
+        lst = LazyList(str, [1, 2, 3, "a"], deserialization_func, path="values")
+
+        with self.subTest("Defer value deserialization"):
+            self.assertEqual(4, len(lst))
+            self.assertEqual([], deserialized_values)
+
+        with self.subTest("Deserialize value on first access"):
+            self.assertEqual("2", lst[1])
+            self.assertEqual("2", lst[-3])
+            self.assertEqual([2], deserialized_values)
+
+        with self.subTest("Slice"):
+            self.assertEqual(["1", "2"], lst[:2])
+            self.assertEqual([2, 1], deserialized_values)
+
+        with self.subTest("Fail invalid value on access, with path"):
+            with self.assertRaisesRegex(DeserializationError, r"values\[3\]"):
+                lst[3]
+
+        with self.subTest("Compare equal to list"):
+            self.assertEqual(["1", "2"], LazyList(str, [1, 2], deserialization_func))
+            self.assertNotEqual(["1"], LazyList(str, [1, 2], deserialization_func))
+
+    def test_lazy_dict(self):
+        deserialized_values = []
+
+        def deserialization_func(cls, obj):
+            deserialized_values.append(obj)
+            return cls(obj)
+
+        dct = LazyDict(str, int, {1: "1", 2: "2"}, deserialization_func)
+
+        with self.subTest("Deserialize keys immediately"):
+            self.assertEqual(["1", "2"], list(dct))
+            self.assertIn("1", dct)
+            self.assertEqual([1, 2], deserialized_values)
+
+        with self.subTest("Deserialize value on first access"):
+            self.assertEqual(1, dct["1"])
+            self.assertEqual(1, dct["1"])
+            self.assertEqual([1, 2, "1"], deserialized_values)
+
+        with self.subTest("Compare equal to dict"):
+            self.assertEqual({"1": 1, "2": 2}, dct)
+
+        with self.subTest("Fail missing key"), self.assertRaises(KeyError):
+            dct["3"]
+
+    def test_lazy_collection_deserialization(self):
+        def deserialization_func(cls, obj):
+            return obj
+
+        with self.subTest("Deserialize list lazily"):
+            self.assertIsInstance(
+                lazy_collection_deserialization(
+                    List[ExampleDataclass], [], deserialization_func
+                ),
+                LazyList,
+            )
+
+        with self.subTest("Deserialize dict lazily"):
+            self.assertIsInstance(
+                lazy_collection_deserialization(
+                    Dict[str, ExampleDataclass], {}, deserialization_func
+                ),
+                LazyDict,
+            )
+
+        with self.subTest("Leave noop deserialized values"):
+            self.assertIsNone(
+                lazy_collection_deserialization(
+                    List[int],
+                    [],
+                    deserialization_func,
+                    is_noop_deserialization=lambda cls: cls is int,
+                )
+            )
+
+        with self.subTest("Leave other types"):
+            self.assertIsNone(
+                lazy_collection_deserialization(
+                    ExampleDataclass, {}, deserialization_func
+                )
+            )
+            self.assertIsNone(
+                lazy_collection_deserialization(List[int], {}, deserialization_func)
+            )
+            self.assertIsNone(
+                lazy_collection_deserialization(list, [], deserialization_func)
+            )
@@ -41,3 +41,30 @@ class TestListSerialization(TestCase):
                 List[int], [1, 2], deserialization_func=lambda cls, obj: obj - 1
             ),
         )
+
+    def test_list_deserialization_noop_types(self):
+        def fail_deserialization(cls, obj):
+            raise AssertionError("Deserialized {!r} individually".format(obj))
+
+        lst = [1, 2]
+
+        with self.subTest("Check noop types in bulk, copying without rebuilding"):
+            deserialized_lst = list_deserialization(
+                List[int],
+                lst,
+                deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
+
+            self.assertEqual(lst, deserialized_lst)
+            self.assertIsNot(lst, deserialized_lst)
+
+        with self.subTest("Fail invalid noop types"), self.assertRaises(
+            DeserializationError
+        ):
+            list_deserialization(
+                List[str],
+                lst,
+                deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
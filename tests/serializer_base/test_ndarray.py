@@ -0,0 +1,108 @@
+from os import environ
+from unittest import TestCase, skipIf
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    SerializationError,
+)
+
+try:
+    import numpy
+
+    from dataclasses_serialization.serializer_base.ndarray import (
+        ndarray_deserialization,
+        ndarray_serialization,
+    )
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+if "OPTIONAL_MODULES" in environ:
+    numpy_installed = "numpy" in environ["OPTIONAL_MODULES"]
+
+
+@skipIf(not numpy_installed, "NumPy not installed")
+class TestNDArray(TestCase):
+    def test_ndarray_serialization_basic(self):
+        obj = numpy.array([[1, 2], [3, 4]], dtype="<i2")
+        serialized_obj = {
+            "dtype": "<i2",
+            "shape": [2, 2],
+            "data": b"\x01\x00\x02\x00\x03\x00\x04\x00",
+        }
+
+        with self.subTest("Serialize ndarray"):
+            self.assertEqual(
+                serialized_obj,
+                ndarray_serialization(obj, data_serialization_func=bytes),
+            )
+
+        with self.subTest("Serialize non-contiguous ndarray"):
+            self.assertEqual(
+                b"\x01\x00\x03\x00\x02\x00\x04\x00",
+                ndarray_serialization(obj.T, data_serialization_func=bytes)["data"],
+            )
+
+        with self.subTest("Deserialize ndarray"):
+            deserialized_obj = ndarray_deserialization(numpy.ndarray, serialized_obj)
+
+            self.assertEqual(obj.dtype, deserialized_obj.dtype)
+            self.assertTrue(numpy.array_equal(obj, deserialized_obj))
+
+        with self.subTest("Deserialize ndarray without copying"):
+            deserialized_obj = ndarray_deserialization(numpy.ndarray, serialized_obj)
+
+            self.assertFalse(deserialized_obj.flags.owndata)
+            self.assertFalse(deserialized_obj.flags.writeable)
+
+    def test_ndarray_serialization_data_func(self):
+        obj = numpy.arange(3, dtype="<u1")
+
+        serialized_obj = ndarray_serialization(
+            obj, data_serialization_func=lambda data: bytes(data).hex()
+        )
+
+        self.assertEqual(
+            {"dtype": "|u1", "shape": [3], "data": "000102"}, serialized_obj
+        )
+        self.assertTrue(
+            numpy.array_equal(
+                obj,
+                ndarray_deserialization(
+                    numpy.ndarray,
+                    serialized_obj,
+                    data_deserialization_func=lambda cls, data: bytes.fromhex(data),
+                ),
+            )
+        )
+
+    def test_ndarray_serialization_invalid(self):
+        with self.subTest("Fail non-ndarray serialization"), self.assertRaises(
+            SerializationError
+        ):
+            ndarray_serialization([1, 2, 3])
+
+        with self.subTest("Fail object ndarray serialization"), self.assertRaises(
+            SerializationError
+        ):
+            ndarray_serialization(numpy.array([object()]))
+
+        with self.subTest("Fail non-dict deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            ndarray_deserialization(numpy.ndarray, [1, 2, 3])
+
+        with self.subTest("Fail mismatched shape deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            ndarray_deserialization(
+                numpy.ndarray, {"dtype": "|u1", "shape": [2, 2], "data": b"\x00"}
+            )
+
+        with self.subTest("Fail invalid data deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            ndarray_deserialization(
+                numpy.ndarray, {"dtype": "|u1", "shape": [1], "data": "\x00"}
+            )
@@ -2,6 +2,8 @@ from unittest import TestCase
 
 from dataclasses_serialization.serializer_base import (
     DeserializationError,
+    Serializer,
+    is_noop_serializable_collection,
     noop_deserialization,
     noop_serialization,
 )
@@ -22,3 +24,37 @@ class TestNoopSerialization(TestCase):
             DeserializationError
         ):
             noop_deserialization(int, obj)
+
+    def test_is_noop_serializable_collection(self):
+        serializer = Serializer(
+            {(str, int, bool): noop_serialization, float: lambda obj: obj}, {}
+        )
+        primitive_types = frozenset({str, int, float})
+
+        with self.subTest("Collections of primitives serialized as is"):
+            self.assertTrue(
+                is_noop_serializable_collection(serializer, [1, "a"], primitive_types)
+            )
+            self.assertTrue(
+                is_noop_serializable_collection(serializer, {"a": 1}, primitive_types)
+            )
+
+        with self.subTest("Primitives with other serialization"):
+            self.assertFalse(
+                is_noop_serializable_collection(serializer, [1, 1.0], primitive_types)
+            )
+
+        with self.subTest("Values not of primitive types"):
+            self.assertFalse(
+                is_noop_serializable_collection(serializer, [True], primitive_types)
+            )
+            self.assertFalse(
+                is_noop_serializable_collection(
+                    serializer, {("a",): 1}, primitive_types
+                )
+            )
+
+        with self.subTest("Other collection types"):
+            self.assertFalse(
+                is_noop_serializable_collection(serializer, (1, 2), primitive_types)
+            )
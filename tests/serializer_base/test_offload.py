@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from os import getpid
+from dataclasses import dataclass
+from threading import current_thread
+from typing import List
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    Offloader,
+    Serializer,
+    estimate_size,
+)
+
+
+def record_pid(obj):
+    return obj + [getpid()]
+
+
+# Lambdas, which cannot be pickled, as the serializer is sent to worker processes by name
+ExampleSerializer = Serializer(
+    {list: lambda obj: record_pid(obj)}, {list: lambda cls, obj: record_pid(obj)}
+)
+
+
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestOffload(TestCase):
+    def test_estimate_size(self):
+        @dataclass
+        class ExampleDataclass:
+            int_field: int
+            list_field: List[int]
+
+        with self.subTest("Estimate size of containers"):
+            self.assertEqual(3, estimate_size([1, 2, 3]))
+            self.assertEqual(2, estimate_size({"a": 1, "b": 2}))
+            self.assertEqual(12, estimate_size("Hello, world"))
+
+        with self.subTest("Estimate size of dataclass"):
+            self.assertEqual(4, estimate_size(ExampleDataclass(0, [1, 2, 3])))
+
+        with self.subTest("Estimate size of other objects"):
+            self.assertEqual(1, estimate_size(0))
+
+    def test_offloader(self):
+        threads = []
+
+        def record_thread(obj):
+            threads.append(current_thread())
+
+            return obj
+
+        serializer = Serializer(
+            {list: record_thread}, {list: lambda cls, obj: record_thread(obj)}
+        )
+
+        with ThreadPoolExecutor(1) as executor:
+            offloader = Offloader(executor=executor, threshold=3)
+
+            with self.subTest("Serialize small object inline"):
+                self.assertEqual(
+                    [1, 2], run_async(offloader.serialize(serializer, [1, 2]))
+                )
+                self.assertIs(current_thread(), threads.pop())
+
+            with self.subTest("Serialize large object in executor"):
+                self.assertEqual(
+                    [1, 2, 3], run_async(offloader.serialize(serializer, [1, 2, 3]))
+                )
+                self.assertIsNot(current_thread(), threads.pop())
+
+            with self.subTest("Deserialize small object inline"):
+                self.assertEqual(
+                    [1, 2], run_async(offloader.deserialize(serializer, list, [1, 2]))
+                )
+                self.assertIs(current_thread(), threads.pop())
+
+            with self.subTest("Deserialize large object in executor"):
+                self.assertEqual(
+                    [1, 2, 3],
+                    run_async(offloader.deserialize(serializer, list, [1, 2, 3])),
+                )
+                self.assertIsNot(current_thread(), threads.pop())
+
+        with self.subTest("Custom size estimate"):
+            offloader = Offloader(threshold=3, size_estimate=lambda obj: 3)
+
+            run_async(offloader.serialize(serializer, []))
+            self.assertIsNot(current_thread(), threads.pop())
+
+    def test_offloader_process_pool(self):
+        with ProcessPoolExecutor(1) as executor:
+            offloader = Offloader(executor=executor, threshold=0)
+
+            with self.subTest("Serialize in process pool"):
+                *serialized_obj, pid = run_async(
+                    offloader.serialize(ExampleSerializer, [1, 2])
+                )
+
+                self.assertEqual([1, 2], serialized_obj)
+                self.assertNotEqual(getpid(), pid)
+
+            with self.subTest("Deserialize in process pool"):
+                *obj, pid = run_async(
+                    offloader.deserialize(ExampleSerializer, list, [1, 2])
+                )
+
+                self.assertEqual([1, 2], obj)
+                self.assertNotEqual(getpid(), pid)
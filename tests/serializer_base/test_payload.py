@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    PayloadCache,
+    Serializer,
+    is_immutable_type,
+)
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    digits: int
+
+
+@dataclass(frozen=True)
+class Node:
+    value: int
+    next: Optional["Node"] = None
+
+
+@dataclass(frozen=True)
+class Bag:
+    items: List[int]
+
+
+@dataclass
+class Account:
+    currency: Currency
+
+
+@dataclass
+class MutableCurrency:
+    code: str
+    digits: int
+
+
+class TestPayload(TestCase):
+    def test_is_immutable_type(self):
+        with self.subTest("Immutable types"):
+            for cls in [
+                int,
+                str,
+                Currency,
+                Node,
+                Optional[Currency],
+                Tuple[int, ...],
+                Tuple[str, Currency],
+                FrozenSet[str],
+            ]:
+                with self.subTest(cls=cls):
+                    self.assertTrue(is_immutable_type(cls))
+
+        with self.subTest("Mutable types"):
+            for cls in [list, List[int], Dict[str, int], Bag, Account, Tuple[list]]:
+                with self.subTest(cls=cls):
+                    self.assertFalse(is_immutable_type(cls))
+
+    def test_payload_cache(self):
+        parsed_payloads = []
+
+        def deserialization_func(cls, payload):
+            parsed_payloads.append(payload)
+            code, digits = payload.split(":")
+            return cls(code, int(digits))
+
+        payload_cache = PayloadCache(maxsize=2, max_payload_size=10)
+
+        with self.subTest("Parse payload once"):
+            first = payload_cache.deserialize(deserialization_func, Currency, "GBP:2")
+            second = payload_cache.deserialize(deserialization_func, Currency, "GBP:2")
+
+            self.assertIs(first, second)
+            self.assertEqual(["GBP:2"], parsed_payloads)
+
+        with self.subTest("Parse payload each time for mutable types"):
+            parsed_payloads.clear()
+            payload_cache.deserialize(deserialization_func, MutableCurrency, "GBP:2")
+            payload_cache.deserialize(deserialization_func, MutableCurrency, "GBP:2")
+
+            self.assertEqual(["GBP:2", "GBP:2"], parsed_payloads)
+
+        with self.subTest("Parse large payloads each time"):
+            parsed_payloads.clear()
+            payload_cache.deserialize(deserialization_func, Currency, "GBP:" + "2" * 10)
+            payload_cache.deserialize(deserialization_func, Currency, "GBP:" + "2" * 10)
+
+            self.assertEqual(2, len(parsed_payloads))
+
+        with self.subTest("Evict least recently used payloads"):
+            for code in ["USD", "EUR", "GBP"]:
+                payload_cache.deserialize(deserialization_func, Currency, code + ":2")
+
+            self.assertEqual(2, payload_cache.stats.size)
+            self.assertEqual(2, payload_cache.stats.evictions)
+
+    def test_serializer_payload_cache(self):
+        serializer = Serializer(
+            {},
+            {
+                object: lambda cls, payload: cls(
+                    *(
+                        int(part) if part.isdigit() else part
+                        for part in payload.split(":")
+                    )
+                )
+            },
+            payload_cache=PayloadCache(),
+        )
+
+        self.assertIs(
+            serializer.deserialize(Currency, "GBP:2"),
+            serializer.deserialize(Currency, "GBP:2"),
+        )
+        self.assertEqual(1, serializer.cache_stats()["payloads"].hits)
@@ -0,0 +1,101 @@
+import json
+from dataclasses import dataclass
+from io import BytesIO
+from os import path
+from tempfile import TemporaryDirectory, TemporaryFile
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    RecordStore,
+    Serializer,
+    dataclass_to_dict,
+    dict_to_dataclass,
+    write_records,
+)
+
+
+@dataclass
+class ExampleDataclass:
+    name: str
+    value: int
+
+
+ExampleStrSerializer = Serializer(
+    serialization_functions={
+        dataclass: lambda obj: json.dumps(dataclass_to_dict(obj)),
+    },
+    deserialization_functions={
+        dataclass: lambda cls, serialized_obj: dict_to_dataclass(
+            cls, json.loads(serialized_obj)
+        ),
+    },
+)
+
+
+class TestRecords(TestCase):
+    def test_record_store(self):
+        objs = [ExampleDataclass("élan", i) for i in range(100)]
+
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, "records")
+
+            with self.subTest("Write records from iterator"):
+                self.assertEqual(
+                    100, write_records(ExampleStrSerializer, iter(objs), file_path)
+                )
+
+            with RecordStore(
+                ExampleStrSerializer, ExampleDataclass, file_path
+            ) as store:
+                with self.subTest("Length of record store"):
+                    self.assertEqual(100, len(store))
+
+                with self.subTest("Deserialize records by index"):
+                    self.assertEqual(objs[42], store[42])
+                    self.assertEqual(objs[-1], store[-1])
+                    self.assertEqual(objs[10:20:3], store[10:20:3])
+
+                with self.subTest("Iterate over records"):
+                    self.assertEqual(objs, list(store))
+
+                with self.subTest("Serialized record"):
+                    self.assertEqual(
+                        b'{"name": "\\u00e9lan", "value": 0}', store.record(0)
+                    )
+
+                with self.subTest("Fail index out of range"), self.assertRaises(
+                    IndexError
+                ):
+                    store[100]
+
+    def test_record_store_file_object(self):
+        objs = [ExampleDataclass("Fred", 1), ExampleDataclass("Jane", 2)]
+
+        with TemporaryFile() as f:
+            write_records(ExampleStrSerializer, objs, f)
+            f.flush()
+
+            with RecordStore(ExampleStrSerializer, ExampleDataclass, f) as store:
+                self.assertEqual(objs, list(store))
+
+    def test_record_store_empty(self):
+        with TemporaryFile() as f:
+            self.assertEqual(0, write_records(ExampleStrSerializer, [], f))
+            f.flush()
+
+            with RecordStore(ExampleStrSerializer, ExampleDataclass, f) as store:
+                self.assertEqual([], list(store))
+
+    def test_record_store_invalid(self):
+        buffer = BytesIO()
+        write_records(ExampleStrSerializer, [ExampleDataclass("Fred", 1)], buffer)
+
+        for contents in [b"", b"Hello, world", buffer.getvalue()[:-1]]:
+            with self.subTest("Fail open invalid record store", contents=contents):
+                with TemporaryFile() as f:
+                    f.write(contents)
+                    f.flush()
+
+                    with self.assertRaises(DeserializationError):
+                        RecordStore(ExampleStrSerializer, ExampleDataclass, f)
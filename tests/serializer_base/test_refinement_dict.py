@@ -60,6 +60,33 @@ class TestRefinementDict(TestCase):
 
             self.assertEqual("b", dct[2])
 
+    def test_refinement_dict_get_subset(self):
+        dct = RefinementDict({a: "a", c: "c"}, fallback=RefinementDict({d: "d"}))
+
+        with self.subTest("Most precise collection containing subset"):
+            self.assertEqual("a", dct.get_subset(frozenset({1})))
+            self.assertEqual("c", dct.get_subset(frozenset({1, 2})))
+
+        with self.subTest("Fallback collection containing subset"):
+            self.assertEqual("d", dct.get_subset(frozenset({3})))
+
+        with self.subTest("Fail no collection containing subset"), self.assertRaises(
+            KeyError
+        ):
+            dct.get_subset(frozenset({1, 3}))
+
+        with self.subTest("Cached subset lookups"):
+            self.assertEqual("c", dct.get_subset(frozenset({1, 2})))
+            self.assertIn(frozenset({1, 2}), dct.cached_subset_lookups)
+
+        with self.subTest("Setting a value clears cached subset lookups"):
+            dct[frozenset({1, 2, 3})] = "e"
+
+            self.assertEqual("e", dct.get_subset(frozenset({1, 3})))
+
+        with self.subTest("Unhashable subsets are looked up uncached"):
+            self.assertEqual("a", dct.get_subset({1}))
+
     def test_refinement_dict_lattice(self):
         dct = RefinementDict({w: "w", x: "x"}, is_element=le)
 
@@ -95,3 +122,43 @@ class TestRefinementDict(TestCase):
 
         with self.subTest("Fall back to default value"):
             self.assertEqual("x", dct[x])
+
+    def test_refinement_dict_cache_lookups(self):
+        dct = RefinementDict({a: "a", c: "c"}, is_element=lambda elem, st: elem in st)
+        cached_dct = RefinementDict(
+            {a: "a", c: "c"}, is_element=lambda elem, st: elem in st, cache_lookups=True
+        )
+
+        with self.subTest("Cached lookups match uncached lookups"):
+            for elem in [1, 2]:
+                self.assertEqual(dct[elem], cached_dct[elem])
+                self.assertEqual(dct[elem], cached_dct[elem])
+
+        with self.subTest("Cached missing keys raise KeyError"):
+            for _ in range(2):
+                with self.assertRaises(KeyError):
+                    cached_dct[3]
+
+        with self.subTest("Setting a value clears the cache"):
+            cached_dct[b] = "b"
+
+            self.assertEqual("b", cached_dct[2])
+
+        with self.subTest("Load cache state into a dictionary with the same keys"):
+            new_dct = RefinementDict(
+                {a: "a", b: "b", c: "c"},
+                is_element=lambda elem, st: elem in st,
+                cache_lookups=True,
+            )
+            new_dct.load_cache_state(cached_dct.cache_state())
+
+            self.assertEqual({2: b}, new_dct.cached_lookups)
+            self.assertEqual("b", new_dct[2])
+
+        with self.subTest("Ignore cache state of a dictionary with different keys"):
+            new_dct = RefinementDict(
+                {a: "a"}, is_element=lambda elem, st: elem in st, cache_lookups=True
+            )
+            new_dct.load_cache_state(cached_dct.cache_state())
+
+            self.assertEqual({}, new_dct.cached_lookups)
@@ -1,15 +1,75 @@
-from dataclasses import asdict, dataclass
-from typing import Optional, Union
-from unittest import TestCase
+import gc
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+from dataclasses import asdict, dataclass, field, make_dataclass
+from types import ModuleType
+from typing import Dict, List, Optional, Union
+from unittest import TestCase, mock
 
 from dataclasses_serialization.serializer_base import (
     DeserializationError,
     SerializationError,
     Serializer,
+    dataclass_to_dict,
     dict_serialization,
     noop_deserialization,
     noop_serialization,
+    serializer_reference,
 )
+from dataclasses_serialization.serializer_base.typing import (
+    dataclass_field_types_cache,
+)
+
+
+@dataclass
+class Leaf:
+    name: str
+
+
+@dataclass
+class Tree:
+    leaves: List[Leaf]
+    branches: Dict[str, Optional["Tree"]]
+
+
+@dataclass(frozen=True)
+class FrozenLeaf:
+    name: str
+
+
+@dataclass
+class GraphNode:
+    name: str
+    children: List["GraphNode"]
+    parent: Optional["GraphNode"] = None
+
+
+ExampleSerializer = Serializer(
+    {},
+    {
+        (str, type(None)): noop_deserialization,
+        list: lambda cls, lst: [
+            ExampleSerializer.deserialize(cls.__args__[0], item) for item in lst
+        ],
+        dict: lambda cls, dct: {
+            key: ExampleSerializer.deserialize(cls.__args__[1], value)
+            for key, value in dct.items()
+        },
+    },
+)
+
+
+def deserialize_in_worker(cls, serialized_obj):
+    """
+    Deserialize using ExampleSerializer, with the number of lookups cached before
+    """
+
+    cached_lookups = ExampleSerializer.cache_stats()["deserialization_functions"].size
+
+    return cached_lookups, ExampleSerializer.deserialize(cls, serialized_obj)
 
 
 class TestSerializer(TestCase):
@@ -100,6 +160,167 @@ class TestSerializer(TestCase):
                 ),
             )
 
+    def test_serializer_omit_fields(self):
+        @dataclass
+        class ExampleDataclass:
+            int_field: int
+            str_field: str = ""
+            optional_field: Optional[str] = None
+            list_field: list = field(default_factory=list)
+
+        @dataclass
+        class AnotherDataclass:
+            optional_field: Optional[str] = None
+
+        def make_serializer(**kwargs):
+            serializer = Serializer(
+                {
+                    dict: lambda obj: dict_serialization(
+                        obj, value_serialization_func=serializer.serialize
+                    ),
+                    (int, str, list, type(None)): noop_serialization,
+                },
+                {},
+                **kwargs
+            )
+
+            return serializer
+
+        obj = ExampleDataclass(1, "", "Hello, world")
+
+        with self.subTest("Serialize all fields by default"):
+            self.assertEqual(
+                {
+                    "int_field": 1,
+                    "str_field": "",
+                    "optional_field": "Hello, world",
+                    "list_field": [],
+                },
+                make_serializer().serialize(obj),
+            )
+
+        with self.subTest("Omit default fields"):
+            self.assertEqual(
+                {"int_field": 1, "optional_field": "Hello, world"},
+                make_serializer(omit_defaults=True).serialize(obj),
+            )
+
+        with self.subTest("Omit None fields"):
+            self.assertEqual(
+                {"int_field": 1, "str_field": "", "list_field": []},
+                make_serializer(omit_none=True).serialize(
+                    ExampleDataclass(1, "", None)
+                ),
+            )
+
+        with self.subTest("Override per class"):
+            serializer = make_serializer(omit_defaults=True)
+            serializer.register_serializer(
+                AnotherDataclass,
+                lambda obj: serializer.serialize(dataclass_to_dict(obj)),
+            )
+
+            self.assertEqual(
+                {"optional_field": None}, serializer.serialize(AnotherDataclass())
+            )
+            self.assertEqual(
+                {"int_field": 1}, serializer.serialize(ExampleDataclass(1))
+            )
+
+    def test_serializer_memoize(self):
+        serialization_calls = []
+
+        def str_serializer(obj):
+            serialization_calls.append(obj)
+            return obj
+
+        serializer = Serializer(
+            {
+                str: str_serializer,
+                list: lambda lst: [serializer.serialize(item) for item in lst],
+                dict: lambda obj: dict_serialization(
+                    obj, value_serialization_func=serializer.serialize
+                ),
+            },
+            {},
+            memoize=True,
+        )
+
+        leaf = FrozenLeaf("a")
+
+        with self.subTest("Serialize frozen dataclasses once per call"):
+            serialized_obj = serializer.serialize([leaf, leaf, FrozenLeaf("b")])
+
+            self.assertEqual(
+                [{"name": "a"}, {"name": "a"}, {"name": "b"}], serialized_obj
+            )
+            self.assertIs(serialized_obj[0], serialized_obj[1])
+            self.assertEqual(["a", "b"], serialization_calls)
+
+        with self.subTest("Forget memoized objects between calls"):
+            serializer.serialize([leaf])
+
+            self.assertEqual(["a", "b", "a"], serialization_calls)
+
+        with self.subTest("Serialize mutable dataclasses every time"):
+            serialization_calls.clear()
+            serializer.serialize([Leaf("a")] * 2)
+
+            self.assertEqual(["a", "a"], serialization_calls)
+
+    def test_serializer_references(self):
+        serializer = Serializer(
+            {
+                (str, type(None)): noop_serialization,
+                list: lambda lst: [serializer.serialize(item) for item in lst],
+                dict: lambda obj: dict_serialization(
+                    obj, value_serialization_func=serializer.serialize
+                ),
+            },
+            {
+                (str, type(None)): noop_deserialization,
+                list: lambda cls, lst: [
+                    serializer.deserialize(cls.__args__[0], item) for item in lst
+                ],
+            },
+            references=True,
+        )
+
+        root = GraphNode("root", [])
+        child = GraphNode("child", [], root)
+        root.children.extend([child, child])
+
+        serialized_root = {
+            "$id": 0,
+            "name": "root",
+            "children": [
+                {"$id": 1, "name": "child", "children": [], "parent": {"$ref": 0}},
+                {"$ref": 1},
+            ],
+            "parent": None,
+        }
+
+        with self.subTest("Serialize shared and cyclic references"):
+            self.assertEqual(serialized_root, serializer.serialize(root))
+
+        with self.subTest("Deserialize shared and cyclic references"):
+            deserialized_root = serializer.deserialize(GraphNode, serialized_root)
+
+            self.assertEqual("root", deserialized_root.name)
+            self.assertIs(deserialized_root.children[0], deserialized_root.children[1])
+            self.assertIs(deserialized_root, deserialized_root.children[0].parent)
+
+        with self.subTest("Serialize unshared dataclasses without ids"):
+            self.assertEqual(
+                {"name": "leaf", "children": [], "parent": None},
+                serializer.serialize(GraphNode("leaf", [])),
+            )
+
+        with self.subTest("Fail unknown reference"), self.assertRaises(
+            DeserializationError
+        ):
+            serializer.deserialize(GraphNode, {"$ref": 0})
+
     def test_serializer_unpickleable_dataclass(self):
         from _thread import LockType
         from threading import Lock
@@ -234,3 +455,441 @@ class TestSerializer(TestCase):
 
         with self.subTest("Succeed at deserialization after registration"):
             self.assertEqual(0, serializer.deserialize(int, "0"))
+
+    def test_serializer_registration_on_import(self):
+        serializer = Serializer({}, {})
+        module_name = "example_optional_module"
+
+        class ExampleClass:
+            pass
+
+        @serializer.register_on_import(module_name)
+        def register_example_class(module):
+            serializer.register(
+                module.ExampleClass, lambda obj: "example", lambda cls, obj: cls()
+            )
+
+        with self.subTest("Fail serialization before import"), self.assertRaises(
+            SerializationError
+        ):
+            serializer.serialize(ExampleClass())
+
+        module = ModuleType(module_name)
+        module.ExampleClass = ExampleClass
+        sys.modules[module_name] = module
+        self.addCleanup(sys.modules.pop, module_name)
+
+        with self.subTest("Succeed at serialization after import"):
+            self.assertEqual("example", serializer.serialize(ExampleClass()))
+
+        with self.subTest("Succeed at deserialization after import"):
+            self.assertIsInstance(
+                serializer.deserialize(ExampleClass, "example"), ExampleClass
+            )
+
+        with self.subTest("Register immediately if already imported"):
+            serializer.register_on_import(
+                module_name,
+                lambda module: serializer.register_serializer(
+                    module.ExampleClass, lambda obj: "registered"
+                ),
+            )
+
+            self.assertEqual("registered", serializer.serialize(ExampleClass()))
+
+    def test_serializer_registration_on_import_checks(self):
+        serializer = Serializer({}, {})
+        registered_modules = []
+
+        class ExampleClass:
+            pass
+
+        @serializer.register_on_import("example_first_module")
+        def register_first_module(module):
+            registered_modules.append(module.__name__)
+
+            # Runs the pending registrations again, from within a registration
+            serializer.register(
+                ExampleClass, lambda obj: "example", lambda cls, obj: cls()
+            )
+            serializer.serialize(ExampleClass())
+
+        @serializer.register_on_import("example_second_module")
+        def register_second_module(module):
+            registered_modules.append(module.__name__)
+
+        with self.subTest("Skip checks until modules are imported"):
+            serializer.run_import_registrations()
+
+            class UncheckedRegistrations(dict):
+                def __iter__(self):
+                    raise AssertionError("Checked pending registrations")
+
+            with mock.patch.object(
+                serializer,
+                "import_registrations",
+                UncheckedRegistrations(serializer.import_registrations),
+            ), self.assertRaises(SerializationError):
+                serializer.serialize(ExampleClass())
+
+        for module_name in ["example_first_module", "example_second_module"]:
+            sys.modules[module_name] = ModuleType(module_name)
+            self.addCleanup(sys.modules.pop, module_name)
+
+        with self.subTest("Run each registration once, when run within registrations"):
+            serializer.run_import_registrations()
+
+            self.assertEqual(
+                ["example_first_module", "example_second_module"], registered_modules
+            )
+            self.assertEqual({}, serializer.import_registrations)
+
+    def test_serializer_warm(self):
+        def make_serializer():
+            return Serializer(
+                {(str, int, list, dict, type(None)): noop_serialization},
+                {
+                    (str, int, type(None)): noop_deserialization,
+                    list: lambda cls, lst: [
+                        serializer.deserialize(cls.__args__[0], item) for item in lst
+                    ],
+                    dict: lambda cls, dct: {
+                        key: serializer.deserialize(cls.__args__[1], value)
+                        for key, value in dct.items()
+                    },
+                },
+            )
+
+        serialized_tree = {
+            "leaves": [{"name": "a"}],
+            "branches": {"b": {"leaves": [], "branches": {}}, "c": None},
+        }
+        tree = Tree([Leaf("a")], {"b": Tree([], {}), "c": None})
+
+        serializer = make_serializer()
+        plans = serializer.warm([Tree])
+
+        with self.subTest("Precompile contained types"):
+            self.assertEqual({Tree, Leaf}, set(plans.dataclass_field_types))
+            self.assertEqual(
+                {
+                    Tree,
+                    List[Leaf],
+                    Dict[str, Optional[Tree]],
+                    Optional[Tree],
+                    Leaf,
+                    str,
+                    type(None),
+                },
+                set(plans.deserialization_functions[2])
+                | set(plans.deserialization_functions[3][2]),
+            )
+
+        with self.subTest("Deserialize after warming"):
+            self.assertEqual(tree, serializer.deserialize(Tree, serialized_tree))
+
+        with self.subTest("Load pickled plans"):
+            dataclass_field_types_cache.pop(Tree)
+
+            serializer = make_serializer()
+            serializer.load_plans(pickle.loads(pickle.dumps(plans)))
+
+            self.assertIn(Tree, dataclass_field_types_cache)
+            self.assertEqual(
+                plans.deserialization_functions[2],
+                serializer.deserialization_functions.cached_lookups,
+            )
+            self.assertEqual(tree, serializer.deserialize(Tree, serialized_tree))
+
+        def deserialization_misses(load_plans):
+            """
+            Cache misses in looking up types while deserializing the tree
+            """
+
+            for cls in [Tree, Leaf]:
+                dataclass_field_types_cache.pop(cls, None)
+
+            serializer = make_serializer()
+
+            if load_plans:
+                serializer.load_plans(plans)
+
+            caches = [
+                serializer.deserialization_functions.cached_lookups,
+                serializer.deserialization_functions.fallback.cached_lookups,
+                dataclass_field_types_cache,
+            ]
+            misses = [cache.misses for cache in caches]
+
+            self.assertEqual(tree, serializer.deserialize(Tree, serialized_tree))
+
+            return sum(cache.misses for cache in caches) - sum(misses)
+
+        with self.subTest("Look up types on first deserialization"):
+            self.assertGreater(deserialization_misses(load_plans=False), 0)
+
+        with self.subTest("Avoid type lookups after loading plans"):
+            self.assertEqual(0, deserialization_misses(load_plans=True))
+
+    def test_serializer_is_noop_deserialization(self):
+        serializer = Serializer(
+            {}, {int: noop_deserialization, str: lambda cls, obj: str(obj)}
+        )
+
+        with self.subTest("Noop deserialization"):
+            self.assertTrue(serializer.is_noop_deserialization(int))
+
+        with self.subTest("Other deserialization"):
+            self.assertFalse(serializer.is_noop_deserialization(str))
+
+        with self.subTest("No deserialization"):
+            self.assertFalse(serializer.is_noop_deserialization(float))
+
+    def test_serializer_is_noop_serialization(self):
+        serializer = Serializer({int: noop_serialization, str: lambda obj: obj}, {})
+
+        with self.subTest("Noop serialization"):
+            self.assertTrue(serializer.is_noop_serialization(1))
+
+        with self.subTest("Other serialization"):
+            self.assertFalse(serializer.is_noop_serialization("a"))
+
+        with self.subTest("No serialization"):
+            self.assertFalse(serializer.is_noop_serialization(1.0))
+
+    def test_serializer_is_noop_serialization_type(self):
+        class Unconstructable:
+            def __init__(self, value):
+                self.value = value
+
+        serializer = Serializer(
+            {(int, Unconstructable): noop_serialization, bool: lambda obj: obj}, {}
+        )
+
+        with self.subTest("Noop serialization"):
+            self.assertTrue(serializer.is_noop_serialization_type(int))
+            self.assertTrue(serializer.is_noop_serialization_type(Unconstructable))
+
+        with self.subTest("Other serialization of subclass"):
+            self.assertFalse(serializer.is_noop_serialization_type(bool))
+
+        with self.subTest("No serialization"):
+            self.assertFalse(serializer.is_noop_serialization_type(float))
+
+    def test_serializer_deserialize_lazy(self):
+        deserialized_names = []
+
+        def str_deserializer(cls, obj):
+            deserialized_names.append(obj)
+            return obj
+
+        serializer = Serializer(
+            {},
+            {
+                str: str_deserializer,
+                list: lambda cls, obj: obj,
+                dict: lambda cls, obj: obj,
+            },
+        )
+
+        tree = serializer.deserialize_lazy(
+            Tree, {"leaves": [], "branches": {}}, fields=["leaves"]
+        )
+
+        with self.subTest("Deserialize selected fields immediately"):
+            self.assertEqual([], tree.leaves)
+            self.assertEqual(["leaves"], list(tree.__dict__))
+
+        with self.subTest("Deserialize nested fields on first access"):
+            leaf = serializer.deserialize_lazy(Leaf, {"name": "a"})
+
+            self.assertEqual([], deserialized_names)
+            self.assertEqual("a", leaf.name)
+            self.assertEqual(["a"], deserialized_names)
+
+    def test_serializer_load_plans_spawned_workers(self):
+        plans = ExampleSerializer.warm([Tree])
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(
+            1,
+            mp_context=context,
+            initializer=serializer_reference(ExampleSerializer).load_plans,
+            initargs=(plans,),
+        ) as executor:
+            cached_lookups, tree = executor.submit(
+                deserialize_in_worker,
+                Tree,
+                {"leaves": [{"name": "a"}], "branches": {"b": None}},
+            ).result()
+
+        self.assertEqual(Tree([Leaf("a")], {"b": None}), tree)
+        self.assertEqual(len(plans.deserialization_functions[2]), cached_lookups)
+
+    def test_serializer_reference(self):
+        reference = serializer_reference(ExampleSerializer)
+
+        with self.subTest("Pickle reference by name"):
+            self.assertIs(
+                ExampleSerializer, pickle.loads(pickle.dumps(reference)).resolve()
+            )
+
+        with self.subTest("Serialize through reference"):
+            self.assertEqual(Leaf("a"), reference.deserialize(Leaf, {"name": "a"}))
+
+        with self.subTest("Fail reference local serializer"), self.assertRaises(
+            ValueError
+        ):
+            serializer_reference(Serializer({}, {}))
+
+    def test_serializer_copy(self):
+        serializer = Serializer(
+            {str: lambda obj: obj.upper()},
+            {str: noop_deserialization},
+            omit_none=True,
+        )
+
+        for copy_func in [copy, deepcopy]:
+            serializer_copy = copy_func(serializer)
+
+            with self.subTest("Copy serializer", copy_func=copy_func):
+                self.assertIsNot(serializer, serializer_copy)
+                self.assertEqual("A", serializer_copy.serialize("a"))
+                self.assertEqual("a", serializer_copy.deserialize(str, "a"))
+                self.assertTrue(serializer_copy.omit_none)
+
+            with self.subTest("Register on copy only", copy_func=copy_func):
+                serializer_copy.register_serializer(int, noop_serialization)
+
+                self.assertEqual(1, serializer_copy.serialize(1))
+
+                with self.assertRaises(SerializationError):
+                    serializer.serialize(1)
+
+        with self.subTest("Deep copy module global serializer"):
+            self.assertIsNot(ExampleSerializer, deepcopy(ExampleSerializer))
+
+    def test_serializer_caches(self):
+        serializer = Serializer({}, {str: noop_deserialization}, cache_size=1)
+
+        with self.subTest("Count cached lookups"):
+            serializer.deserialize(str, "a")
+            serializer.deserialize(str, "b")
+
+            stats = serializer.cache_stats()["deserialization_functions"]
+
+            self.assertEqual((1, 1), (stats.hits, stats.misses))
+
+        with self.subTest("Bound cached lookups"):
+            # Looks up Leaf, then str for its field, evicting each in turn
+            serializer.deserialize(Leaf, {"name": "a"})
+
+            stats = serializer.cache_stats()["deserialization_functions"]
+
+            self.assertEqual((1, 2), (stats.size, stats.evictions))
+
+        with self.subTest("Clear caches"):
+            serializer.clear_caches()
+
+            self.assertEqual(
+                0, serializer.cache_stats()["deserialization_functions"].size
+            )
+            self.assertEqual(0, serializer.cache_stats()["dataclass_field_types"].size)
+
+    def test_serializer_caches_release_classes(self):
+        serializer = Serializer(
+            {}, {str: noop_deserialization, int: noop_deserialization}
+        )
+
+        def deserialize_dynamic_dataclasses():
+            for i in range(100):
+                cls = make_dataclass(
+                    "Dynamic{}".format(i), [("x", int), ("name", str, "")]
+                )
+
+                obj = serializer.deserialize_lazy(cls, {"x": 1, "name": "a"})
+                dataclass_to_dict(obj, omit_defaults=True)
+
+        # The caches of dataclass types are shared, so may hold other classes
+        gc.collect()
+        stats = serializer.cache_stats()
+
+        deserialize_dynamic_dataclasses()
+        gc.collect()
+
+        self.assertEqual(2, serializer.cache_stats()["deserialization_functions"].size)
+
+        for name in ["dataclass_field_types", "dataclass_field_defaults"]:
+            with self.subTest("Release classes from shared cache", name=name):
+                self.assertEqual(stats[name].size, serializer.cache_stats()[name].size)
+
+    def test_serializer_intern_fields(self):
+        serializer = Serializer(
+            {},
+            {str: noop_deserialization, dict: noop_deserialization},
+            intern_fields={"name"},
+        )
+
+        for iterative in (False, True):
+            with self.subTest("Intern named fields", iterative=iterative):
+                serializer.iterative = iterative
+                leaf = serializer.deserialize(Leaf, {"name": "".join(["a", "b"])})
+
+                self.assertIs(sys.intern("ab"), leaf.name)
+
+    def test_serializer_lazy_collections(self):
+        deserialized_names = []
+
+        def str_deserializer(cls, obj):
+            if not isinstance(obj, str):
+                raise DeserializationError("Cannot deserialize {!r}".format(obj))
+
+            deserialized_names.append(obj)
+            return obj
+
+        for iterative in (False, True):
+            serializer = Serializer(
+                {
+                    dict: lambda obj: {
+                        k: serializer.serialize(v) for k, v in obj.items()
+                    },
+                    list: lambda obj: list(map(serializer.serialize, obj)),
+                    str: lambda obj: obj,
+                },
+                {str: str_deserializer},
+                lazy_collections=True,
+                iterative=iterative,
+            )
+
+            with self.subTest("Deserialize collections lazily", iterative=iterative):
+                deserialized_names.clear()
+                tree = serializer.deserialize(
+                    Tree,
+                    {
+                        "leaves": [{"name": "a"}, {"name": 1}],
+                        "branches": {"b": {"leaves": [{"name": 2}], "branches": {}}},
+                    },
+                )
+
+                self.assertEqual(["b"], deserialized_names)
+                self.assertEqual(Leaf("a"), tree.leaves[0])
+                self.assertEqual(["b", "a"], deserialized_names)
+
+            with self.subTest("Fail invalid value on access", iterative=iterative):
+                with self.assertRaisesRegex(DeserializationError, r"leaves\[1\]"):
+                    tree.leaves[1]
+
+                with self.assertRaisesRegex(
+                    DeserializationError, r"branches\['b'\]\.leaves\[0\]"
+                ):
+                    tree.branches["b"].leaves[0]
+
+            with self.subTest("Serialize lazy collections", iterative=iterative):
+                tree = serializer.deserialize(
+                    Tree, {"leaves": [{"name": "a"}], "branches": {}}
+                )
+
+                self.assertEqual(
+                    {"leaves": [{"name": "a"}], "branches": {}},
+                    serializer.serialize(tree),
+                )
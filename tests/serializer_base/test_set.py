@@ -0,0 +1,74 @@
+from typing import FrozenSet, List, Set
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    set_deserialization,
+)
+
+
+class TestSetSerialization(TestCase):
+    def test_set_deserialization_basic(self):
+        with self.subTest("Deserialize set noop"):
+            self.assertEqual({1, 2}, set_deserialization(set, [1, 2]))
+            self.assertEqual({1, 2}, set_deserialization(Set, [1, 2]))
+
+        with self.subTest("Deserialize frozenset noop"):
+            self.assertEqual(frozenset({1, 2}), set_deserialization(frozenset, [1, 2]))
+            self.assertIsInstance(set_deserialization(FrozenSet, [1, 2]), frozenset)
+
+        with self.subTest("Deserialize set"):
+            self.assertEqual({"a", "b"}, set_deserialization(Set[str], ["a", "b"]))
+
+        with self.subTest("Deserialize frozenset"):
+            deserialized_obj = set_deserialization(FrozenSet[int], [1, 2, 2])
+
+            self.assertIsInstance(deserialized_obj, frozenset)
+            self.assertEqual(frozenset({1, 2}), deserialized_obj)
+
+        with self.subTest("Fail invalid value deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            set_deserialization(Set[str], [1, 2])
+
+        with self.subTest("Fail unhashable value deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            set_deserialization(
+                Set[List[int]],
+                [[1]],
+                deserialization_func=lambda cls, obj: obj,
+            )
+
+    def test_set_deserialization_deserialization_func(self):
+        self.assertEqual(
+            {0, 1},
+            set_deserialization(
+                Set[int], [1, 2], deserialization_func=lambda cls, obj: obj - 1
+            ),
+        )
+
+    def test_set_deserialization_noop_types(self):
+        def fail_deserialization(cls, obj):
+            raise AssertionError("Deserialized {!r} individually".format(obj))
+
+        with self.subTest("Check noop types in bulk"):
+            self.assertEqual(
+                {1, 2},
+                set_deserialization(
+                    Set[int],
+                    [1, 2],
+                    deserialization_func=fail_deserialization,
+                    is_noop_deserialization=lambda cls: True,
+                ),
+            )
+
+        with self.subTest("Fail invalid noop types"), self.assertRaises(
+            DeserializationError
+        ):
+            set_deserialization(
+                Set[int],
+                [1, "a"],
+                deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DirtyTrackingMixin,
+    SerializationError,
+    Serializer,
+    noop_serialization,
+)
+
+
+@dataclass
+class Address(DirtyTrackingMixin):
+    city: str
+
+
+@dataclass
+class User(DirtyTrackingMixin):
+    name: str
+    address: Address
+    tags: List[str]
+    nickname: Optional[str] = None
+
+
+@dataclass
+class Point(DirtyTrackingMixin):
+    coordinates: Tuple[int, ...]
+
+
+class TestTracking(TestCase):
+    def setUp(self):
+        self.serialized_values = []
+
+        def str_serializer(obj):
+            self.serialized_values.append(obj)
+            return obj
+
+        self.serializer = Serializer(
+            {
+                str: str_serializer,
+                type(None): noop_serialization,
+                list: lambda obj: list(map(self.serializer.serialize, obj)),
+                dict: lambda obj: {
+                    key: self.serializer.serialize(value) for key, value in obj.items()
+                },
+            },
+            {},
+        )
+
+    def test_tracking_serialization(self):
+        user = User("Fred", Address("London"), ["admin"])
+        serialized_user = {
+            "name": "Fred",
+            "address": {"city": "London"},
+            "tags": ["admin"],
+            "nickname": None,
+        }
+
+        with self.subTest("Serialize tracked dataclass"):
+            self.assertEqual(serialized_user, self.serializer.serialize(user))
+            self.assertEqual(["Fred", "London", "admin"], self.serialized_values)
+
+        with self.subTest("Reuse unchanged fields"):
+            self.serialized_values.clear()
+
+            self.assertEqual(serialized_user, self.serializer.serialize(user))
+            self.assertEqual(["admin"], self.serialized_values)
+
+        with self.subTest("Serialize changed fields"):
+            self.serialized_values.clear()
+            user.name = "Bob"
+            user.address.city = "Paris"
+
+            self.assertEqual(
+                {
+                    "name": "Bob",
+                    "address": {"city": "Paris"},
+                    "tags": ["admin"],
+                    "nickname": None,
+                },
+                self.serializer.serialize(user),
+            )
+            self.assertEqual(["Bob", "Paris", "admin"], self.serialized_values)
+
+        with self.subTest("Return copies of cached serialized values"):
+            serializer = Serializer(
+                {
+                    (str, int): noop_serialization,
+                    tuple: lambda obj: list(map(serializer.serialize, obj)),
+                },
+                {},
+            )
+            point = Point((1, 2))
+
+            serializer.serialize(point)["coordinates"].append(3)
+
+            self.assertEqual({"coordinates": [1, 2]}, serializer.serialize(point))
+            self.assertEqual({}, serializer.serialize_changes(point))
+
+        with self.subTest("Omit none"):
+            self.serializer.omit_none = True
+
+            self.assertNotIn("nickname", self.serializer.serialize(user))
+
+    def test_tracking_serialize_changes(self):
+        user = User("Fred", Address("London"), ["admin"])
+
+        with self.subTest("Include all fields when first serialized"):
+            self.assertEqual(
+                {
+                    "name": "Fred",
+                    "address": {"city": "London"},
+                    "tags": ["admin"],
+                    "nickname": None,
+                },
+                self.serializer.serialize_changes(user),
+            )
+
+        with self.subTest("Include changed fields, by dotted path"):
+            user.name = "Bob"
+            user.address.city = "Paris"
+
+            self.assertEqual(
+                {"name": "Bob", "address.city": "Paris"},
+                self.serializer.serialize_changes(user),
+            )
+
+        with self.subTest("Include replaced fields"):
+            user.address = Address("Rome")
+            user.nickname = "Bobby"
+
+            self.assertEqual(
+                {"address": {"city": "Rome"}, "nickname": "Bobby"},
+                self.serializer.serialize_changes(user),
+            )
+
+        with self.subTest("Exclude fields set to equal values"):
+            user.name = "".join(["B", "ob"])
+
+            self.assertEqual({}, self.serializer.serialize_changes(user))
+
+        with self.subTest("Include mutable fields changed in place"):
+            user.tags.append("editor")
+
+            self.assertEqual(
+                {"tags": ["admin", "editor"]}, self.serializer.serialize_changes(user)
+            )
+            self.assertEqual({}, self.serializer.serialize_changes(user))
+
+        with self.subTest("Track each serializer separately"):
+            other_serializer = Serializer({object: noop_serialization}, {})
+
+            self.assertIn("name", other_serializer.serialize_changes(user))
+
+        with self.subTest("Fail untracked dataclass"), self.assertRaises(
+            SerializationError
+        ):
+            self.serializer.serialize_changes(object())
+
+    def test_tracking_cache_lifetime(self):
+        user = User("Fred", Address("London"), [])
+        self.serializer.serialize(user)
+
+        self.assertEqual(2, len(self.serializer.tracking_caches))
+
+        del user
+
+        self.assertEqual({}, self.serializer.tracking_caches)
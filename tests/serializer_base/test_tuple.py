@@ -0,0 +1,108 @@
+from typing import Dict, List, Tuple, TypeVar
+from unittest import TestCase
+
+from dataclasses_serialization.serializer_base import (
+    DeserializationError,
+    tuple_deserialization,
+)
+
+
+class TestTupleSerialization(TestCase):
+    def test_tuple_deserialization_basic(self):
+        T = TypeVar("T")
+
+        with self.subTest("Deserialize tuple noop"):
+            self.assertEqual((1, "a"), tuple_deserialization(tuple, [1, "a"]))
+            self.assertEqual((1, "a"), tuple_deserialization(Tuple, [1, "a"]))
+
+        with self.subTest("Deserialize variable-length tuple"):
+            self.assertEqual((1, 2), tuple_deserialization(Tuple[int, ...], [1, 2]))
+            self.assertEqual((), tuple_deserialization(Tuple[int, ...], []))
+
+        with self.subTest("Deserialize fixed-length tuple"):
+            self.assertEqual(("a", 1), tuple_deserialization(Tuple[str, int], ["a", 1]))
+            self.assertEqual((), tuple_deserialization(Tuple[()], []))
+
+        with self.subTest("Deserialize generic tuple"):
+            self.assertEqual(
+                ({"a": 1}, {"b": 2}),
+                tuple_deserialization(
+                    Tuple[Dict[str, T], ...][int], [{"a": 1}, {"b": 2}]
+                ),
+            )
+
+        with self.subTest("Fail invalid value deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            tuple_deserialization(Tuple[str, ...], ["a", 1])
+
+        with self.subTest("Fail invalid fixed-length value deserialization"):
+            with self.assertRaises(DeserializationError):
+                tuple_deserialization(Tuple[str, int], ["a", "b"])
+
+        with self.subTest("Fail wrong length deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            tuple_deserialization(Tuple[str, int], ["a", 1, 2])
+
+        with self.subTest("Fail non-list deserialization"), self.assertRaises(
+            DeserializationError
+        ):
+            tuple_deserialization(Tuple[str, ...], "ab")
+
+    def test_tuple_deserialization_deserialization_func(self):
+        with self.subTest("Deserialize variable-length tuple"):
+            self.assertEqual(
+                (0, 1),
+                tuple_deserialization(
+                    Tuple[int, ...],
+                    [1, 2],
+                    deserialization_func=lambda cls, obj: obj - 1,
+                ),
+            )
+
+        with self.subTest("Deserialize fixed-length tuple"):
+            self.assertEqual(
+                (0, [2]),
+                tuple_deserialization(
+                    Tuple[int, List[int]],
+                    [1, [2]],
+                    deserialization_func=lambda cls, obj: (
+                        obj - 1 if cls is int else obj
+                    ),
+                ),
+            )
+
+    def test_tuple_deserialization_noop_types(self):
+        def fail_deserialization(cls, obj):
+            raise AssertionError("Deserialized {!r} individually".format(obj))
+
+        with self.subTest("Check noop types in bulk"):
+            self.assertEqual(
+                ("a", 1),
+                tuple_deserialization(
+                    Tuple[str, int],
+                    ["a", 1],
+                    deserialization_func=fail_deserialization,
+                    is_noop_deserialization=lambda cls: True,
+                ),
+            )
+            self.assertEqual(
+                (1, 2),
+                tuple_deserialization(
+                    Tuple[int, ...],
+                    [1, 2],
+                    deserialization_func=fail_deserialization,
+                    is_noop_deserialization=lambda cls: cls is int,
+                ),
+            )
+
+        with self.subTest("Fail invalid noop types"), self.assertRaises(
+            DeserializationError
+        ):
+            tuple_deserialization(
+                Tuple[int, ...],
+                [1, "a"],
+                deserialization_func=fail_deserialization,
+                is_noop_deserialization=lambda cls: True,
+            )
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, Iterable, TypeVar, Union
+from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
 from unittest import TestCase
 
 from dataclasses_serialization.serializer_base import isinstance, issubclass
+from dataclasses_serialization.serializer_base.typing import dataclass_field_types
 
 
 class TestTyping(TestCase):
@@ -77,3 +78,35 @@ class TestTyping(TestCase):
         for cls, supercls in negative_test_cases:
             with self.subTest(cls=cls, supercls=supercls):
                 self.assertFalse(issubclass(cls, supercls))
+
+    def test_dataclass_field_types(self):
+        T = TypeVar("T")
+
+        @dataclass
+        class ExampleGenericDataclass(Generic[T]):
+            t_list: List[T]
+            int_list: List[int]
+            optional_t_dict: Optional[Dict[str, T]]
+
+        def field_types(cls):
+            return {fld.name: fld_type for fld, fld_type in dataclass_field_types(cls)}
+
+        with self.subTest("Bind nested generics"):
+            self.assertEqual(
+                {
+                    "t_list": List[List[int]],
+                    "int_list": List[int],
+                    "optional_t_dict": Optional[Dict[str, List[int]]],
+                },
+                field_types(ExampleGenericDataclass[List[int]]),
+            )
+
+        with self.subTest("Cache bound generics"):
+            self.assertIs(
+                dataclass_field_types(ExampleGenericDataclass[int]),
+                dataclass_field_types(ExampleGenericDataclass[int]),
+            )
+
+        with self.subTest("Fail to find unbound generic types, if required"):
+            with self.assertRaises(TypeError):
+                dataclass_field_types(ExampleGenericDataclass, require_bound=True)
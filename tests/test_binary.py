@@ -0,0 +1,244 @@
+from dataclasses import dataclass, field
+from tempfile import TemporaryFile
+from typing import Any, Dict, FrozenSet, Generic, List, Optional, Set, Tuple, TypeVar, Union
+from unittest import TestCase
+from unittest.mock import patch
+
+from dataclasses_serialization import binary
+from dataclasses_serialization.binary import BinarySerializer, BinarySerializerMixin, binary_codec, binary_codec_cache, schema_fingerprint
+from dataclasses_serialization.serializer_base import DeserializationError, SerializationError, RecordStore, write_records
+
+T = TypeVar('T')
+
+
+@dataclass
+class Person:
+    name: str
+
+
+@dataclass
+class Song:
+    artist: Person
+
+
+@dataclass
+class Playlist:
+    songs: List[Song]
+    next: Optional['Playlist'] = None
+
+
+@dataclass
+class Track:
+    artist: Person
+    next: Optional['Track'] = None
+
+
+@dataclass
+class Box(Generic[T]):
+    contents: T
+
+
+class TestBinary(TestCase):
+    def test_binary_serialization_basic(self):
+        obj = Person("Fred")
+        serialized_obj = schema_fingerprint(Person) + b'\x04Fred'
+
+        with self.subTest("Serialize dataclass -> binary"):
+            self.assertEqual(serialized_obj, BinarySerializer.serialize(obj))
+
+        with self.subTest("Deserialize binary -> dataclass"):
+            self.assertEqual(obj, BinarySerializer.deserialize(Person, serialized_obj))
+
+    def test_binary_serialization_types(self):
+        test_cases = [
+            (int, 0, b'\x00'),
+            (int, -1, b'\x01'),
+            (int, 300, b'\xd8\x04'),
+            (int, 2 ** 70, b'\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x02'),
+            (float, 1.5, b'\x00\x00\x00\x00\x00\x00\xf8?'),
+            (str, "Fred", b'\x04Fred'),
+            (bytes, b'Hello', b'\x05Hello'),
+            (bool, True, b'\x01'),
+            (Dict[str, int], {'a': 1}, b'\x01\x01a\x02'),
+            (List[Person], [Person("Fred")], b'\x01\x04Fred'),
+            (Tuple[int, ...], (1, 2), b'\x02\x02\x04'),
+            (Tuple[str, int], ("Fred", 1), b'\x04Fred\x02'),
+            (Set[str], {"Fred"}, b'\x01\x04Fred'),
+            (FrozenSet[int], frozenset({1}), b'\x01\x02'),
+            (Union[int, Person], 1, b'\x00\x02'),
+            (Union[int, Person], Person("Fred"), b'\x01\x04Fred'),
+            (Union[int, bool], 1, b'\x00\x02'),
+            (Union[int, bool], True, b'\x01\x01'),
+            (Optional[int], None, b'\x01'),
+            (Box[int], Box(1), b'\x02')
+        ]
+
+        for type_, value, serialized_value in test_cases:
+            @dataclass
+            class Field:
+                value: type_
+
+            obj = Field(value)
+            serialized_obj = schema_fingerprint(Field) + serialized_value
+
+            with self.subTest("Serialize field", type_=type_, value=value):
+                self.assertEqual(serialized_obj, BinarySerializer.serialize(obj))
+
+            with self.subTest("Deserialize field", type_=type_, value=value):
+                self.assertEqual(obj, BinarySerializer.deserialize(Field, serialized_obj))
+
+    def test_binary_serialization_union_exact_type(self):
+        @dataclass
+        class Flag:
+            value: Union[int, bool]
+
+        self.assertIs(True, BinarySerializer.deserialize(Flag, BinarySerializer.serialize(Flag(True))).value)
+
+    def test_binary_serialization_recursive(self):
+        obj = Playlist([Song(Person("Fred"))], Playlist([Song(Person("Jane"))]))
+
+        self.assertEqual(obj, BinarySerializer.deserialize(Playlist, BinarySerializer.serialize(obj)))
+
+    def test_binary_serialization_bytes_like(self):
+        @dataclass
+        class Blob:
+            data: memoryview
+            buffer: bytearray
+
+        obj = Blob(memoryview(b'Hello'), bytearray(b'world'))
+        deserialized_obj = BinarySerializer.deserialize(Blob, BinarySerializer.serialize(obj))
+
+        self.assertIsInstance(deserialized_obj.data, memoryview)
+        self.assertIsInstance(deserialized_obj.buffer, bytearray)
+        self.assertEqual(obj, deserialized_obj)
+
+    def test_binary_serialization_defaults(self):
+        @dataclass
+        class Item:
+            name: str
+            tags: List[str] = field(default_factory=list)
+            count: int = field(default=0, init=False)
+
+        obj = Item("Apple", ["fruit"])
+
+        self.assertEqual(obj, BinarySerializer.deserialize(Item, BinarySerializer.serialize(obj)))
+
+    def test_schema_fingerprint(self):
+        @dataclass
+        class Renamed:
+            nickname: str
+
+        @dataclass
+        class Retyped:
+            name: bytes
+
+        with self.subTest("Fingerprint stable"):
+            self.assertEqual(schema_fingerprint(Person), schema_fingerprint(Person))
+            self.assertEqual(8, len(schema_fingerprint(Person)))
+
+        with self.subTest("Fingerprint depends on field names and types"):
+            self.assertNotEqual(schema_fingerprint(Person), schema_fingerprint(Renamed))
+            self.assertNotEqual(schema_fingerprint(Person), schema_fingerprint(Retyped))
+
+        with self.subTest("Fingerprint depends on nested dataclasses"):
+            self.assertNotEqual(schema_fingerprint(Box[Person]), schema_fingerprint(Box[Renamed]))
+
+    def test_binary_serialization_errors(self):
+        serialized_obj = BinarySerializer.serialize(Song(Person("Fred")))
+
+        @dataclass
+        class Anything:
+            value: Any
+
+        with self.subTest("Fail serialize field of wrong type"), self.assertRaises(SerializationError):
+            BinarySerializer.serialize(Person(1))
+
+        with self.subTest("Fail serialize type without positional encoding"), self.assertRaises(SerializationError):
+            BinarySerializer.serialize(Anything(1))
+
+        with self.subTest("Fail serialize unbound generic"), self.assertRaises(SerializationError):
+            BinarySerializer.serialize(Box(1))
+
+        with self.subTest("Fail deserialize mismatched schema"), self.assertRaises(DeserializationError):
+            BinarySerializer.deserialize(Person, serialized_obj)
+
+        with self.subTest("Fail deserialize truncated payload"), self.assertRaises(DeserializationError):
+            BinarySerializer.deserialize(Song, serialized_obj[:-1])
+
+        with self.subTest("Fail deserialize trailing data"), self.assertRaises(DeserializationError):
+            BinarySerializer.deserialize(Song, serialized_obj + b'\x00')
+
+        with self.subTest("Fail deserialize non-buffer"), self.assertRaises(DeserializationError):
+            BinarySerializer.deserialize(Song, "Fred")
+
+        @dataclass
+        class Positive:
+            value: int
+
+            def __post_init__(self):
+                if self.value < 0:
+                    raise TypeError("Negative value")
+
+        with self.subTest("Fail deserialize rejected by constructor"), self.assertRaises(DeserializationError):
+            BinarySerializer.deserialize(Positive, BinarySerializer.serialize(Positive(1))[:-1] + b'\x01')
+
+    def test_binary_codec_published_complete(self):
+        compiling_published = []
+
+        def find_binary_codec(cls, find_binary_codec=binary.find_binary_codec):
+            compiling_published.append(Track in binary_codec_cache)
+
+            return find_binary_codec(cls)
+
+        binary_codec_cache.pop(Track, None)
+
+        with patch('dataclasses_serialization.binary.find_binary_codec', find_binary_codec):
+            binary_codec(Track)
+
+        with self.subTest("Codec not shared while compiling"):
+            self.assertNotIn(True, compiling_published)
+
+        with self.subTest("Codec shared once compiled"):
+            self.assertIn(Track, binary_codec_cache)
+
+        obj = Track(Person("Fred"), Track(Person("Jane")))
+
+        with self.subTest("Serialize recursive dataclass with published codec"):
+            self.assertEqual(obj, BinarySerializer.deserialize(Track, BinarySerializer.serialize(obj)))
+
+    def test_binary_deserialization_buffers(self):
+        obj = Song(Person("Fred"))
+        serialized_obj = BinarySerializer.serialize(obj)
+
+        with self.subTest("Deserialize binary bytearray -> dataclass"):
+            self.assertEqual(obj, BinarySerializer.deserialize(Song, bytearray(serialized_obj)))
+
+        with self.subTest("Deserialize binary memoryview slice -> dataclass"):
+            buffer = memoryview(b'\x00' * 8 + serialized_obj + b'\x00' * 8)
+
+            self.assertEqual(obj, BinarySerializer.deserialize(Song, buffer[8:-8]))
+
+    def test_binary_record_store(self):
+        objs = [Song(Person(name)) for name in ["Fred", "Jane", "Bob"]]
+
+        with TemporaryFile() as f:
+            write_records(BinarySerializer, objs, f)
+            f.flush()
+
+            with RecordStore(BinarySerializer, Song, f) as store:
+                self.assertEqual(objs[1], store[1])
+                self.assertEqual(objs, list(store))
+
+    def test_binary_serializer_mixin(self):
+        @dataclass
+        class Artist(BinarySerializerMixin):
+            name: str
+
+        obj = Artist("Fred")
+        serialized_obj = schema_fingerprint(Artist) + b'\x04Fred'
+
+        with self.subTest("Serialize dataclass -> binary with as_binary mixin"):
+            self.assertEqual(serialized_obj, obj.as_binary())
+
+        with self.subTest("Deserialize binary -> dataclass with from_binary mixin"):
+            self.assertEqual(obj, Artist.from_binary(serialized_obj))
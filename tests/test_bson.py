@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
 from os import environ
-from typing import Union, Dict, List
+from tempfile import TemporaryFile
+from typing import Union, Dict, List, Optional, Tuple, Set, FrozenSet
 from unittest import TestCase, skipIf
 
-from dataclasses_serialization.serializer_base import DeserializationError
+from dataclasses_serialization.serializer_base import DeserializationError, PayloadCache
 
 try:
     import bson
@@ -14,11 +18,19 @@ except ImportError:
     bson_installed = False
 
 try:
-    from dataclasses_serialization.bson import BSONSerializer, BSONSerializerMixin, BSONStrSerializer, BSONStrSerializerMixin
+    from dataclasses_serialization.bson import BSONSerializer, BSONSerializerMixin, BSONDirtyTrackingMixin, BSONStrSerializer, BSONStrSerializerMixin, iter_deserialize
 except ImportError:
-    BSONSerializer, BSONSerializerMixin, BSONStrSerializer, BSONStrSerializerMixin = [None] * 4
+    BSONSerializer, BSONSerializerMixin, BSONDirtyTrackingMixin, BSONStrSerializer, BSONStrSerializerMixin, iter_deserialize = [None] * 6
+
+try:
+    import numpy
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
 
 if 'OPTIONAL_MODULES' in environ:
+    numpy_installed = 'numpy' in environ['OPTIONAL_MODULES']
     bson_installed = (
         'bson' in environ['OPTIONAL_MODULES'] or
         'pymongo' in environ['OPTIONAL_MODULES']
@@ -35,6 +47,12 @@ class Song:
     artist: Person
 
 
+@dataclass
+class Playlist:
+    songs: List[Song]
+    next: Optional['Playlist'] = None
+
+
 @skipIf(not bson_installed, "BSON not installed")
 class TestBSON(TestCase):
     def test_bson_serialization_basic(self):
@@ -62,6 +80,10 @@ class TestBSON(TestCase):
             (list, [{'name': "Fred"}], [{'name': "Fred"}]),
             (List, [{'name': "Fred"}], [{'name': "Fred"}]),
             (List[Person], [Person("Fred")], [{'name': "Fred"}]),
+            (Tuple[int, ...], (1, 2), [1, 2]),
+            (Tuple[str, Person], ("Fred", Person("Fred")), ["Fred", {'name': "Fred"}]),
+            (Set[str], {"Fred"}, ["Fred"]),
+            (FrozenSet[int], frozenset({1}), [1]),
             (Union[int, Person], 1, 1),
             (Union[int, Person], Person("Fred"), {'name': "Fred"}),
             (Union[Song, Person], Person("Fred"), {'name': "Fred"}),
@@ -85,6 +107,129 @@ class TestBSON(TestCase):
         with self.subTest("Fail to coerce non-integer float -> int"), self.assertRaises(DeserializationError):
             BSONSerializer.deserialize(int, 1.5)
 
+    def test_bson_number_list_coercion(self):
+        with self.subTest("Coerce integer float list -> int list"):
+            lst = BSONSerializer.deserialize(List[int], [1.0, 2, 3.0])
+
+            self.assertEqual([1, 2, 3], lst)
+            self.assertTrue(all(type(i) is int for i in lst))
+
+        with self.subTest("Deserialize int list without coercion"):
+            self.assertEqual([1, 2, 3], BSONSerializer.deserialize(List[int], [1, 2, 3]))
+
+        with self.subTest("Deserialize float list"):
+            self.assertEqual([1.5, 2.0], BSONSerializer.deserialize(List[float], [1.5, 2.0]))
+
+        with self.subTest("Keep bools in int list"):
+            self.assertEqual([True, 2], BSONSerializer.deserialize(List[int], [True, 2.0]))
+
+        for lst in [[1.0, 1.5], [1.0, float('nan')], [float('inf')], [1, "2"]]:
+            with self.subTest("Fail to coerce non-integer float list -> int list", lst=lst), self.assertRaises(DeserializationError):
+                BSONSerializer.deserialize(List[int], lst)
+
+        with self.subTest("Fail to deserialize int list -> float list"), self.assertRaises(DeserializationError):
+            BSONSerializer.deserialize(List[float], [1.5, 2])
+
+    def test_bson_bytes_like_serialization(self):
+        @dataclass
+        class Blob:
+            data: memoryview
+            buffer: bytearray
+
+        data = b'Hello, world'
+        obj = Blob(memoryview(data), bytearray(b'Lorem ipsum'))
+        serialized_obj = {'data': b'Hello, world', 'buffer': b'Lorem ipsum'}
+
+        with self.subTest("Serialize bytes-like dataclass -> BSON"):
+            self.assertEqual(serialized_obj, BSONSerializer.serialize(obj))
+
+        with self.subTest("Serialize whole memoryview without copying"):
+            self.assertIs(data, BSONSerializer.serialize(memoryview(data)))
+
+        with self.subTest("Serialize memoryview slice"):
+            self.assertEqual(b'world', BSONSerializer.serialize(memoryview(data)[7:]))
+
+        with self.subTest("Deserialize BSON -> bytes-like dataclass"):
+            deserialized_obj = BSONSerializer.deserialize(Blob, serialized_obj)
+
+            self.assertIsInstance(deserialized_obj.data, memoryview)
+            self.assertIsInstance(deserialized_obj.buffer, bytearray)
+            self.assertEqual(obj, deserialized_obj)
+
+        with self.subTest("Deserialize memoryview without copying"):
+            self.assertIs(data, BSONSerializer.deserialize(memoryview, data).obj)
+
+        with self.subTest("Fail deserialize non-bytes -> memoryview"), self.assertRaises(DeserializationError):
+            BSONSerializer.deserialize(memoryview, "Hello, world")
+
+    def test_bson_str_deserialization_buffers(self):
+        obj = Person("Fred")
+        serialized_obj = b'\x14\x00\x00\x00\x02name\x00\x05\x00\x00\x00Fred\x00\x00'
+
+        with self.subTest("Deserialize BSON bytearray -> dataclass"):
+            self.assertEqual(obj, BSONStrSerializer.deserialize(Person, bytearray(serialized_obj)))
+
+        with self.subTest("Deserialize BSON memoryview slice -> dataclass"):
+            buffer = memoryview(b'\x00' * 8 + serialized_obj + b'\x00' * 8)
+
+            self.assertEqual(obj, BSONStrSerializer.deserialize(Person, buffer[8:-8]))
+
+        with self.subTest("Deserialize BSON mmap -> dataclass"), TemporaryFile() as f:
+            f.write(serialized_obj)
+            f.flush()
+
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as buffer:
+                self.assertEqual(obj, BSONStrSerializer.deserialize(Person, buffer))
+
+    def test_bson_ndarray_serialization(self):
+        if not numpy_installed:
+            self.skipTest("NumPy not installed")
+
+        @dataclass
+        class Features:
+            values: numpy.ndarray
+
+        obj = Features(numpy.array([[1, 2], [3, 4]], dtype='<i2'))
+        serialized_obj = {'values': {'dtype': '<i2', 'shape': [2, 2], 'data': b'\x01\x00\x02\x00\x03\x00\x04\x00'}}
+
+        with self.subTest("Serialize ndarray dataclass -> BSON"):
+            self.assertEqual(serialized_obj, BSONSerializer.serialize(obj))
+
+        with self.subTest("Deserialize BSON -> ndarray dataclass"):
+            deserialized_obj = BSONSerializer.deserialize(Features, serialized_obj)
+
+            self.assertEqual(obj.values.dtype, deserialized_obj.values.dtype)
+            self.assertTrue(numpy.array_equal(obj.values, deserialized_obj.values))
+
+    def test_bson_iterative_serialization(self):
+        BSONSerializer.iterative = True
+        self.addCleanup(setattr, BSONSerializer, 'iterative', False)
+
+        obj = None
+
+        for _ in range(5000):
+            obj = Playlist([Song(Person("Fred"))], obj)
+
+        serialized_obj = BSONSerializer.serialize(obj)
+
+        with self.subTest("Serialize deeply nested dataclass -> BSON"):
+            serialized_playlist = serialized_obj
+
+            for _ in range(5000):
+                self.assertEqual([{'artist': {'name': "Fred"}}], serialized_playlist['songs'])
+                serialized_playlist = serialized_playlist['next']
+
+            self.assertIsNone(serialized_playlist)
+
+        with self.subTest("Deserialize BSON -> deeply nested dataclass"):
+            deserialized_obj = BSONSerializer.deserialize(Playlist, serialized_obj)
+
+            for _ in range(5000):
+                self.assertEqual([Song(Person("Fred"))], deserialized_obj.songs)
+                deserialized_obj = deserialized_obj.next
+
+            self.assertIsNone(deserialized_obj)
+
     def test_bson_serialization_nested(self):
         obj = Song(Person("Fred"))
         serialized_obj = {'artist': {'name': "Fred"}}
@@ -109,6 +254,53 @@ class TestBSON(TestCase):
         with self.subTest("Deserialize BSON -> dataclass with from_bson mixin"):
             self.assertEqual(obj, Artist.from_bson(serialized_obj))
 
+    def test_bson_dirty_tracking_mixin(self):
+        @dataclass
+        class Address(BSONDirtyTrackingMixin):
+            city: str
+
+        @dataclass
+        class Artist(BSONDirtyTrackingMixin):
+            name: str
+            address: Address
+
+        obj = Artist("Fred", Address("London"))
+
+        with self.subTest("Serialize dataclass -> BSON with as_bson mixin"):
+            self.assertEqual({'name': "Fred", 'address': {'city': "London"}}, obj.as_bson())
+
+        with self.subTest("Mongo update document with bson_update mixin"):
+            obj.address.city = "Paris"
+
+            self.assertEqual({'$set': {'address.city': "Paris"}}, obj.bson_update())
+            self.assertEqual({}, obj.bson_update())
+
+    def test_bson_diff(self):
+        @dataclass
+        class Artist:
+            name: str
+            nickname: Optional[str] = None
+
+        old = Song(Artist("Fred", "Freddy"))
+        new = Song(Artist("Bob"))
+
+        with self.subTest("Diff as Mongo update document"):
+            self.assertEqual(
+                {'$set': {'artist.name': "Bob", 'artist.nickname': None}},
+                BSONSerializer.diff(old, new)
+            )
+
+        with self.subTest("Unset omitted fields"):
+            BSONSerializer.omit_none = True
+
+            try:
+                self.assertEqual(
+                    {'$set': {'artist.name': "Bob"}, '$unset': {'artist.nickname': ""}},
+                    BSONSerializer.diff(old, new)
+                )
+            finally:
+                BSONSerializer.omit_none = False
+
     def test_bson_str_serialization(self):
         obj = Person("Fred")
         serialized_obj = b'\x14\x00\x00\x00\x02name\x00\x05\x00\x00\x00Fred\x00\x00'
@@ -119,6 +311,51 @@ class TestBSON(TestCase):
         with self.subTest("Deserialize BSON string -> dataclass"):
             self.assertEqual(obj, BSONStrSerializer.deserialize(Person, serialized_obj))
 
+    def test_bson_iter_deserialize(self):
+        objs = [Person("Fred"), Person("Jane"), Person("Bob")]
+        serialized_objs = b''.join(map(BSONStrSerializer.serialize, objs))
+
+        with self.subTest("Deserialize BSON file -> dataclasses"):
+            self.assertEqual(objs, list(iter_deserialize(Person, BytesIO(serialized_objs))))
+
+        with self.subTest("Deserialize BSON buffer -> dataclasses"):
+            self.assertEqual(objs, list(iter_deserialize(Person, serialized_objs)))
+
+        with self.subTest("Deserialize BSON mmap -> dataclasses"), TemporaryFile() as f:
+            f.write(serialized_objs)
+            f.flush()
+
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as buffer:
+                self.assertEqual(objs, list(iter_deserialize(Person, buffer)))
+
+        with self.subTest("Deserialize empty BSON file"):
+            self.assertEqual([], list(iter_deserialize(Person, BytesIO(b''))))
+
+        with self.subTest("Deserialize BSON file in parallel"), ThreadPoolExecutor(2) as executor:
+            self.assertEqual(objs * 10, list(iter_deserialize(Person, BytesIO(serialized_objs * 10), executor=executor, max_pending=4)))
+
+        with self.subTest("Fail truncated BSON file"), self.assertRaises(DeserializationError):
+            list(iter_deserialize(Person, BytesIO(serialized_objs[:-1])))
+
+        with self.subTest("Fail truncated BSON buffer"), self.assertRaises(DeserializationError):
+            list(iter_deserialize(Person, serialized_objs[:-1]))
+
+    def test_bson_str_payload_cache(self):
+        @dataclass(frozen=True)
+        class Currency:
+            code: str
+
+        serialized_obj = BSONStrSerializer.serialize(Currency("GBP"))
+        BSONStrSerializer.payload_cache = PayloadCache()
+
+        try:
+            obj = BSONStrSerializer.deserialize(Currency, serialized_obj)
+
+            self.assertEqual(Currency("GBP"), obj)
+            self.assertIs(obj, BSONStrSerializer.deserialize(Currency, serialized_obj))
+        finally:
+            BSONStrSerializer.payload_cache = None
+
     def test_bson_str_serializer_mixin(self):
         @dataclass
         class Artist(BSONStrSerializerMixin):
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+project_root = Path(__file__).parents[1]
+
+# Budget, in microseconds, for the package's own modules, excluding its dependencies
+package_import_time_budget = 100000
+
+
+def import_times(module_name):
+    """
+    Self and cumulative import times, in microseconds, of the modules imported by module_name
+
+    As reported by python -X importtime in a fresh interpreter
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(module_name)],
+        cwd=str(project_root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+
+        if cumulative_time.strip().isdigit():
+            times[name.strip()] = (int(self_time), int(cumulative_time))
+
+    return times
+
+
+class TestImportTime(TestCase):
+    deferred_modules = ["asyncio", "bson", "numpy", "toposort"]
+
+    def test_import_time(self):
+        for module_name in [
+            "dataclasses_serialization.serializer_base",
+            "dataclasses_serialization.json",
+            "dataclasses_serialization.bson"
+        ]:
+            try:
+                times = import_times(module_name)
+            except subprocess.CalledProcessError:
+                # Optional dependencies not installed
+                continue
+
+            for deferred_module in self.deferred_modules:
+                with self.subTest("Defer import", module=module_name, deferred_module=deferred_module):
+                    self.assertNotIn(deferred_module, times)
+
+    def test_package_import_time(self):
+        for module_name in [
+            "dataclasses_serialization.serializer_base",
+            "dataclasses_serialization.json",
+            "dataclasses_serialization.bson"
+        ]:
+            try:
+                # Best of several runs, as timings of a single run are noisy
+                package_time = min(
+                    sum(
+                        self_time
+                        for name, (self_time, cumulative_time) in import_times(module_name).items()
+                        if name.split(".")[0] == "dataclasses_serialization"
+                    )
+                    for _ in range(3)
+                )
+            except subprocess.CalledProcessError:
+                # Optional dependencies not installed
+                continue
+
+            with self.subTest("Import within budget", module=module_name):
+                self.assertLess(package_time, package_import_time_budget)
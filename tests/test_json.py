@@ -1,8 +1,37 @@
+import asyncio
+import json
+import sys
 from dataclasses import dataclass
-from typing import Union, Dict, List
+from os import environ
+from typing import Union, Dict, List, Optional, Tuple, Set, FrozenSet
 from unittest import TestCase
 
-from dataclasses_serialization.json import JSONSerializer, JSONSerializerMixin, JSONStrSerializer, JSONStrSerializerMixin
+from dataclasses_serialization.serializer_base import DeserializationError, PayloadCache
+from dataclasses_serialization.json import JSONSerializer, JSONSerializerMixin, JSONDirtyTrackingMixin, JSONStrSerializer, JSONStrSerializerMixin, aserialize_chunks, adeserialize, IncrementalJSONParser
+
+try:
+    import numpy
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+if 'OPTIONAL_MODULES' in environ:
+    numpy_installed = 'numpy' in environ['OPTIONAL_MODULES']
+
+
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def async_iter(iterable):
+    for value in iterable:
+        yield value
 
 
 @dataclass
@@ -15,6 +44,12 @@ class Song:
     artist: Person
 
 
+@dataclass
+class Playlist:
+    songs: List[Song]
+    next: Optional['Playlist'] = None
+
+
 class TestJSON(TestCase):
     def test_json_serialization_basic(self):
         obj = Person("Fred")
@@ -38,6 +73,10 @@ class TestJSON(TestCase):
             (list, [{'name': "Fred"}], [{'name': "Fred"}]),
             (List, [{'name': "Fred"}], [{'name': "Fred"}]),
             (List[Person], [Person("Fred")], [{'name': "Fred"}]),
+            (Tuple[int, ...], (1, 2), [1, 2]),
+            (Tuple[str, Person], ("Fred", Person("Fred")), ["Fred", {'name': "Fred"}]),
+            (Set[str], {"Fred"}, ["Fred"]),
+            (FrozenSet[int], frozenset({1}), [1]),
             (Union[int, Person], 1, 1),
             (Union[int, Person], Person("Fred"), {'name': "Fred"}),
             (Union[Song, Person], Person("Fred"), {'name': "Fred"}),
@@ -51,6 +90,87 @@ class TestJSON(TestCase):
             with self.subTest("Deserialize object", obj=obj):
                 self.assertEqual(obj, JSONSerializer.deserialize(type_, serialized_obj))
 
+    def test_json_primitive_containers(self):
+        lst = [1, 2.0, "a", True, None]
+        dct = {'a': 1.0, 'b': 2.0}
+
+        int_lst = [1, 2]
+
+        for operation, obj, result in [
+            ("Serialize primitive list", lst, JSONSerializer.serialize(lst)),
+            ("Serialize primitive dict", dct, JSONSerializer.serialize(dct)),
+            ("Deserialize primitive list", int_lst, JSONSerializer.deserialize(List[int], int_lst)),
+            ("Deserialize primitive dict", dct, JSONSerializer.deserialize(Dict[str, float], dct))
+        ]:
+            with self.subTest(operation + " as copy"):
+                self.assertEqual(obj, result)
+                self.assertIsNot(obj, result)
+
+        with self.subTest("Serialize dataclass without sharing its list"):
+            @dataclass
+            class Tags:
+                tags: List[str]
+
+            obj = Tags(["a"])
+            JSONSerializer.serialize(obj)['tags'].append("b")
+
+            self.assertEqual(["a"], obj.tags)
+
+        with self.subTest("Fail invalid primitive list deserialization"), self.assertRaises(DeserializationError):
+            JSONSerializer.deserialize(List[int], [1, "a"])
+
+        with self.subTest("Serialize nested list"):
+            self.assertEqual([[1], {'name': "Fred"}], JSONSerializer.serialize([[1], Person("Fred")]))
+
+    def test_json_ndarray_serialization(self):
+        if not numpy_installed:
+            self.skipTest("NumPy not installed")
+
+        @dataclass
+        class Features:
+            values: numpy.ndarray
+
+        obj = Features(numpy.array([[1, 2], [3, 4]], dtype='<i2'))
+        serialized_obj = {'values': {'dtype': '<i2', 'shape': [2, 2], 'data': 'AQACAAMABAA='}}
+
+        with self.subTest("Serialize ndarray dataclass -> JSON"):
+            self.assertEqual(serialized_obj, JSONSerializer.serialize(obj))
+
+        with self.subTest("Deserialize JSON -> ndarray dataclass"):
+            deserialized_obj = JSONSerializer.deserialize(Features, serialized_obj)
+
+            self.assertEqual(obj.values.dtype, deserialized_obj.values.dtype)
+            self.assertTrue(numpy.array_equal(obj.values, deserialized_obj.values))
+
+    def test_json_iterative_serialization(self):
+        JSONSerializer.iterative = True
+        self.addCleanup(setattr, JSONSerializer, 'iterative', False)
+
+        obj = None
+
+        for _ in range(5000):
+            obj = Playlist([Song(Person("Fred"))], obj)
+
+        serialized_obj = JSONSerializer.serialize(obj)
+
+        with self.subTest("Serialize deeply nested dataclass -> JSON"):
+            serialized_playlist = serialized_obj
+
+            for _ in range(5000):
+                self.assertEqual([{'artist': {'name': "Fred"}}], serialized_playlist['songs'])
+                serialized_playlist = serialized_playlist['next']
+
+            self.assertIsNone(serialized_playlist)
+
+        with self.subTest("Deserialize JSON -> deeply nested dataclass"):
+            deserialized_obj = JSONSerializer.deserialize(Playlist, serialized_obj)
+
+            for _ in range(5000):
+                self.assertEqual([Song(Person("Fred"))], deserialized_obj.songs)
+                deserialized_obj = deserialized_obj.next
+
+            self.assertIsNone(deserialized_obj)
+
     def test_json_serialization_nested(self):
         obj = Song(Person("Fred"))
         serialized_obj = {'artist': {'name': "Fred"}}
@@ -75,6 +195,38 @@ class TestJSON(TestCase):
         with self.subTest("Deserialize JSON -> dataclass with from_json mixin"):
             self.assertEqual(obj, Artist.from_json(serialized_obj))
 
+    def test_json_dirty_tracking_mixin(self):
+        @dataclass
+        class Artist(JSONDirtyTrackingMixin):
+            name: str
+            age: int
+
+        obj = Artist("Fred", 30)
+
+        with self.subTest("Serialize dataclass -> JSON with as_json mixin"):
+            self.assertEqual({'name': "Fred", 'age': 30}, obj.as_json())
+
+        with self.subTest("Serialize changed fields with json_changes mixin"):
+            obj.age = 31
+
+            self.assertEqual({'age': 31}, obj.json_changes())
+            self.assertEqual({}, obj.json_changes())
+
+        with self.subTest("Deserialize JSON -> dataclass with from_json mixin"):
+            self.assertEqual(obj, Artist.from_json({'name': "Fred", 'age': 31}))
+
+    def test_json_diff(self):
+        old = Playlist([Song(Person("Fred")), Song(Person("Bob"))])
+        new = Playlist([Song(Person("Fred")), Song(Person("Al/ice"))], Playlist([]))
+
+        self.assertEqual(
+            [
+                {'op': "replace", 'path': "/songs/1/artist/name", 'value': "Al/ice"},
+                {'op': "replace", 'path': "/next", 'value': {'songs': [], 'next': None}}
+            ],
+            JSONSerializer.diff(old, new)
+        )
+
     def test_json_str_serialization(self):
         obj = Person("Fred")
         serialized_obj = '{"name": "Fred"}'
@@ -85,6 +237,32 @@ class TestJSON(TestCase):
         with self.subTest("Deserialize JSON string -> dataclass"):
             self.assertEqual(obj, JSONStrSerializer.deserialize(Person, serialized_obj))
 
+    def test_json_intern_keys(self):
+        JSONSerializer.intern_keys = True
+
+        try:
+            dct = JSONSerializer.deserialize(Dict[str, int], json.loads('{"status_code": 1}'))
+
+            self.assertEqual({'status_code': 1}, dct)
+            self.assertIs(sys.intern('status_code'), next(iter(dct)))
+        finally:
+            JSONSerializer.intern_keys = False
+
+    def test_json_str_payload_cache(self):
+        @dataclass(frozen=True)
+        class Currency:
+            code: str
+
+        JSONStrSerializer.payload_cache = PayloadCache()
+
+        try:
+            obj = JSONStrSerializer.deserialize(Currency, '{"code": "GBP"}')
+
+            self.assertEqual(Currency("GBP"), obj)
+            self.assertIs(obj, JSONStrSerializer.deserialize(Currency, '{"code": "GBP"}'))
+        finally:
+            JSONStrSerializer.payload_cache = None
+
     def test_json_str_serializer_mixin(self):
         @dataclass
         class Artist(JSONStrSerializerMixin):
@@ -98,3 +276,111 @@ class TestJSON(TestCase):
 
         with self.subTest("Deserialize JSON string -> dataclass with from_json_str mixin"):
             self.assertEqual(obj, Artist.from_json_str(serialized_obj))
+
+    def test_json_async_serialization(self):
+        obj = [Song(Person("Fred")), {'abc123': [Person("Jane"), 1, None]}, {1: "a"}, "Hello, world"] * 100
+        serialized_obj = json.dumps(JSONSerializer.serialize(obj))
+
+        async def serialize(**kwargs):
+            return [chunk async for chunk in aserialize_chunks(obj, **kwargs)]
+
+        with self.subTest("Serialize object -> JSON string chunks"):
+            chunks = run_async(serialize(chunk_size=100))
+
+            self.assertGreater(len(chunks), 1)
+            self.assertEqual(serialized_obj, ''.join(chunks))
+
+        with self.subTest("Serialize object -> single JSON string chunk"):
+            self.assertEqual([serialized_obj], run_async(serialize(chunk_size=len(serialized_obj) + 1)))
+
+        with self.subTest("Yield control to event loop while serializing"):
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            async def serialize_while_ticking():
+                ticker = asyncio.ensure_future(tick())
+                await serialize(yield_every=10)
+                ticker.cancel()
+
+            run_async(serialize_while_ticking())
+
+            self.assertGreater(len(ticks), 10)
+
+    def test_json_async_deserialization(self):
+        obj = [Song(Person("Fred"))] * 100
+        serialized_obj = json.dumps(JSONSerializer.serialize(obj)).encode()
+        chunks = [serialized_obj[i:i + 7] for i in range(0, len(serialized_obj), 7)]
+
+        with self.subTest("Deserialize JSON bytes chunks -> list of dataclasses"):
+            self.assertEqual(obj, run_async(adeserialize(List[Song], async_iter(chunks), yield_every=10)))
+
+        with self.subTest("Deserialize JSON string chunks -> dataclass"):
+            self.assertEqual(Person("Fred"), run_async(adeserialize(Person, async_iter(['{"name"', ': "Fred"}']))))
+
+        with self.subTest("Deserialize JSON chunks splitting numbers -> list"):
+            self.assertEqual([1, 22, -333], run_async(adeserialize(List[int], async_iter(list("[1, 22, -333]")))))
+
+        with self.subTest("Deserialize empty JSON array"):
+            self.assertEqual([], run_async(adeserialize(List[int], async_iter([" [ ", "] "]))))
+
+        for invalid_chunks in [[], ["[1,", "]"], ["[1", " 2]"], ["[1]", "]"], ['{"name": ']]:
+            with self.subTest("Fail invalid JSON", chunks=invalid_chunks), self.assertRaises(ValueError):
+                run_async(adeserialize(List[int], async_iter(invalid_chunks)))
+
+        with self.subTest("Deserialize nested lists, yielding to the event loop"):
+            playlist = Playlist([Song(Person("Fred"))] * 100, Playlist([Song(Person("Jane"))] * 100))
+            serialized_playlist = json.dumps(JSONSerializer.serialize(playlist))
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            async def deserialize_while_ticking():
+                ticker = asyncio.ensure_future(tick())
+                deserialized_playlist = await adeserialize(Playlist, async_iter([serialized_playlist]), yield_every=10)
+                ticker.cancel()
+
+                return deserialized_playlist
+
+            self.assertEqual(playlist, run_async(deserialize_while_ticking()))
+            self.assertGreater(len(ticks), 10)
+
+    def test_json_incremental_parser(self):
+        parser = IncrementalJSONParser()
+
+        with self.subTest("Parse top-level array items once fed in full"):
+            parser.feed('[{"name": "Fred"}, {"na')
+
+            self.assertEqual(1, parser.parse())
+            self.assertEqual([{"name": "Fred"}], parser.items)
+
+        with self.subTest("Parse up to a limit of items"):
+            parser.feed('me": "Jane"}, 1, 2')
+
+            self.assertEqual(1, parser.parse(limit=1))
+            self.assertEqual(1, parser.parse())
+
+        with self.subTest("Parse numbers once followed by a delimiter"):
+            parser.feed('3')
+
+            self.assertEqual(0, parser.parse())
+
+            parser.feed(']')
+
+            self.assertEqual([{"name": "Fred"}, {"name": "Jane"}, 1, 23], parser.close())
+
+        with self.subTest("Parse other values once fed in full"):
+            parser = IncrementalJSONParser()
+            parser.feed('{"name": ')
+
+            self.assertEqual(0, parser.parse())
+
+            parser.feed('"Fred"}')
+
+            self.assertEqual({"name": "Fred"}, parser.close())
@@ -0,0 +1,253 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
+from os import environ
+from tempfile import TemporaryFile
+from typing import Union, Dict, List, Optional, Tuple, Set, FrozenSet
+from unittest import TestCase, skipIf
+
+from dataclasses_serialization.serializer_base import DeserializationError
+
+try:
+    import msgpack
+
+    msgpack_installed = True
+except ImportError:
+    msgpack_installed = False
+
+try:
+    from dataclasses_serialization.msgpack import MsgPackSerializer, MsgPackSerializerMixin, MsgPackDirtyTrackingMixin, MsgPackStrSerializer, MsgPackStrSerializerMixin, iter_deserialize
+except ImportError:
+    MsgPackSerializer, MsgPackSerializerMixin, MsgPackDirtyTrackingMixin, MsgPackStrSerializer, MsgPackStrSerializerMixin, iter_deserialize = [None] * 6
+
+try:
+    import numpy
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+if 'OPTIONAL_MODULES' in environ:
+    numpy_installed = 'numpy' in environ['OPTIONAL_MODULES']
+    msgpack_installed = 'msgpack' in environ['OPTIONAL_MODULES']
+
+
+@dataclass
+class Person:
+    name: str
+
+
+@dataclass
+class Song:
+    artist: Person
+
+
+@dataclass
+class Playlist:
+    songs: List[Song]
+    next: Optional['Playlist'] = None
+
+
+@skipIf(not msgpack_installed, "MessagePack not installed")
+class TestMsgPack(TestCase):
+    def test_msgpack_serialization_basic(self):
+        obj = Person("Fred")
+        serialized_obj = {'name': "Fred"}
+
+        with self.subTest("Serialize dataclass -> MessagePack"):
+            self.assertEqual(serialized_obj, MsgPackSerializer.serialize(obj))
+
+        with self.subTest("Deserialize MessagePack -> dataclass"):
+            self.assertEqual(obj, MsgPackSerializer.deserialize(Person, serialized_obj))
+
+    def test_msgpack_serialization_types(self):
+        test_cases = [
+            (int, 1, 1),
+            (float, 1.0, 1.0),
+            (str, "Fred", "Fred"),
+            (bytes, b'Hello, world', b'Hello, world'),
+            (bool, True, True),
+            (dict, {'name': "Fred"}, {'name': "Fred"}),
+            (Dict[int, Person], {1: Person("Fred")}, {1: {'name': "Fred"}}),
+            (list, [{'name': "Fred"}], [{'name': "Fred"}]),
+            (List[Person], [Person("Fred")], [{'name': "Fred"}]),
+            (Tuple[int, ...], (1, 2), [1, 2]),
+            (Tuple[str, Person], ("Fred", Person("Fred")), ["Fred", {'name': "Fred"}]),
+            (Set[str], {"Fred"}, ["Fred"]),
+            (FrozenSet[int], frozenset({1}), [1]),
+            (Union[int, Person], 1, 1),
+            (Union[int, Person], Person("Fred"), {'name': "Fred"}),
+            (type(None), None, None)
+        ]
+
+        for type_, obj, serialized_obj in test_cases:
+            with self.subTest("Serialize object", obj=obj):
+                self.assertEqual(serialized_obj, MsgPackSerializer.serialize(obj))
+
+            with self.subTest("Deserialize object", obj=obj):
+                self.assertEqual(obj, MsgPackSerializer.deserialize(type_, serialized_obj))
+
+    def test_msgpack_bytes_like_serialization(self):
+        @dataclass
+        class Blob:
+            data: memoryview
+            buffer: bytearray
+
+        data = b'Hello, world'
+        obj = Blob(memoryview(data), bytearray(b'Lorem ipsum'))
+
+        with self.subTest("Serialize bytes-like dataclass -> MessagePack binary"):
+            self.assertEqual(b'\x82\xa4data\xc4\x0cHello, world\xa6buffer\xc4\x0bLorem ipsum', MsgPackStrSerializer.serialize(obj))
+
+        with self.subTest("Deserialize MessagePack binary -> bytes-like dataclass"):
+            deserialized_obj = MsgPackStrSerializer.deserialize(Blob, MsgPackStrSerializer.serialize(obj))
+
+            self.assertIsInstance(deserialized_obj.data, memoryview)
+            self.assertIsInstance(deserialized_obj.buffer, bytearray)
+            self.assertEqual(obj, deserialized_obj)
+
+        with self.subTest("Fail deserialize non-bytes -> memoryview"), self.assertRaises(DeserializationError):
+            MsgPackSerializer.deserialize(memoryview, "Hello, world")
+
+    def test_msgpack_datetime_serialization(self):
+        obj = datetime(2000, 1, 1, 12, 30, 15, 500, tzinfo=timezone.utc)
+
+        with self.subTest("Serialize datetime -> MessagePack timestamp"):
+            self.assertEqual(msgpack.Timestamp.from_datetime(obj), MsgPackSerializer.serialize(obj))
+
+        with self.subTest("Serialize naive datetime as UTC"):
+            self.assertEqual(msgpack.Timestamp.from_datetime(obj), MsgPackSerializer.serialize(obj.replace(tzinfo=None)))
+
+        with self.subTest("Deserialize MessagePack timestamp -> naive datetime in UTC"):
+            self.assertEqual(obj.replace(tzinfo=None), MsgPackSerializer.deserialize(datetime, msgpack.Timestamp.from_datetime(obj)))
+
+        with self.subTest("Round trip naive datetime through MessagePack string"):
+            naive_obj = obj.replace(tzinfo=None)
+
+            self.assertEqual(naive_obj, MsgPackStrSerializer.deserialize(datetime, MsgPackStrSerializer.serialize(naive_obj)))
+
+        with self.subTest("Fail deserialize non-timestamp -> datetime"), self.assertRaises(DeserializationError):
+            MsgPackSerializer.deserialize(datetime, "2000-01-01")
+
+    def test_msgpack_ndarray_serialization(self):
+        if not numpy_installed:
+            self.skipTest("NumPy not installed")
+
+        @dataclass
+        class Features:
+            values: numpy.ndarray
+
+        obj = Features(numpy.array([[1, 2], [3, 4]], dtype='<i2'))
+        serialized_obj = {'values': {'dtype': '<i2', 'shape': [2, 2], 'data': b'\x01\x00\x02\x00\x03\x00\x04\x00'}}
+
+        with self.subTest("Serialize ndarray dataclass -> MessagePack"):
+            self.assertEqual(serialized_obj, MsgPackSerializer.serialize(obj))
+
+        with self.subTest("Deserialize MessagePack -> ndarray dataclass"):
+            deserialized_obj = MsgPackSerializer.deserialize(Features, serialized_obj)
+
+            self.assertEqual(obj.values.dtype, deserialized_obj.values.dtype)
+            self.assertTrue(numpy.array_equal(obj.values, deserialized_obj.values))
+
+    def test_msgpack_iterative_serialization(self):
+        MsgPackSerializer.iterative = True
+        self.addCleanup(setattr, MsgPackSerializer, 'iterative', False)
+
+        obj = None
+
+        for _ in range(5000):
+            obj = Playlist([Song(Person("Fred"))], obj)
+
+        deserialized_obj = MsgPackSerializer.deserialize(Playlist, MsgPackSerializer.serialize(obj))
+
+        for _ in range(5000):
+            self.assertEqual([Song(Person("Fred"))], deserialized_obj.songs)
+            deserialized_obj = deserialized_obj.next
+
+        self.assertIsNone(deserialized_obj)
+
+    def test_msgpack_serializer_mixin(self):
+        @dataclass
+        class Artist(MsgPackSerializerMixin):
+            name: str
+
+        obj = Artist("Fred")
+        serialized_obj = {'name': "Fred"}
+
+        with self.subTest("Serialize dataclass -> MessagePack with as_msgpack mixin"):
+            self.assertEqual(serialized_obj, obj.as_msgpack())
+
+        with self.subTest("Deserialize MessagePack -> dataclass with from_msgpack mixin"):
+            self.assertEqual(obj, Artist.from_msgpack(serialized_obj))
+
+    def test_msgpack_dirty_tracking_mixin(self):
+        @dataclass
+        class Artist(MsgPackDirtyTrackingMixin):
+            name: str
+            age: int
+
+        obj = Artist("Fred", 30)
+
+        self.assertEqual({'name': "Fred", 'age': 30}, obj.as_msgpack())
+
+        obj.age = 31
+
+        self.assertEqual({'age': 31}, obj.msgpack_changes())
+
+    def test_msgpack_str_serialization(self):
+        obj = Person("Fred")
+        serialized_obj = b'\x81\xa4name\xa4Fred'
+
+        with self.subTest("Serialize dataclass -> MessagePack string"):
+            self.assertEqual(serialized_obj, MsgPackStrSerializer.serialize(obj))
+
+        with self.subTest("Deserialize MessagePack string -> dataclass"):
+            self.assertEqual(obj, MsgPackStrSerializer.deserialize(Person, serialized_obj))
+
+    def test_msgpack_iter_deserialize(self):
+        objs = [Person("Fred"), Person("Jane"), Person("Bob")]
+        serialized_objs = b''.join(map(MsgPackStrSerializer.serialize, objs))
+
+        with self.subTest("Deserialize MessagePack file -> dataclasses"):
+            self.assertEqual(objs, list(iter_deserialize(Person, BytesIO(serialized_objs))))
+
+        with self.subTest("Deserialize MessagePack buffer -> dataclasses"):
+            self.assertEqual(objs, list(iter_deserialize(Person, serialized_objs)))
+
+        with self.subTest("Deserialize MessagePack mmap -> dataclasses"), TemporaryFile() as f:
+            f.write(serialized_objs)
+            f.flush()
+
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as buffer:
+                self.assertEqual(objs, list(iter_deserialize(Person, buffer)))
+
+        with self.subTest("Deserialize empty MessagePack file"):
+            self.assertEqual([], list(iter_deserialize(Person, BytesIO(b''))))
+
+        with self.subTest("Fail truncated MessagePack file"), self.assertRaises(DeserializationError):
+            list(iter_deserialize(Person, BytesIO(serialized_objs[:-1])))
+
+        with self.subTest("Fail invalid MessagePack buffer"), self.assertRaises(DeserializationError):
+            list(iter_deserialize(Person, b'\xc1'))
+
+    def test_msgpack_str_serializer_mixin(self):
+        @dataclass
+        class Artist(MsgPackStrSerializerMixin):
+            name: str
+
+        obj = Artist("Fred")
+        serialized_obj = b'\x81\xa4name\xa4Fred'
+
+        with self.subTest("Serialize dataclass -> MessagePack string with as_msgpack_str mixin"):
+            self.assertEqual(serialized_obj, obj.as_msgpack_str())
+
+        with self.subTest("Deserialize MessagePack string -> dataclass with from_msgpack_str mixin"):
+            self.assertEqual(obj, Artist.from_msgpack_str(serialized_obj))
+
+
+@skipIf(msgpack_installed, "MessagePack installed")
+class TestMsgPackNotInstalled(TestCase):
+    def test_msgpack_raises_import_error(self):
+        with self.assertRaises(ImportError):
+            import dataclasses_serialization.msgpack